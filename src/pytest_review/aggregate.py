@@ -0,0 +1,62 @@
+"""Issue counts shared by the scoring engine and the reporters."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from pytest_review.analyzers.base import AnalyzerResult, Severity
+
+
+@dataclass
+class ResultsAggregate:
+    """Issue counts for a set of analyzer results, gathered in one pass."""
+
+    error_count: int = 0
+    warning_count: int = 0
+    info_count: int = 0
+    # Issues per rule, in order of first occurrence
+    by_rule: dict[str, int] = field(default_factory=dict)
+    # Issues per severity for each analyzer, in order of first occurrence
+    by_analyzer: dict[str, dict[Severity, int]] = field(default_factory=dict)
+
+    @property
+    def total_issues(self) -> int:
+        """Total number of issues."""
+        return self.error_count + self.warning_count + self.info_count
+
+    @property
+    def by_severity(self) -> dict[str, int]:
+        """Issues per severity, keyed by severity value."""
+        return {
+            "error": self.error_count,
+            "warning": self.warning_count,
+            "info": self.info_count,
+        }
+
+
+def aggregate(results: Iterable[AnalyzerResult]) -> ResultsAggregate:
+    """Count the issues of some results by severity, rule and analyzer."""
+    by_rule: defaultdict[str, int] = defaultdict(int)
+    by_analyzer: dict[str, dict[Severity, int]] = {}
+    for result in results:
+        counts = by_analyzer.get(result.analyzer_name)
+        if counts is None:
+            counts = by_analyzer[result.analyzer_name] = dict.fromkeys(Severity, 0)
+        for issue in result.issues:
+            counts[issue.severity] += 1
+            by_rule[issue.rule] += 1
+
+    totals = dict.fromkeys(Severity, 0)
+    for counts in by_analyzer.values():
+        for severity, count in counts.items():
+            totals[severity] += count
+
+    return ResultsAggregate(
+        error_count=totals[Severity.ERROR],
+        warning_count=totals[Severity.WARNING],
+        info_count=totals[Severity.INFO],
+        by_rule=dict(by_rule),
+        by_analyzer=by_analyzer,
+    )
@@ -4,11 +4,16 @@ from pytest_review.analyzers.assertions import AssertionsAnalyzer
 from pytest_review.analyzers.base import (
     Analyzer,
     AnalyzerResult,
+    CompositeVisitor,
     DynamicAnalyzer,
     Issue,
+    NodeHandler,
     Severity,
     StaticAnalyzer,
     TestItemInfo,
+    analyze_files,
+    analyze_test,
+    clear_result_cache,
 )
 from pytest_review.analyzers.complexity import ComplexityAnalyzer
 from pytest_review.analyzers.isolation import IsolationStaticAnalyzer
@@ -22,14 +27,19 @@ __all__ = [
     "AnalyzerResult",
     "AssertionsAnalyzer",
     "ComplexityAnalyzer",
+    "CompositeVisitor",
     "DynamicAnalyzer",
     "Issue",
     "IsolationStaticAnalyzer",
     "NamingAnalyzer",
+    "NodeHandler",
     "PatternsAnalyzer",
     "PerformanceAnalyzer",
     "Severity",
     "SmellsAnalyzer",
     "StaticAnalyzer",
     "TestItemInfo",
+    "analyze_files",
+    "analyze_test",
+    "clear_result_cache",
 ]
@@ -0,0 +1,126 @@
+"""Single-pass AST walk shared by the static analyzers.
+
+Analyzers register callbacks per node type on a ``CompositeVisitor``, so a
+test is traversed once however many analyzers look at it.
+"""
+
+from __future__ import annotations
+
+import ast
+from collections.abc import Mapping
+from typing import Any, Callable
+
+NodeCallback = Callable[[Any], None]
+
+# Node types that never have child nodes: expression contexts, operators
+# and a few simple leaves
+_CONTEXT_TYPES: frozenset[type[ast.AST]] = frozenset({ast.Load, ast.Store, ast.Del})
+_CHILDLESS_TYPES: frozenset[type[ast.AST]] = frozenset(
+    {
+        ast.Constant,
+        ast.Pass,
+        ast.Break,
+        ast.Continue,
+        ast.Global,
+        ast.Nonlocal,
+        ast.alias,
+        *_CONTEXT_TYPES,
+        *ast.operator.__subclasses__(),
+        *ast.boolop.__subclasses__(),
+        *ast.cmpop.__subclasses__(),
+        *ast.unaryop.__subclasses__(),
+    }
+)
+
+
+class CompositeVisitor(ast.NodeVisitor):
+    """AST visitor that walks a tree once, dispatching nodes to registered handlers.
+
+    Handlers registered with ``leave=True`` run after the node's children have
+    been visited, so handlers can track nesting without walking the tree
+    themselves.
+    """
+
+    def __init__(self, handlers: Mapping[type[ast.AST], list[NodeCallback]] | None = None) -> None:
+        self.handlers: dict[type[ast.AST], list[NodeCallback]] = {
+            node_type: list(callbacks) for node_type, callbacks in (handlers or {}).items()
+        }
+        self.leave_handlers: dict[type[ast.AST], list[NodeCallback]] = {}
+
+    def register(
+        self, node_type: type[ast.AST], handler: NodeCallback, leave: bool = False
+    ) -> None:
+        """Register a handler for a node type."""
+        table = self.leave_handlers if leave else self.handlers
+        table.setdefault(node_type, []).append(handler)
+
+    def visit(self, node: ast.AST) -> None:
+        # Iterative pre-order walk; a (node, True) entry marks where the
+        # node's leave handlers run once all of its children are done
+        handlers = self.handlers
+        leave_handlers = self.leave_handlers
+        # Childless nodes nobody handles are never pushed, and names (whose
+        # only child is their context) are not expanded unless contexts are
+        # handled
+        prune = _CHILDLESS_TYPES.difference(handlers, leave_handlers)
+        leaves = (
+            _CHILDLESS_TYPES | {ast.Name} if _CONTEXT_TYPES.issubset(prune) else _CHILDLESS_TYPES
+        )
+        stack: list[tuple[ast.AST, bool]] = [(node, False)]
+        while stack:
+            current, leaving = stack.pop()
+            node_type = type(current)
+            if leaving:
+                for handler in leave_handlers.get(node_type, ()):
+                    handler(current)
+                continue
+            for handler in handlers.get(node_type, ()):
+                handler(current)
+            if node_type in leave_handlers:
+                stack.append((current, True))
+            # An unannotated argument has nothing below it
+            if node_type in leaves or (isinstance(current, ast.arg) and current.annotation is None):
+                continue
+            children = [
+                (child, False)
+                for child in ast.iter_child_nodes(current)
+                if type(child) not in prune
+            ]
+            children.reverse()
+            stack.extend(children)
+
+
+class NodeHandler:
+    """Base class for node handlers driven by a CompositeVisitor.
+
+    ``visit_<NodeType>`` methods run when a node is entered and
+    ``leave_<NodeType>`` methods once its children have been visited.
+    Handlers never recurse into children; the composite does the walking.
+    The methods are resolved once per subclass, not on every registration.
+    """
+
+    # (node type, method name, is leave handler) for each handler method
+    _handler_methods: tuple[tuple[type[ast.AST], str, bool], ...] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        methods: list[tuple[type[ast.AST], str, bool]] = []
+        for attr in dir(cls):
+            prefix, _, type_name = attr.partition("_")
+            if prefix not in ("visit", "leave") or not type_name:
+                continue
+            node_type = getattr(ast, type_name, None)
+            if isinstance(node_type, type) and issubclass(node_type, ast.AST):
+                methods.append((node_type, attr, prefix == "leave"))
+        cls._handler_methods = tuple(methods)
+
+    def register(self, visitor: CompositeVisitor) -> None:
+        """Register this handler's visit/leave methods on a composite visitor."""
+        for node_type, attr, leave in self._handler_methods:
+            visitor.register(node_type, getattr(self, attr), leave=leave)
+
+    def visit(self, node: ast.AST) -> None:
+        """Walk a tree with only this handler registered."""
+        visitor = CompositeVisitor()
+        self.register(visitor)
+        visitor.visit(node)
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import ast
-from typing import TYPE_CHECKING
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Callable, Final
 
 from pytest_review.analyzers.base import (
     AnalyzerResult,
+    CompositeVisitor,
     Issue,
+    NodeHandler,
     Severity,
     StaticAnalyzer,
     TestItemInfo,
@@ -16,8 +19,40 @@ from pytest_review.analyzers.base import (
 if TYPE_CHECKING:
     from pytest_review.config import ReviewConfig
 
+RULE_MISSING: Final = "assertions.missing"
+RULE_INSUFFICIENT: Final = "assertions.insufficient"
+RULE_TRIVIAL: Final = "assertions.trivial"
 
-class AssertionVisitor(ast.NodeVisitor):
+# pytest helpers that count as assertions when called as pytest.<name>(...)
+_PYTEST_ASSERT_ATTRS = frozenset({"raises", "warns", "approx"})
+
+# Fields that identify a node; other node types are compared field by field
+_EQ_FIELDS: dict[type[ast.AST], tuple[str, ...]] = {
+    ast.Name: ("id",),
+    ast.Constant: ("value",),
+    ast.Attribute: ("attr", "value"),
+}
+
+
+def _ast_equal(a: object, b: object) -> bool:
+    """Check two AST values for structural equality, ignoring source positions."""
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, ast.AST):
+        fields = _EQ_FIELDS.get(type(a), a._fields)
+        return all(_ast_equal(getattr(a, name, None), getattr(b, name, None)) for name in fields)
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(map(_ast_equal, a, b))
+    return a == b
+
+
+@lru_cache(maxsize=64)
+def _format_insufficient(count: int, minimum: int) -> str:
+    """Render the insufficient-assertions message, shared by tests with equal counts."""
+    return f"Test has only {count} assertion(s), minimum is {minimum}"
+
+
+class AssertionVisitor(NodeHandler):
     """AST visitor that collects assertion information."""
 
     def __init__(self) -> None:
@@ -28,18 +63,15 @@ class AssertionVisitor(ast.NodeVisitor):
     def visit_Assert(self, node: ast.Assert) -> None:
         self.assertions.append(node)
         self._check_trivial(node)
-        self.generic_visit(node)
 
     def visit_Call(self, node: ast.Call) -> None:
-        # Check for pytest assertion helpers like pytest.raises, pytest.warns
-        if (
-            isinstance(node.func, ast.Attribute)
-            and isinstance(node.func.value, ast.Name)
-            and node.func.value.id == "pytest"
-            and node.func.attr in ("raises", "warns", "approx")
-        ):
-            self.pytest_assertions.append(node)
-        self.generic_visit(node)
+        # Check for pytest assertion helpers like pytest.raises, pytest.warns.
+        # AST node classes are never subclassed, so exact type checks suffice.
+        func = node.func
+        if type(func) is ast.Attribute and func.attr in _PYTEST_ASSERT_ATTRS:
+            value = func.value
+            if type(value) is ast.Name and value.id == "pytest":
+                self.pytest_assertions.append(node)
 
     def _check_trivial(self, node: ast.Assert) -> None:
         """Check if assertion is trivial (assert True, assert False, etc.)."""
@@ -58,12 +90,12 @@ class AssertionVisitor(ast.NodeVisitor):
 
         # assert x == x (tautology)
         elif (
-            isinstance(test, ast.Compare) and len(test.ops) == 1 and isinstance(test.ops[0], ast.Eq)
+            isinstance(test, ast.Compare)
+            and len(test.ops) == 1
+            and isinstance(test.ops[0], ast.Eq)
+            and _ast_equal(test.left, test.comparators[0])
         ):
-            left = ast.dump(test.left)
-            right = ast.dump(test.comparators[0])
-            if left == right:
-                self.trivial_assertions.append((node, "comparing value to itself"))
+            self.trivial_assertions.append((node, "comparing value to itself"))
 
     @property
     def total_assertions(self) -> int:
@@ -81,31 +113,43 @@ class AssertionsAnalyzer(StaticAnalyzer):
         min_assert_opt = self.get_option("min_assertions", 1)
         self._min_assertions = int(str(min_assert_opt)) if min_assert_opt is not None else 1
 
+    def register(
+        self, visitor: CompositeVisitor, test: TestItemInfo, result: AnalyzerResult
+    ) -> Callable[[], None]:
+        handler = AssertionVisitor()
+        handler.register(visitor)
+        return partial(self._report, handler, test, result)
+
     def _analyze_ast(self, test: TestItemInfo, result: AnalyzerResult) -> None:
-        visitor = AssertionVisitor()
-        visitor.visit(test.node)
+        self._walk(test, result)
 
+    def _report(
+        self, visitor: AssertionVisitor, test: TestItemInfo, result: AnalyzerResult
+    ) -> None:
+        """Report issues from the collected assertion information."""
         # Check for empty tests (no assertions)
         if visitor.total_assertions == 0:
-            result.add_issue(
-                Issue(
-                    rule="assertions.missing",
-                    message="Test has no assertions",
-                    severity=Severity.ERROR,
-                    file_path=test.file_path,
-                    line=test.line,
-                    test_name=test.name,
-                    suggestion="Add at least one assertion to verify expected behavior",
+            if self.is_rule_enabled(RULE_MISSING):
+                result.add_issue(
+                    Issue(
+                        rule=RULE_MISSING,
+                        message="Test has no assertions",
+                        severity=Severity.ERROR,
+                        file_path=test.file_path,
+                        line=test.line,
+                        test_name=test.name,
+                        suggestion="Add at least one assertion to verify expected behavior",
+                    )
                 )
-            )
 
         # Check for too few assertions
-        elif visitor.total_assertions < self._min_assertions:
+        elif visitor.total_assertions < self._min_assertions and self.is_rule_enabled(
+            RULE_INSUFFICIENT
+        ):
             result.add_issue(
                 Issue(
-                    rule="assertions.insufficient",
-                    message=f"Test has only {visitor.total_assertions} assertion(s), "
-                    f"minimum is {self._min_assertions}",
+                    rule=RULE_INSUFFICIENT,
+                    message=_format_insufficient(visitor.total_assertions, self._min_assertions),
                     severity=Severity.WARNING,
                     file_path=test.file_path,
                     line=test.line,
@@ -114,18 +158,19 @@ class AssertionsAnalyzer(StaticAnalyzer):
             )
 
         # Check for trivial assertions
-        for assert_node, reason in visitor.trivial_assertions:
-            result.add_issue(
-                Issue(
-                    rule="assertions.trivial",
-                    message=f"Trivial assertion: {reason}",
-                    severity=Severity.ERROR,
-                    file_path=test.file_path,
-                    line=assert_node.lineno,
-                    test_name=test.name,
-                    suggestion="Replace with a meaningful assertion that tests actual behavior",
+        if self.is_rule_enabled(RULE_TRIVIAL):
+            for assert_node, reason in visitor.trivial_assertions:
+                result.add_issue(
+                    Issue(
+                        rule=RULE_TRIVIAL,
+                        message=f"Trivial assertion: {reason}",
+                        severity=Severity.ERROR,
+                        file_path=test.file_path,
+                        line=assert_node.lineno,
+                        test_name=test.name,
+                        suggestion="Replace with a meaningful assertion that tests actual behavior",
+                    )
                 )
-            )
 
         # Store metadata
         result.metadata["assertion_count"] = visitor.total_assertions
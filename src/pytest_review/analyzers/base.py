@@ -3,15 +3,63 @@
 from __future__ import annotations
 
 import ast
+import hashlib
+import os
+import pickle
+import sys
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field, replace
 from enum import Enum
+from functools import partial
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
+
+# Re-exported: analyzers and tests import the walk machinery from here
+from pytest_review.analyzers._composite import CompositeVisitor as CompositeVisitor
+from pytest_review.analyzers._composite import NodeCallback as NodeCallback
+from pytest_review.analyzers._composite import NodeHandler as NodeHandler
 
 if TYPE_CHECKING:
     from pytest_review.config import ReviewConfig
 
+_T = TypeVar("_T")
+
+# Runtime isinstance() target for test function nodes
+FUNCTION_TYPES: tuple[type[ast.FunctionDef], type[ast.AsyncFunctionDef]] = (
+    ast.FunctionDef,
+    ast.AsyncFunctionDef,
+)
+
+# Drop per-instance __dict__ on the frequently created dataclasses where supported
+DATACLASS_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Below this many tests, process pool startup costs more than it saves
+PARALLEL_THRESHOLD = 50
+
+# Most recently analyzed tests whose static results are kept in memory
+RESULT_CACHE_SIZE = 4096
+_result_cache: OrderedDict[tuple[Any, ...], list[AnalyzerResult]] = OrderedDict()
+
+
+def structure_key(node: Any) -> Any:
+    """Build a hashable key for an AST, equal for structurally equal trees.
+
+    Like ``ast.dump`` it ignores positions, but it builds nested tuples
+    instead of formatting a string. Non-string leaves are paired with their
+    type so that ``1``, ``1.0`` and ``True`` stay distinct, as in the dump.
+    """
+    if isinstance(node, ast.AST):
+        return (type(node), *[structure_key(getattr(node, name, None)) for name in node._fields])
+    if type(node) is list:
+        return tuple([structure_key(item) for item in node])
+    if type(node) is str:
+        return node
+    return (type(node), node)
+
 
 class Severity(Enum):
     """Severity levels for issues."""
@@ -23,11 +71,15 @@ class Severity(Enum):
     def __lt__(self, other: object) -> bool:
         if not isinstance(other, Severity):
             return NotImplemented
-        order = [Severity.INFO, Severity.WARNING, Severity.ERROR]
-        return order.index(self) < order.index(other)
+        return SEVERITY_RANK[self] < SEVERITY_RANK[other]
+
+
+# Rank of each severity, lowest first. Sort keys should use the rank: it
+# compares as a plain int instead of through Severity.__lt__
+SEVERITY_RANK = {Severity.INFO: 0, Severity.WARNING: 1, Severity.ERROR: 2}
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Issue:
     """A quality issue found by an analyzer."""
 
@@ -50,12 +102,14 @@ class Issue:
         return f"{location}{test}{self.message}"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AnalyzerResult:
     """Result from running an analyzer."""
 
     analyzer_name: str
-    issues: list[Issue] = field(default_factory=list)
+    # Most results have no issues, so they share an empty tuple until
+    # add_issue first swaps in a list
+    issues: Sequence[Issue] = ()
     score: float = 100.0
     metadata: dict[str, object] = field(default_factory=dict)
 
@@ -76,10 +130,13 @@ class AnalyzerResult:
 
     def add_issue(self, issue: Issue) -> None:
         """Add an issue to the result."""
-        self.issues.append(issue)
+        if isinstance(self.issues, list):
+            self.issues.append(issue)
+        else:
+            self.issues = [*self.issues, issue]
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TestItemInfo:
     """Information about a test function for analysis."""
 
@@ -91,6 +148,11 @@ class TestItemInfo:
     node: ast.FunctionDef | ast.AsyncFunctionDef
     source: str
     class_name: str | None = None
+    # Parsed module the test came from, shared by every test in the file
+    module: ast.Module | None = field(default=None, repr=False, compare=False)
+    # Structure keys of assert expressions, keyed by (lineno, col_offset)
+    # rather than id() so entries stay valid when the item is pickled
+    assert_keys: dict[tuple[int, int], Any] = field(default_factory=dict, repr=False, compare=False)
 
     @property
     def full_name(self) -> str:
@@ -99,6 +161,18 @@ class TestItemInfo:
             return f"{self.class_name}::{self.name}"
         return self.name
 
+    def assert_key(self, node: ast.Assert) -> Any:
+        """Get the structure key of an assertion's test expression, built once per node.
+
+        Keys are compared by equality, not just by hash, so structurally
+        different expressions never match even if their hashes collide.
+        """
+        position = (node.lineno, node.col_offset)
+        key = self.assert_keys.get(position)
+        if key is None:
+            key = self.assert_keys[position] = structure_key(node.test)
+        return key
+
 
 class Analyzer(ABC):
     """Base class for test quality analyzers."""
@@ -109,6 +183,13 @@ class Analyzer(ABC):
     def __init__(self, config: ReviewConfig) -> None:
         self.config = config
         self._analyzer_config = config.get_analyzer_config(self.name)
+        self._ignored_rules = frozenset(config.ignore_rules)
+        # Identifies the analyzer and the settings its results depend on
+        self.cache_key = (
+            f"{type(self).__module__}.{type(self).__qualname__}",
+            repr(sorted(self._analyzer_config.options.items())),
+            tuple(sorted(self._ignored_rules)),
+        )
 
     @property
     def enabled(self) -> bool:
@@ -119,6 +200,10 @@ class Analyzer(ABC):
         """Get a configuration option for this analyzer."""
         return self._analyzer_config.options.get(name, default)
 
+    def is_rule_enabled(self, rule: str) -> bool:
+        """Check if a rule is enabled, so issues for ignored rules are never built."""
+        return rule not in self._ignored_rules
+
     @abstractmethod
     def analyze(self, test: TestItemInfo) -> AnalyzerResult:
         """Analyze a single test and return results."""
@@ -132,18 +217,175 @@ class Analyzer(ABC):
 class StaticAnalyzer(Analyzer):
     """Base class for static (AST-based) analyzers."""
 
+    parallel_threshold: int = PARALLEL_THRESHOLD
+
     def analyze(self, test: TestItemInfo) -> AnalyzerResult:
         """Analyze a test using AST."""
         result = AnalyzerResult(analyzer_name=self.name)
         self._analyze_ast(test, result)
         return result
 
+    def register(
+        self, visitor: CompositeVisitor, test: TestItemInfo, result: AnalyzerResult
+    ) -> Callable[[], None]:
+        """Register node handlers for a test on a shared visitor.
+
+        Returns a callback to run once the walk has finished. The default
+        registers nothing and runs ``_analyze_ast`` from the callback, so
+        analyzers that do not use handlers work unchanged.
+        """
+        return partial(self._analyze_ast, test, result)
+
+    def analyze_all(self, tests: list[TestItemInfo]) -> list[AnalyzerResult]:
+        """Analyze multiple tests, spreading large batches over worker processes.
+
+        Static analysis is pure-Python and CPU-bound, so batches above
+        ``parallel_threshold`` are mapped over a process pool. If the pool
+        cannot be used (no multiprocessing support, unpicklable analyzer),
+        the tests are analyzed serially instead; errors raised by the analysis
+        itself propagate.
+        """
+        if len(tests) > self.parallel_threshold:
+            results = _map_in_pool(self.analyze, [_detach_module(test) for test in tests], [self])
+            if results is not None:
+                return results
+        return super().analyze_all(tests)
+
+    def _walk(self, test: TestItemInfo, result: AnalyzerResult) -> None:
+        """Walk a test with only this analyzer's handlers registered."""
+        visitor = CompositeVisitor()
+        finish = self.register(visitor, test, result)
+        visitor.visit(test.node)
+        finish()
+
     @abstractmethod
     def _analyze_ast(self, test: TestItemInfo, result: AnalyzerResult) -> None:
         """Perform AST-based analysis. Subclasses implement this."""
         ...
 
 
+def _result_key(analyzers: Sequence[StaticAnalyzer], test: TestItemInfo) -> tuple[Any, ...]:
+    """Key the results of a test by everything they depend on.
+
+    The source segment and the start position fix every line number inside
+    the test. Decorators sit outside the segment, so they are keyed by their
+    dump, positions included.
+    """
+    node = test.node
+    return (
+        tuple(analyzer.cache_key for analyzer in analyzers),
+        test.name,
+        test.class_name,
+        str(test.file_path),
+        test.line,
+        node.col_offset,
+        hashlib.blake2b(test.source.encode(), digest_size=16).digest(),
+        tuple(ast.dump(decorator, include_attributes=True) for decorator in node.decorator_list),
+    )
+
+
+def _copy_result(result: AnalyzerResult) -> AnalyzerResult:
+    """Copy a result so cached results are never changed through the returned ones."""
+    return replace(result, issues=list(result.issues), metadata=dict(result.metadata))
+
+
+def clear_result_cache() -> None:
+    """Forget the static results of previously analyzed tests."""
+    _result_cache.clear()
+
+
+def analyze_test(analyzers: Sequence[StaticAnalyzer], test: TestItemInfo) -> list[AnalyzerResult]:
+    """Run several static analyzers over a test with a single AST walk.
+
+    Returns one result per analyzer, in the order the analyzers were given.
+    Results are remembered for the life of the process, so a test analyzed
+    again unchanged (watch mode, repeated in-process sessions) is not walked.
+    """
+    key = _result_key(analyzers, test) if test.source else None
+    if key is not None:
+        cached = _result_cache.get(key)
+        if cached is not None:
+            _result_cache.move_to_end(key)
+            return [_copy_result(result) for result in cached]
+
+    visitor = CompositeVisitor()
+    results: list[AnalyzerResult] = []
+    finishers: list[Callable[[], None]] = []
+    for analyzer in analyzers:
+        result = AnalyzerResult(analyzer_name=analyzer.name)
+        finishers.append(analyzer.register(visitor, test, result))
+        results.append(result)
+
+    if visitor.handlers or visitor.leave_handlers:
+        visitor.visit(test.node)
+    for finish in finishers:
+        finish()
+
+    if key is not None:
+        _result_cache[key] = [_copy_result(result) for result in results]
+        if len(_result_cache) > RESULT_CACHE_SIZE:
+            _result_cache.popitem(last=False)
+    return results
+
+
+def _detach_module(test: TestItemInfo) -> TestItemInfo:
+    """Drop the module AST from a test, so a copy isn't shipped with every task."""
+    return test if test.module is None else replace(test, module=None)
+
+
+def _map_in_pool(
+    func: Callable[[Any], _T], items: list[Any], analyzers: Sequence[StaticAnalyzer]
+) -> list[_T] | None:
+    """Map a function over items on a process pool.
+
+    Returns None if the pool cannot be used: a single CPU, analyzers that
+    cannot be pickled, or no support for worker processes. Errors raised by
+    ``func`` itself propagate.
+    """
+    workers = os.cpu_count() or 1
+    if workers < 2:
+        return None
+    try:
+        pickle.dumps(analyzers, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        # Unpicklable analyzer (a lambda, a lock, a local class, ...)
+        return None
+    chunksize = max(1, len(items) // (4 * workers))
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(func, items, chunksize=chunksize))
+    except (OSError, NotImplementedError, BrokenProcessPool):
+        return None
+
+
+def _analyze_group(
+    analyzers: Sequence[StaticAnalyzer], tests: list[TestItemInfo]
+) -> list[list[AnalyzerResult]]:
+    """Analyze the tests of one file, in a worker process or this one."""
+    return [analyze_test(analyzers, test) for test in tests]
+
+
+def analyze_files(
+    analyzers: Sequence[StaticAnalyzer],
+    groups: Sequence[list[TestItemInfo]],
+    parallel_threshold: int = PARALLEL_THRESHOLD,
+) -> list[list[list[AnalyzerResult]]]:
+    """Run static analyzers over groups of tests, one group per file.
+
+    Returns the results of each test, grouped like the tests were. When
+    there are more than ``parallel_threshold`` tests in several files, the
+    files are spread over a process pool; if the pool cannot be used, the
+    tests are analyzed in this process instead.
+    """
+    total = sum(len(group) for group in groups)
+    if total > parallel_threshold and len(groups) > 1:
+        payload = [[_detach_module(test) for test in group] for group in groups]
+        results = _map_in_pool(partial(_analyze_group, analyzers), payload, analyzers)
+        if results is not None:
+            return results
+    return [_analyze_group(analyzers, group) for group in groups]
+
+
 class DynamicAnalyzer(Analyzer):
     """Base class for dynamic (runtime) analyzers."""
 
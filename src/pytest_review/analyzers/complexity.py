@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import ast
-from typing import TYPE_CHECKING
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Final
 
 from pytest_review.analyzers.base import (
     AnalyzerResult,
+    CompositeVisitor,
     Issue,
+    NodeHandler,
     Severity,
     StaticAnalyzer,
     TestItemInfo,
@@ -16,9 +19,17 @@ from pytest_review.analyzers.base import (
 if TYPE_CHECKING:
     from pytest_review.config import ReviewConfig
 
+RULE_TOO_MANY_STATEMENTS: Final = "complexity.too_many_statements"
+RULE_DEEP_NESTING: Final = "complexity.deep_nesting"
+RULE_HIGH_CYCLOMATIC: Final = "complexity.high_cyclomatic"
 
-class ComplexityVisitor(ast.NodeVisitor):
-    """AST visitor that measures code complexity."""
+
+class ComplexityVisitor(NodeHandler):
+    """AST visitor that measures code complexity.
+
+    Node handling is driven by the module-level ``_DISPATCH`` and
+    ``_SCOPE_TYPES`` tables rather than per-type ``visit_*`` methods.
+    """
 
     def __init__(self) -> None:
         self.statement_count = 0
@@ -26,148 +37,140 @@ class ComplexityVisitor(ast.NodeVisitor):
         self.cyclomatic_complexity = 1  # Base complexity
         self._current_depth = 0
 
-    def _count_statement(self) -> None:
-        """Increment statement counter."""
-        self.statement_count += 1
+    def register(self, visitor: CompositeVisitor) -> None:
+        """Register the dispatch table handlers on a composite visitor."""
+        for node_type, handler in _DISPATCH.items():
+            visitor.register(node_type, partial(handler, self))
+        for node_type in _SCOPE_TYPES:
+            visitor.register(node_type, self._exit_scope, leave=True)
 
     def _enter_scope(self) -> None:
         """Enter a nested scope."""
         self._current_depth += 1
         self.max_depth = max(self.max_depth, self._current_depth)
 
-    def _exit_scope(self) -> None:
+    def _exit_scope(self, node: ast.AST | None = None) -> None:
         """Exit a nested scope."""
         self._current_depth -= 1
 
-    # Statement counting
-    def visit_Assign(self, node: ast.Assign) -> None:
-        self._count_statement()
-        self.generic_visit(node)
-
-    def visit_AnnAssign(self, node: ast.AnnAssign) -> None:
-        self._count_statement()
-        self.generic_visit(node)
-
-    def visit_AugAssign(self, node: ast.AugAssign) -> None:
-        self._count_statement()
-        self.generic_visit(node)
-
-    def visit_Expr(self, node: ast.Expr) -> None:
-        self._count_statement()
-        self.generic_visit(node)
-
-    def visit_Assert(self, node: ast.Assert) -> None:
-        self._count_statement()
-        self.generic_visit(node)
 
-    def visit_Return(self, node: ast.Return) -> None:
-        self._count_statement()
-        self.generic_visit(node)
+def _elif_branches(node: ast.If) -> int:
+    # Count elif branches
+    return sum(1 for child in node.orelse if isinstance(child, ast.If))
 
-    def visit_Raise(self, node: ast.Raise) -> None:
-        self._count_statement()
-        self.generic_visit(node)
 
-    def visit_Pass(self, node: ast.Pass) -> None:
-        self._count_statement()
-        self.generic_visit(node)
+def _bool_op_decisions(node: ast.BoolOp) -> int:
+    # Each 'and'/'or' adds a decision point
+    return len(node.values) - 1
 
-    def visit_Break(self, node: ast.Break) -> None:
-        self._count_statement()
-        self.generic_visit(node)
 
-    def visit_Continue(self, node: ast.Continue) -> None:
-        self._count_statement()
-        self.generic_visit(node)
+def _generator_decisions(
+    node: ast.ListComp | ast.SetComp | ast.DictComp | ast.GeneratorExp,
+) -> int:
+    return sum(1 + len(generator.ifs) for generator in node.generators)
 
-    def visit_Import(self, node: ast.Import) -> None:
-        self._count_statement()
-        self.generic_visit(node)
-
-    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
-        self._count_statement()
-        self.generic_visit(node)
 
+# What each node type adds to the metrics: whether it counts as a statement,
+# whether it is a decision point, whether its children form a nested scope,
+# and a function computing further decision points from the node. The
+# handler dispatch and _fast_metrics are both derived from this table.
+_NODE_METRICS: dict[type[ast.AST], tuple[bool, bool, bool, Callable[[Any], int] | None]] = {
+    # Statement counting
+    ast.Assign: (True, False, False, None),
+    ast.AnnAssign: (True, False, False, None),
+    ast.AugAssign: (True, False, False, None),
+    ast.Expr: (True, False, False, None),
+    ast.Assert: (True, False, False, None),
+    ast.Return: (True, False, False, None),
+    ast.Raise: (True, False, False, None),
+    ast.Pass: (True, False, False, None),
+    ast.Break: (True, False, False, None),
+    ast.Continue: (True, False, False, None),
+    ast.Import: (True, False, False, None),
+    ast.ImportFrom: (True, False, False, None),
     # Cyclomatic complexity - count decision points
-    def visit_If(self, node: ast.If) -> None:
-        self._count_statement()
-        self.cyclomatic_complexity += 1
-        # Count elif branches
-        for child in node.orelse:
-            if isinstance(child, ast.If):
-                self.cyclomatic_complexity += 1
-        self._enter_scope()
-        self.generic_visit(node)
-        self._exit_scope()
-
-    def visit_For(self, node: ast.For) -> None:
-        self._count_statement()
-        self.cyclomatic_complexity += 1
-        self._enter_scope()
-        self.generic_visit(node)
-        self._exit_scope()
-
-    def visit_While(self, node: ast.While) -> None:
-        self._count_statement()
-        self.cyclomatic_complexity += 1
-        self._enter_scope()
-        self.generic_visit(node)
-        self._exit_scope()
-
-    def visit_ExceptHandler(self, node: ast.ExceptHandler) -> None:
-        self.cyclomatic_complexity += 1
-        self._enter_scope()
-        self.generic_visit(node)
-        self._exit_scope()
-
-    def visit_With(self, node: ast.With) -> None:
-        self._count_statement()
-        self._enter_scope()
-        self.generic_visit(node)
-        self._exit_scope()
-
-    def visit_Try(self, node: ast.Try) -> None:
-        self._count_statement()
-        self._enter_scope()
-        self.generic_visit(node)
-        self._exit_scope()
-
-    def visit_BoolOp(self, node: ast.BoolOp) -> None:
-        # Each 'and'/'or' adds a decision point
-        self.cyclomatic_complexity += len(node.values) - 1
-        self.generic_visit(node)
-
-    def visit_IfExp(self, node: ast.IfExp) -> None:
-        # Ternary expression
-        self.cyclomatic_complexity += 1
-        self.generic_visit(node)
-
-    def visit_ListComp(self, node: ast.ListComp) -> None:
-        self._count_statement()
-        for generator in node.generators:
-            self.cyclomatic_complexity += 1
-            self.cyclomatic_complexity += len(generator.ifs)
-        self.generic_visit(node)
-
-    def visit_DictComp(self, node: ast.DictComp) -> None:
-        self._count_statement()
-        for generator in node.generators:
-            self.cyclomatic_complexity += 1
-            self.cyclomatic_complexity += len(generator.ifs)
-        self.generic_visit(node)
-
-    def visit_SetComp(self, node: ast.SetComp) -> None:
-        self._count_statement()
-        for generator in node.generators:
-            self.cyclomatic_complexity += 1
-            self.cyclomatic_complexity += len(generator.ifs)
-        self.generic_visit(node)
-
-    def visit_GeneratorExp(self, node: ast.GeneratorExp) -> None:
-        for generator in node.generators:
-            self.cyclomatic_complexity += 1
-            self.cyclomatic_complexity += len(generator.ifs)
-        self.generic_visit(node)
+    ast.If: (True, True, True, _elif_branches),
+    ast.For: (True, True, True, None),
+    ast.While: (True, True, True, None),
+    ast.ExceptHandler: (False, True, True, None),
+    ast.With: (True, False, True, None),
+    ast.Try: (True, False, True, None),
+    ast.BoolOp: (False, False, False, _bool_op_decisions),
+    ast.IfExp: (False, True, False, None),  # Ternary expression
+    ast.ListComp: (True, False, False, _generator_decisions),
+    ast.DictComp: (True, False, False, _generator_decisions),
+    ast.SetComp: (True, False, False, _generator_decisions),
+    ast.GeneratorExp: (False, False, False, _generator_decisions),
+}
+
+
+def _make_handler(
+    statement: bool, decision: bool, scope: bool, extra: Callable[[Any], int] | None
+) -> Callable[[ComplexityVisitor, Any], None]:
+    """Build the visitor handler for one row of ``_NODE_METRICS``."""
+
+    def handler(visitor: ComplexityVisitor, node: ast.AST) -> None:
+        if statement:
+            visitor.statement_count += 1
+        if decision:
+            visitor.cyclomatic_complexity += 1
+        if extra is not None:
+            visitor.cyclomatic_complexity += extra(node)
+        if scope:
+            visitor._enter_scope()
+
+    return handler
+
+
+_DISPATCH: dict[type[ast.AST], Callable[[ComplexityVisitor, Any], None]] = {
+    node_type: _make_handler(*metrics) for node_type, metrics in _NODE_METRICS.items()
+}
+
+# Node types whose children form a nested scope, exited once they are walked
+_SCOPE_TYPES: tuple[type[ast.AST], ...] = tuple(
+    node_type for node_type, metrics in _NODE_METRICS.items() if metrics[2]
+)
+
+# Flat views of _NODE_METRICS, for the single-loop _fast_metrics
+_STATEMENT_TYPES: frozenset[type[ast.AST]] = frozenset(
+    node_type for node_type, metrics in _NODE_METRICS.items() if metrics[0]
+)
+_DECISION_TYPES: frozenset[type[ast.AST]] = frozenset(
+    node_type for node_type, metrics in _NODE_METRICS.items() if metrics[1]
+)
+_EXTRA_DECISIONS: dict[type[ast.AST], Callable[[Any], int]] = {
+    node_type: metrics[3] for node_type, metrics in _NODE_METRICS.items() if metrics[3] is not None
+}
+_SCOPE_TYPE_SET: frozenset[type[ast.AST]] = frozenset(_SCOPE_TYPES)
+
+
+def _fast_metrics(root: ast.AST) -> tuple[int, int, int]:
+    """Compute (statements, max depth, cyclomatic complexity) in one loop.
+
+    Gives the same numbers as a full ComplexityVisitor walk, using set
+    membership on exact node types instead of per-node handler calls.
+    """
+    statements = 0
+    max_depth = 0
+    complexity = 1
+    stack: list[tuple[ast.AST, int]] = [(root, 0)]
+    while stack:
+        node, depth = stack.pop()
+        node_type = type(node)
+        if node_type in _STATEMENT_TYPES:
+            statements += 1
+        if node_type in _DECISION_TYPES:
+            complexity += 1
+        extra = _EXTRA_DECISIONS.get(node_type)
+        if extra is not None:
+            complexity += extra(node)
+        if node_type in _SCOPE_TYPE_SET:
+            depth += 1
+            if depth > max_depth:
+                max_depth = depth
+        for child in ast.iter_child_nodes(node):
+            stack.append((child, depth))
+    return statements, max_depth, complexity
 
 
 class ComplexityAnalyzer(StaticAnalyzer):
@@ -185,17 +188,42 @@ class ComplexityAnalyzer(StaticAnalyzer):
         self._max_depth = int(str(max_depth_opt)) if max_depth_opt is not None else 3
         self._max_complexity = int(str(max_cplx_opt)) if max_cplx_opt is not None else 5
 
+    def register(
+        self, visitor: CompositeVisitor, test: TestItemInfo, result: AnalyzerResult
+    ) -> Callable[[], None]:
+        handler = ComplexityVisitor()
+        handler.register(visitor)
+        return partial(self._report, handler, test, result)
+
     def _analyze_ast(self, test: TestItemInfo, result: AnalyzerResult) -> None:
+        # Standalone runs compute the metrics in one tight loop; the shared
+        # walk in analyze_test goes through the registered handlers instead
         visitor = ComplexityVisitor()
-        visitor.visit(test.node)
+        (
+            visitor.statement_count,
+            visitor.max_depth,
+            visitor.cyclomatic_complexity,
+        ) = _fast_metrics(test.node)
+        self._report(visitor, test, result)
+
+    def _report(
+        self, visitor: ComplexityVisitor, test: TestItemInfo, result: AnalyzerResult
+    ) -> None:
+        """Report issues from the collected complexity metrics."""
+        # Bind metrics and limits to locals once; each is read several times
+        statements = visitor.statement_count
+        depth = visitor.max_depth
+        complexity = visitor.cyclomatic_complexity
+        max_statements = self._max_statements
+        max_depth = self._max_depth
+        max_complexity = self._max_complexity
 
         # Check statement count
-        if visitor.statement_count > self._max_statements:
+        if statements > max_statements and self.is_rule_enabled(RULE_TOO_MANY_STATEMENTS):
             result.add_issue(
                 Issue(
-                    rule="complexity.too_many_statements",
-                    message=f"Test has {visitor.statement_count} statements "
-                    f"(maximum {self._max_statements})",
+                    rule=RULE_TOO_MANY_STATEMENTS,
+                    message=f"Test has {statements} statements (maximum {max_statements})",
                     severity=Severity.WARNING,
                     file_path=test.file_path,
                     line=test.line,
@@ -205,12 +233,11 @@ class ComplexityAnalyzer(StaticAnalyzer):
             )
 
         # Check nesting depth
-        if visitor.max_depth > self._max_depth:
+        if depth > max_depth and self.is_rule_enabled(RULE_DEEP_NESTING):
             result.add_issue(
                 Issue(
-                    rule="complexity.deep_nesting",
-                    message=f"Test has nesting depth of {visitor.max_depth} "
-                    f"(maximum {self._max_depth})",
+                    rule=RULE_DEEP_NESTING,
+                    message=f"Test has nesting depth of {depth} (maximum {max_depth})",
                     severity=Severity.WARNING,
                     file_path=test.file_path,
                     line=test.line,
@@ -220,12 +247,12 @@ class ComplexityAnalyzer(StaticAnalyzer):
             )
 
         # Check cyclomatic complexity
-        if visitor.cyclomatic_complexity > self._max_complexity:
+        if complexity > max_complexity and self.is_rule_enabled(RULE_HIGH_CYCLOMATIC):
             result.add_issue(
                 Issue(
-                    rule="complexity.high_cyclomatic",
-                    message=f"Test has cyclomatic complexity of {visitor.cyclomatic_complexity} "
-                    f"(maximum {self._max_complexity})",
+                    rule=RULE_HIGH_CYCLOMATIC,
+                    message=f"Test has cyclomatic complexity of {complexity} "
+                    f"(maximum {max_complexity})",
                     severity=Severity.WARNING,
                     file_path=test.file_path,
                     line=test.line,
@@ -235,6 +262,6 @@ class ComplexityAnalyzer(StaticAnalyzer):
             )
 
         # Store metadata
-        result.metadata["statement_count"] = visitor.statement_count
-        result.metadata["max_depth"] = visitor.max_depth
-        result.metadata["cyclomatic_complexity"] = visitor.cyclomatic_complexity
+        result.metadata["statement_count"] = statements
+        result.metadata["max_depth"] = depth
+        result.metadata["cyclomatic_complexity"] = complexity
@@ -4,12 +4,15 @@ from __future__ import annotations
 
 import ast
 import sys
-from typing import TYPE_CHECKING, Any
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Final
 
 from pytest_review.analyzers.base import (
     AnalyzerResult,
+    CompositeVisitor,
     DynamicAnalyzer,
     Issue,
+    NodeHandler,
     Severity,
     StaticAnalyzer,
     TestItemInfo,
@@ -18,29 +21,44 @@ from pytest_review.analyzers.base import (
 if TYPE_CHECKING:
     from pytest_review.config import ReviewConfig
 
+RULE_GLOBAL_MODIFICATION: Final = "isolation.global_modification"
+RULE_CLASS_ATTR_MODIFICATION: Final = "isolation.class_attr_modification"
+RULE_RUNTIME_MODIFICATION: Final = "isolation.runtime_modification"
 
-class GlobalModificationVisitor(ast.NodeVisitor):
+
+def _is_class_ref(name: str) -> bool:
+    """Check if a name looks like a class reference: ``cls`` or a CapWords name."""
+    # ast.Name ids never contain dots, so "self.__class__" can't occur here
+    return name == "cls" or name[0].isupper()
+
+
+class GlobalModificationVisitor(NodeHandler):
     """AST visitor that detects potential global state modifications."""
 
     # Methods that mutate mutable objects
-    MUTATING_METHODS = {
-        "append",
-        "extend",
-        "insert",
-        "remove",
-        "pop",
-        "clear",
-        "add",
-        "discard",
-        "update",
-        "intersection_update",
-        "difference_update",
-        "symmetric_difference_update",
-        "setdefault",
-        "popitem",
-    }
-
-    def __init__(self) -> None:
+    MUTATING_METHODS = frozenset(
+        {
+            "append",
+            "extend",
+            "insert",
+            "remove",
+            "pop",
+            "clear",
+            "add",
+            "discard",
+            "update",
+            "intersection_update",
+            "difference_update",
+            "symmetric_difference_update",
+            "setdefault",
+            "popitem",
+        }
+    )
+
+    def __init__(self, known_modules: frozenset[str] | None = None) -> None:
+        # Names of imported modules, snapshotted so sys.modules changing
+        # mid-analysis can't change results
+        self._known_modules = frozenset(sys.modules) if known_modules is None else known_modules
         self.global_writes: list[tuple[int, str]] = []  # (line, name)
         self.global_declarations: list[str] = []
         self.class_attr_modifications: list[tuple[int, str]] = []
@@ -51,17 +69,15 @@ class GlobalModificationVisitor(ast.NodeVisitor):
         for name in node.names:
             self.global_declarations.append(name)
             self.global_writes.append((node.lineno, name))
-        self.generic_visit(node)
 
     def visit_Attribute(self, node: ast.Attribute) -> None:
         """Detect class/module attribute modifications."""
-        # Check if this is a write context (assignment target)
-        if isinstance(node.ctx, ast.Store) and isinstance(node.value, ast.Name):
-            name = node.value.id
-            # Common class reference patterns
-            if name in ("cls", "self.__class__") or name[0].isupper():
-                self.class_attr_modifications.append((node.lineno, f"{name}.{node.attr}"))
-        self.generic_visit(node)
+        # Check if this is a write context (assignment target). Attributes are
+        # among the most common nodes, so use exact type checks (AST node
+        # classes are never subclassed) and test the context first
+        value = node.value
+        if type(node.ctx) is ast.Store and type(value) is ast.Name and _is_class_ref(value.id):
+            self.class_attr_modifications.append((node.lineno, f"{value.id}.{node.attr}"))
 
     def visit_Call(self, node: ast.Call) -> None:
         """Detect mutating method calls on class attributes."""
@@ -70,14 +86,10 @@ class GlobalModificationVisitor(ast.NodeVisitor):
             method_name = node.func.attr
             if method_name in self.MUTATING_METHODS and isinstance(node.func.value, ast.Attribute):
                 inner = node.func.value
-                if isinstance(inner.value, ast.Name):
-                    name = inner.value.id
-                    # Common class reference patterns
-                    if name in ("cls", "self.__class__") or name[0].isupper():
-                        self.class_attr_modifications.append(
-                            (node.lineno, f"{name}.{inner.attr}.{method_name}()")
-                        )
-        self.generic_visit(node)
+                if isinstance(inner.value, ast.Name) and _is_class_ref(inner.value.id):
+                    self.class_attr_modifications.append(
+                        (node.lineno, f"{inner.value.id}.{inner.attr}.{method_name}()")
+                    )
 
     def visit_Subscript(self, node: ast.Subscript) -> None:
         """Detect modifications to module-level dicts/lists."""
@@ -89,11 +101,10 @@ class GlobalModificationVisitor(ast.NodeVisitor):
             module_name = node.value.value.id
             attr_name = node.value.attr
             # Check if it looks like a module reference
-            if module_name in sys.modules or module_name[0].islower():
+            if module_name[0].islower() or module_name in self._known_modules:
                 self.class_attr_modifications.append(
                     (node.lineno, f"{module_name}.{attr_name}[...]")
                 )
-        self.generic_visit(node)
 
 
 class IsolationStaticAnalyzer(StaticAnalyzer):
@@ -102,42 +113,125 @@ class IsolationStaticAnalyzer(StaticAnalyzer):
     name = "isolation"
     description = "Detects potential test isolation issues"
 
+    def __init__(self, config: ReviewConfig) -> None:
+        super().__init__(config)
+        self._known_modules: frozenset[str] | None = None
+
+    def register(
+        self, visitor: CompositeVisitor, test: TestItemInfo, result: AnalyzerResult
+    ) -> Callable[[], None]:
+        # Snapshot the imported modules on first use, once test modules have
+        # been imported, rather than copying sys.modules for every test
+        if self._known_modules is None:
+            self._known_modules = frozenset(sys.modules)
+        handler = GlobalModificationVisitor(self._known_modules)
+        handler.register(visitor)
+        return partial(self._report, handler, test, result)
+
     def _analyze_ast(self, test: TestItemInfo, result: AnalyzerResult) -> None:
-        visitor = GlobalModificationVisitor()
-        visitor.visit(test.node)
+        self._walk(test, result)
 
+    def _report(
+        self, visitor: GlobalModificationVisitor, test: TestItemInfo, result: AnalyzerResult
+    ) -> None:
+        """Report issues from the collected state modifications."""
         # Report global keyword usage
-        for line, name in visitor.global_writes:
-            result.add_issue(
-                Issue(
-                    rule="isolation.global_modification",
-                    message=f"Test uses 'global {name}' which modifies shared state",
-                    severity=Severity.WARNING,
-                    file_path=test.file_path,
-                    line=line,
-                    test_name=test.name,
-                    suggestion="Avoid modifying global state; use fixtures or dependency injection",
+        if self.is_rule_enabled(RULE_GLOBAL_MODIFICATION):
+            for line, name in visitor.global_writes:
+                result.add_issue(
+                    Issue(
+                        rule=RULE_GLOBAL_MODIFICATION,
+                        message=f"Test uses 'global {name}' which modifies shared state",
+                        severity=Severity.WARNING,
+                        file_path=test.file_path,
+                        line=line,
+                        test_name=test.name,
+                        suggestion=(
+                            "Avoid modifying global state; use fixtures or dependency injection"
+                        ),
+                    )
                 )
-            )
 
         # Report class attribute modifications
-        for line, attr in visitor.class_attr_modifications:
-            result.add_issue(
-                Issue(
-                    rule="isolation.class_attr_modification",
-                    message=f"Test modifies class/module attribute: {attr}",
-                    severity=Severity.WARNING,
-                    file_path=test.file_path,
-                    line=line,
-                    test_name=test.name,
-                    suggestion="Use instance attributes or fixtures instead of class-level state",
+        if self.is_rule_enabled(RULE_CLASS_ATTR_MODIFICATION):
+            for line, attr in visitor.class_attr_modifications:
+                result.add_issue(
+                    Issue(
+                        rule=RULE_CLASS_ATTR_MODIFICATION,
+                        message=f"Test modifies class/module attribute: {attr}",
+                        severity=Severity.WARNING,
+                        file_path=test.file_path,
+                        line=line,
+                        test_name=test.name,
+                        suggestion=(
+                            "Use instance attributes or fixtures instead of class-level state"
+                        ),
+                    )
                 )
-            )
 
         result.metadata["global_modifications"] = len(visitor.global_writes)
         result.metadata["class_attr_modifications"] = len(visitor.class_attr_modifications)
 
 
+# Module attributes are reduced to fingerprints that change when they are
+# modified. Immutable values are kept as they are; lists, dicts and sets are
+# reduced to a shallow copy, compared with == when the test ends.
+Fingerprint = Callable[[Any], Any]
+
+
+def _same(value: Any) -> Any:
+    return value
+
+
+# Fingerprint function for each tracked type; other types are not tracked
+_FINGERPRINTS: dict[type, Fingerprint] = {
+    int: _same,
+    float: _same,
+    str: _same,
+    bool: _same,
+    tuple: _same,
+    list: list,
+    dict: dict,
+    set: set,
+}
+
+
+# Sentinel for names absent from a snapshot
+_MISSING = object()
+
+
+def _namespace(module_name: str) -> dict[str, Any] | None:
+    """Get a module's namespace without going through attribute lookup."""
+    # Read the namespace directly: no sorted dir() listing and no attribute
+    # lookup machinery (properties, module __getattr__)
+    return getattr(sys.modules.get(module_name), "__dict__", None)
+
+
+def _same_bindings(before: dict[str, Any], after: dict[str, Any]) -> bool:
+    """Check that two namespaces bind the same names to equal values.
+
+    Dict comparison runs in C and short-circuits on identical values, so
+    this is cheap when a test rebinds nothing.
+    """
+    try:
+        return bool(before == after)
+    except Exception:
+        # Values whose __eq__ doesn't return a bool (arrays, ...)
+        return False
+
+
+def _resolve_fingerprint(value_type: type) -> Fingerprint | None:
+    """Find the fingerprint function for a type through its MRO.
+
+    Subclasses of tracked types (``defaultdict``, ``IntEnum``, ...) are tracked too.
+    """
+    for base in value_type.__mro__:
+        fingerprint = _FINGERPRINTS.get(base)
+        if fingerprint is not None:
+            return fingerprint
+    return None
+
+
 class IsolationDynamicAnalyzer(DynamicAnalyzer):
     """Dynamic analyzer that tracks actual state modifications during test runs."""
 
@@ -146,59 +240,104 @@ class IsolationDynamicAnalyzer(DynamicAnalyzer):
 
     def __init__(self, config: ReviewConfig) -> None:
         super().__init__(config)
-        self._module_snapshots: dict[str, dict[str, Any]] = {}
+        # Per monitored module: the namespace as of the test start, and the
+        # fingerprints of its containers at that time
+        self._module_snapshots: dict[str, tuple[dict[str, Any], dict[str, Any]]] = {}
+        # Per monitored module: the namespace as of its last full scan, and the
+        # public names in it holding containers, the only values that can
+        # change without being rebound
+        self._baseline: dict[str, tuple[dict[str, Any], list[str]]] = {}
         self._test_modifications: dict[str, list[str]] = {}
         self._current_test: str | None = None
         self._monitored_modules: set[str] = set()
+        self._fingerprints: dict[type, Fingerprint | None] = dict(_FINGERPRINTS)
 
     def configure_monitoring(self, module_names: list[str]) -> None:
         """Configure which modules to monitor for state changes."""
         self._monitored_modules = set(module_names)
 
-    def _snapshot_module(self, module_name: str) -> dict[str, Any]:
-        """Take a snapshot of a module's public attributes."""
-        if module_name not in sys.modules:
-            return {}
-
-        module = sys.modules[module_name]
+    def _fingerprint_for(self, value_type: type) -> Fingerprint | None:
+        """Get the fingerprint function for a type, resolved once per session."""
+        try:
+            return self._fingerprints[value_type]
+        except KeyError:
+            fingerprint = self._fingerprints[value_type] = _resolve_fingerprint(value_type)
+            return fingerprint
+
+    def _fingerprint_value(self, value: Any) -> Any:
+        """Fingerprint a value of a tracked type."""
+        fingerprint = self._fingerprint_for(type(value))
+        return fingerprint(value) if fingerprint is not None else value
+
+    def _snapshot(
+        self, namespace: dict[str, Any], containers: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Fingerprint the public attributes of a namespace.
+
+        Fingerprints in ``containers`` are used instead of recomputing them.
+        """
+        containers = containers or {}
+        # Resolved per type once per session, then a single dict lookup
+        fingerprints = self._fingerprints
         snapshot: dict[str, Any] = {}
-
-        for name in dir(module):
+        for name, value in namespace.items():
+            # Only track public attributes of simple types that we can compare
             if name.startswith("_"):
                 continue
+            if name in containers:
+                snapshot[name] = containers[name]
+                continue
+            value_type = type(value)
             try:
-                value = getattr(module, name)
-                # Only track simple types that we can compare
-                if isinstance(value, (int, float, str, bool, list, dict, set, tuple)):
-                    # For mutable types, make a shallow copy
-                    if isinstance(value, list):
-                        snapshot[name] = list(value)
-                    elif isinstance(value, dict):
-                        snapshot[name] = dict(value)
-                    elif isinstance(value, set):
-                        snapshot[name] = set(value)
-                    else:
-                        snapshot[name] = value
-            except Exception:
-                pass
+                fingerprint = fingerprints[value_type]
+            except KeyError:
+                fingerprint = self._fingerprint_for(value_type)
+            if fingerprint is not None:
+                snapshot[name] = fingerprint(value)
 
         return snapshot
 
+    def _snapshot_module(self, module_name: str) -> dict[str, Any]:
+        """Take a snapshot of a module's public attributes, as fingerprints."""
+        return self._snapshot(_namespace(module_name) or {})
+
+    def _container_names(self, module_name: str, namespace: dict[str, Any]) -> list[str]:
+        """Get the public names holding containers, rescanning only after a rebinding."""
+        baseline = self._baseline.get(module_name)
+        if baseline is not None and _same_bindings(baseline[0], namespace):
+            return baseline[1]
+
+        names = []
+        for name, value in namespace.items():
+            if not name.startswith("_"):
+                fingerprint = self._fingerprint_for(type(value))
+                if fingerprint is not None and fingerprint is not _same:
+                    names.append(name)
+        self._baseline[module_name] = (namespace.copy(), names)
+        return names
+
     def _compare_snapshots(self, before: dict[str, Any], after: dict[str, Any]) -> list[str]:
         """Compare two snapshots and return list of modified attributes."""
+        # Most tests leave module state alone: one C-level comparison of the
+        # fingerprints settles it without building any messages
+        if before == after:
+            return []
+
         modified = []
+        added = 0
 
         # Check for modifications and additions
         for name, after_value in after.items():
-            if name not in before:
+            before_value = before.get(name, _MISSING)
+            if before_value is _MISSING:
                 modified.append(f"{name} (added)")
-            elif before[name] != after_value:
+                added += 1
+            elif before_value != after_value:
                 modified.append(f"{name} (modified)")
 
-        # Check for deletions
-        for name in before:
-            if name not in after:
-                modified.append(f"{name} (deleted)")
+        # Check for deletions, only if fewer names survived than were there
+        if len(after) - added < len(before):
+            modified.extend(f"{name} (deleted)" for name in before if name not in after)
 
         return modified
 
@@ -207,9 +346,15 @@ class IsolationDynamicAnalyzer(DynamicAnalyzer):
         self._current_test = test_name
         self._module_snapshots = {}
 
-        # Take snapshots of monitored modules
+        # Copy each namespace in C; only containers need fingerprinting now,
+        # everything else is compared by its binding when the test ends
         for module_name in self._monitored_modules:
-            self._module_snapshots[module_name] = self._snapshot_module(module_name)
+            namespace = _namespace(module_name) or {}
+            containers = {
+                name: self._fingerprint_value(namespace[name])
+                for name in self._container_names(module_name, namespace)
+            }
+            self._module_snapshots[module_name] = (namespace.copy(), containers)
 
     def on_test_end(self, test_name: str, passed: bool, duration: float) -> None:
         """Called when a test finishes executing."""
@@ -217,9 +362,19 @@ class IsolationDynamicAnalyzer(DynamicAnalyzer):
 
         # Compare snapshots
         for module_name in self._monitored_modules:
-            before = self._module_snapshots.get(module_name, {})
-            after = self._snapshot_module(module_name)
-            module_mods = self._compare_snapshots(before, after)
+            before_namespace, containers = self._module_snapshots.get(module_name, ({}, {}))
+            namespace = _namespace(module_name) or {}
+            if _same_bindings(before_namespace, namespace):
+                # Nothing was rebound, added or deleted: only the containers
+                # can have changed, in place
+                module_mods = [
+                    f"{name} (modified)"
+                    for name, fingerprint in containers.items()
+                    if self._fingerprint_value(namespace[name]) != fingerprint
+                ]
+            else:
+                before = self._snapshot(before_namespace, containers)
+                module_mods = self._compare_snapshots(before, self._snapshot(namespace))
             for mod in module_mods:
                 modifications.append(f"{module_name}.{mod}")
 
@@ -230,20 +385,25 @@ class IsolationDynamicAnalyzer(DynamicAnalyzer):
 
     def get_results(self) -> list[AnalyzerResult]:
         """Get accumulated results after test run."""
-        results = []
+        # Results without issues are dropped by the caller, so don't build any
+        if not self.is_rule_enabled(RULE_RUNTIME_MODIFICATION):
+            return []
 
+        results = []
         for test_name, modifications in self._test_modifications.items():
-            result = AnalyzerResult(analyzer_name=self.name)
-            for mod in modifications:
-                result.add_issue(
+            result = AnalyzerResult(
+                analyzer_name=self.name,
+                issues=[
                     Issue(
-                        rule="isolation.runtime_modification",
+                        rule=RULE_RUNTIME_MODIFICATION,
                         message=f"Test modified shared state: {mod}",
                         severity=Severity.WARNING,
                         test_name=test_name,
                         suggestion="Ensure test cleanup restores original state",
                     )
-                )
+                    for mod in modifications
+                ],
+            )
             result.metadata["modifications"] = modifications
             results.append(result)
 
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import ast
 import re
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 from pytest_review.analyzers.base import (
     AnalyzerResult,
@@ -17,18 +17,28 @@ from pytest_review.analyzers.base import (
 if TYPE_CHECKING:
     from pytest_review.config import ReviewConfig
 
-# Patterns for non-descriptive test names
-NON_DESCRIPTIVE_PATTERNS = [
-    re.compile(r"^test_?\d+$"),  # test1, test_1, test_2
-    re.compile(r"^test_?[a-z]$"),  # test_a, testa
-    re.compile(r"^test_?it$", re.IGNORECASE),  # test_it
-    re.compile(r"^test_?this$", re.IGNORECASE),  # test_this
-    re.compile(r"^test_?foo$", re.IGNORECASE),  # test_foo
-    re.compile(r"^test_?bar$", re.IGNORECASE),  # test_bar
-    re.compile(r"^test_?example$", re.IGNORECASE),  # test_example
-    re.compile(r"^test_?test$", re.IGNORECASE),  # test_test
-    re.compile(r"^test_?something$", re.IGNORECASE),  # test_something
-]
+RULE_NON_DESCRIPTIVE: Final = "naming.non_descriptive"
+RULE_TOO_SHORT: Final = "naming.too_short"
+RULE_MISSING_DOCSTRING: Final = "naming.missing_docstring"
+RULE_NOT_SNAKE_CASE: Final = "naming.not_snake_case"
+RULE_UNCLEAR_ABBREVIATION: Final = "naming.unclear_abbreviation"
+
+# Non-descriptive test names, as one alternation so each name is matched once:
+# test1, test_1, test_a (case-sensitive) and test_it, test_this, test_foo,
+# test_bar, test_example, test_test, test_something (any case)
+NON_DESCRIPTIVE_PATTERN = re.compile(
+    r"^(?:test_?(?:\d+|[a-z])|(?i:test_?(?:it|this|foo|bar|example|test|something)))$"
+)
+
+# test_ prefix followed by snake_case
+_SNAKE_CASE_PATTERN = re.compile(r"^test_[a-z][a-z0-9_]*$")
+
+# Name parts that are clear despite being short
+_CLEAR_ABBREVIATIONS = frozenset({"test", "id", "ok", "db", "api", "url", "io", "ui", "ip", "os"})
+_CLEAR_SINGLES = frozenset({"a", "i"})
+_CLEAR_DOUBLES = frozenset(
+    {"is", "in", "on", "to", "or", "an", "as", "at", "no", "if", "do", "my", "up"}
+)
 
 
 class NamingAnalyzer(StaticAnalyzer):
@@ -47,27 +57,25 @@ class NamingAnalyzer(StaticAnalyzer):
         name = test.name
 
         # Check for non-descriptive names
-        for pattern in NON_DESCRIPTIVE_PATTERNS:
-            if pattern.match(name):
-                result.add_issue(
-                    Issue(
-                        rule="naming.non_descriptive",
-                        message=f"Non-descriptive test name: '{name}'",
-                        severity=Severity.WARNING,
-                        file_path=test.file_path,
-                        line=test.line,
-                        test_name=name,
-                        suggestion="Use a descriptive name that explains what the test verifies",
-                    )
+        if self.is_rule_enabled(RULE_NON_DESCRIPTIVE) and NON_DESCRIPTIVE_PATTERN.match(name):
+            result.add_issue(
+                Issue(
+                    rule=RULE_NON_DESCRIPTIVE,
+                    message=f"Non-descriptive test name: '{name}'",
+                    severity=Severity.WARNING,
+                    file_path=test.file_path,
+                    line=test.line,
+                    test_name=name,
+                    suggestion="Use a descriptive name that explains what the test verifies",
                 )
-                break
+            )
 
         # Check minimum length (excluding 'test_' prefix)
         name_without_prefix = name[5:] if name.startswith("test_") else name[4:]
-        if len(name_without_prefix) < self._min_length:
+        if len(name_without_prefix) < self._min_length and self.is_rule_enabled(RULE_TOO_SHORT):
             result.add_issue(
                 Issue(
-                    rule="naming.too_short",
+                    rule=RULE_TOO_SHORT,
                     message=f"Test name too short ({len(name_without_prefix)} chars, "
                     f"minimum {self._min_length})",
                     severity=Severity.INFO,
@@ -79,12 +87,12 @@ class NamingAnalyzer(StaticAnalyzer):
             )
 
         # Check for docstring
-        if self._require_docstring:
+        if self._require_docstring and self.is_rule_enabled(RULE_MISSING_DOCSTRING):
             docstring = ast.get_docstring(test.node)
             if not docstring:
                 result.add_issue(
                     Issue(
-                        rule="naming.missing_docstring",
+                        rule=RULE_MISSING_DOCSTRING,
                         message="Test is missing a docstring",
                         severity=Severity.INFO,
                         file_path=test.file_path,
@@ -95,10 +103,10 @@ class NamingAnalyzer(StaticAnalyzer):
                 )
 
         # Check naming convention (should use snake_case)
-        if not self._is_snake_case(name):
+        if self.is_rule_enabled(RULE_NOT_SNAKE_CASE) and not self._is_snake_case(name):
             result.add_issue(
                 Issue(
-                    rule="naming.not_snake_case",
+                    rule=RULE_NOT_SNAKE_CASE,
                     message=f"Test name '{name}' is not in snake_case",
                     severity=Severity.WARNING,
                     file_path=test.file_path,
@@ -109,11 +117,14 @@ class NamingAnalyzer(StaticAnalyzer):
             )
 
         # Check for unclear abbreviations
-        unclear_abbrevs = self._find_unclear_abbreviations(name)
+        if self.is_rule_enabled(RULE_UNCLEAR_ABBREVIATION):
+            unclear_abbrevs = self._find_unclear_abbreviations(name)
+        else:
+            unclear_abbrevs = []
         if unclear_abbrevs:
             result.add_issue(
                 Issue(
-                    rule="naming.unclear_abbreviation",
+                    rule=RULE_UNCLEAR_ABBREVIATION,
                     message=f"Unclear abbreviations: {', '.join(unclear_abbrevs)}",
                     severity=Severity.INFO,
                     file_path=test.file_path,
@@ -126,8 +137,7 @@ class NamingAnalyzer(StaticAnalyzer):
     @staticmethod
     def _is_snake_case(name: str) -> bool:
         """Check if name follows snake_case convention."""
-        # Allow test_ prefix and then snake_case
-        return bool(re.match(r"^test_[a-z][a-z0-9_]*$", name))
+        return _SNAKE_CASE_PATTERN.match(name) is not None
 
     @staticmethod
     def _find_unclear_abbreviations(name: str) -> list[str]:
@@ -137,16 +147,11 @@ class NamingAnalyzer(StaticAnalyzer):
         parts = name.lower().split("_")
         for part in parts:
             # Skip common/clear abbreviations and very short parts that might be intentional
-            if part in ("test", "id", "ok", "db", "api", "url", "io", "ui", "ip", "os"):
+            if part in _CLEAR_ABBREVIATIONS:
                 continue
             # Single letter parts (except common ones) or 2-letter uncommon abbreviations
-            is_unclear_single = len(part) == 1 and part not in ("a", "i")
-            is_unclear_double = (
-                len(part) == 2
-                and part not in ("is", "in", "on", "to", "or", "an", "as", "at")
-                and not part.isdigit()
-                and part not in ("no", "if", "do", "my", "up")
-            )
+            is_unclear_single = len(part) == 1 and part not in _CLEAR_SINGLES
+            is_unclear_double = len(part) == 2 and part not in _CLEAR_DOUBLES and not part.isdigit()
             if is_unclear_single or is_unclear_double:
                 unclear.append(part)
         return unclear
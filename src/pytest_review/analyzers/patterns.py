@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 import ast
-from typing import TYPE_CHECKING
+import re
+from functools import partial
+from typing import TYPE_CHECKING, Callable, Final
 
 from pytest_review.analyzers.base import (
     AnalyzerResult,
+    CompositeVisitor,
     Issue,
+    NodeHandler,
     Severity,
     StaticAnalyzer,
     TestItemInfo,
@@ -16,25 +20,94 @@ from pytest_review.analyzers.base import (
 if TYPE_CHECKING:
     from pytest_review.config import ReviewConfig
 
+RULE_BARE_EXCEPT: Final = "patterns.bare_except"
+RULE_SWALLOWED_EXCEPTION: Final = "patterns.swallowed_exception"
+RULE_SLEEP_IN_TEST: Final = "patterns.sleep_in_test"
+RULE_PRINT_STATEMENT: Final = "patterns.print_statement"
+RULE_OPEN_WITHOUT_CONTEXT: Final = "patterns.open_without_context"
+RULE_OS_SYSTEM: Final = "patterns.os_system"
+RULE_HARDCODED_PATH: Final = "patterns.hardcoded_path"
+RULE_LEGACY_MOCK: Final = "patterns.legacy_mock"
+RULE_IS_LITERAL: Final = "patterns.is_literal"
 
-class PatternVisitor(ast.NodeVisitor):
-    """AST visitor that detects anti-patterns."""
+# Well-known absolute path directories, anywhere in a string that starts with "/"
+_POSIX_PATH_PATTERN = re.compile(r"/(?:home|users|tmp|var|etc)/", re.IGNORECASE | re.ASCII)
 
-    def __init__(self) -> None:
-        self.issues: list[tuple[int, str, str, Severity, str | None]] = []
-        # (line, rule, message, severity, suggestion)
+# Identity comparison operators (AST node classes are never subclassed)
+_IS_OPS = frozenset({ast.Is, ast.IsNot})
+
+
+class PatternVisitor(NodeHandler):
+    """AST visitor that detects anti-patterns.
+
+    Findings are added to the test's result as issues when they are found.
+    Findings for ignored rules are never recorded, and handlers whose rules
+    are all ignored are not registered at all.
+    """
+
+    # Rules each handler method can report
+    HANDLER_RULES: dict[str, tuple[str, ...]] = {
+        "visit_ExceptHandler": (RULE_BARE_EXCEPT, RULE_SWALLOWED_EXCEPTION),
+        "visit_Call": (
+            RULE_SLEEP_IN_TEST,
+            RULE_PRINT_STATEMENT,
+            RULE_OPEN_WITHOUT_CONTEXT,
+            RULE_OS_SYSTEM,
+        ),
+        "visit_Constant": (RULE_HARDCODED_PATH,),
+        "visit_Import": (RULE_LEGACY_MOCK,),
+        "visit_ImportFrom": (RULE_LEGACY_MOCK,),
+        "visit_Compare": (RULE_IS_LITERAL,),
+    }
+
+    def __init__(
+        self,
+        test: TestItemInfo,
+        result: AnalyzerResult,
+        ignored_rules: frozenset[str] = frozenset(),
+    ) -> None:
+        self._test = test
+        self._result = result
+        self._ignored_rules = ignored_rules
+        self.issue_count = 0
+
+    def register(self, visitor: CompositeVisitor) -> None:
+        """Register the handlers that can still report an enabled rule."""
+        ignored = self._ignored_rules
+        for node_type, attr, leave in self._handler_methods:
+            rules = self.HANDLER_RULES.get(attr, ())
+            if rules and ignored.issuperset(rules):
+                continue
+            visitor.register(node_type, getattr(self, attr), leave=leave)
+
+    def _add(
+        self, line: int, rule: str, message: str, severity: Severity, suggestion: str | None
+    ) -> None:
+        """Add a finding to the result unless its rule is ignored."""
+        if rule in self._ignored_rules:
+            return
+        self.issue_count += 1
+        self._result.add_issue(
+            Issue(
+                rule=rule,
+                message=message,
+                severity=severity,
+                file_path=self._test.file_path,
+                line=line,
+                test_name=self._test.name,
+                suggestion=suggestion,
+            )
+        )
 
     def visit_ExceptHandler(self, node: ast.ExceptHandler) -> None:
         # Check for bare except
         if node.type is None:
-            self.issues.append(
-                (
-                    node.lineno,
-                    "patterns.bare_except",
-                    "Bare 'except:' clause catches all exceptions including KeyboardInterrupt",
-                    Severity.WARNING,
-                    "Specify the exception type, e.g., 'except Exception:'",
-                )
+            self._add(
+                node.lineno,
+                RULE_BARE_EXCEPT,
+                "Bare 'except:' clause catches all exceptions including KeyboardInterrupt",
+                Severity.WARNING,
+                "Specify the exception type, e.g., 'except Exception:'",
             )
         # Check for except Exception with pass
         if (
@@ -44,16 +117,13 @@ class PatternVisitor(ast.NodeVisitor):
             and len(node.body) == 1
             and isinstance(node.body[0], ast.Pass)
         ):
-            self.issues.append(
-                (
-                    node.lineno,
-                    "patterns.swallowed_exception",
-                    "Exception is caught and silently ignored",
-                    Severity.WARNING,
-                    "Log the exception or re-raise if appropriate",
-                )
+            self._add(
+                node.lineno,
+                RULE_SWALLOWED_EXCEPTION,
+                "Exception is caught and silently ignored",
+                Severity.WARNING,
+                "Log the exception or re-raise if appropriate",
             )
-        self.generic_visit(node)
 
     def visit_Call(self, node: ast.Call) -> None:
         func = node.func
@@ -65,39 +135,33 @@ class PatternVisitor(ast.NodeVisitor):
             and isinstance(func.value, ast.Name)
             and func.value.id == "time"
         ):
-            self.issues.append(
-                (
-                    node.lineno,
-                    "patterns.sleep_in_test",
-                    "time.sleep() in test makes it slow and potentially flaky",
-                    Severity.WARNING,
-                    "Use mocking or async patterns instead of sleeping",
-                )
+            self._add(
+                node.lineno,
+                RULE_SLEEP_IN_TEST,
+                "time.sleep() in test makes it slow and potentially flaky",
+                Severity.WARNING,
+                "Use mocking or async patterns instead of sleeping",
             )
 
         # Check for print() statements
         if isinstance(func, ast.Name) and func.id == "print":
-            self.issues.append(
-                (
-                    node.lineno,
-                    "patterns.print_statement",
-                    "print() statement in test - use logging or assertions instead",
-                    Severity.INFO,
-                    "Remove print or use proper logging/capfd fixture",
-                )
+            self._add(
+                node.lineno,
+                RULE_PRINT_STATEMENT,
+                "print() statement in test - use logging or assertions instead",
+                Severity.INFO,
+                "Remove print or use proper logging/capfd fixture",
             )
 
         # Check for open() without context manager (basic check)
         if isinstance(func, ast.Name) and func.id == "open":
             # This is in a Call context, check if parent is With
-            self.issues.append(
-                (
-                    node.lineno,
-                    "patterns.open_without_context",
-                    "open() should be used with a context manager (with statement)",
-                    Severity.INFO,
-                    "Use 'with open(...) as f:' to ensure file is properly closed",
-                )
+            self._add(
+                node.lineno,
+                RULE_OPEN_WITHOUT_CONTEXT,
+                "open() should be used with a context manager (with statement)",
+                Severity.INFO,
+                "Use 'with open(...) as f:' to ensure file is properly closed",
             )
 
         # Check for os.system() or subprocess without proper handling
@@ -107,88 +171,70 @@ class PatternVisitor(ast.NodeVisitor):
             and func.value.id == "os"
             and func.attr == "system"
         ):
-            self.issues.append(
-                (
-                    node.lineno,
-                    "patterns.os_system",
-                    "os.system() is deprecated, use subprocess module",
-                    Severity.INFO,
-                    "Use subprocess.run() for better control and security",
-                )
+            self._add(
+                node.lineno,
+                RULE_OS_SYSTEM,
+                "os.system() is deprecated, use subprocess module",
+                Severity.INFO,
+                "Use subprocess.run() for better control and security",
             )
 
-        self.generic_visit(node)
-
     def visit_Constant(self, node: ast.Constant) -> None:
         # Check for hardcoded paths (basic heuristic)
         if isinstance(node.value, str):
             value = node.value
             # Check for absolute paths
-            if value.startswith("/") and len(value) > 5 and "/" in value[1:]:
+            if value.startswith("/") and len(value) > 5:
                 # Looks like an absolute path
-                if any(
-                    p in value.lower() for p in ["/home/", "/users/", "/tmp/", "/var/", "/etc/"]
-                ):
+                if _POSIX_PATH_PATTERN.search(value):
                     display = f"{value[:50]}..." if len(value) > 50 else value
-                    self.issues.append(
-                        (
-                            node.lineno,
-                            "patterns.hardcoded_path",
-                            f"Hardcoded absolute path: '{display}'",
-                            Severity.WARNING,
-                            "Use tmp_path fixture or pathlib for cross-platform paths",
-                        )
-                    )
-            # Windows paths
-            elif len(value) > 3 and value[1:3] == ":\\":
-                self.issues.append(
-                    (
+                    self._add(
                         node.lineno,
-                        "patterns.hardcoded_path",
-                        "Hardcoded Windows path detected",
+                        RULE_HARDCODED_PATH,
+                        f"Hardcoded absolute path: '{display}'",
                         Severity.WARNING,
                         "Use tmp_path fixture or pathlib for cross-platform paths",
                     )
+            # Windows paths
+            elif len(value) > 3 and value.startswith(":\\", 1):
+                self._add(
+                    node.lineno,
+                    RULE_HARDCODED_PATH,
+                    "Hardcoded Windows path detected",
+                    Severity.WARNING,
+                    "Use tmp_path fixture or pathlib for cross-platform paths",
                 )
-        self.generic_visit(node)
 
     def visit_Import(self, node: ast.Import) -> None:
         for alias in node.names:
             if alias.name == "mock":
-                self.issues.append(
-                    (
-                        node.lineno,
-                        "patterns.legacy_mock",
-                        "Using 'import mock' - prefer unittest.mock (built-in since Python 3.3)",
-                        Severity.INFO,
-                        "Use 'from unittest.mock import Mock, patch' instead",
-                    )
+                self._add(
+                    node.lineno,
+                    RULE_LEGACY_MOCK,
+                    "Using 'import mock' - prefer unittest.mock (built-in since Python 3.3)",
+                    Severity.INFO,
+                    "Use 'from unittest.mock import Mock, patch' instead",
                 )
-        self.generic_visit(node)
 
     def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
         if node.module == "mock":
-            self.issues.append(
-                (
-                    node.lineno,
-                    "patterns.legacy_mock",
-                    "Using 'from mock import' - prefer unittest.mock",
-                    Severity.INFO,
-                    "Use 'from unittest.mock import ...' instead",
-                )
+            self._add(
+                node.lineno,
+                RULE_LEGACY_MOCK,
+                "Using 'from mock import' - prefer unittest.mock",
+                Severity.INFO,
+                "Use 'from unittest.mock import ...' instead",
             )
-        self.generic_visit(node)
-
-    def visit_Assign(self, node: ast.Assign) -> None:
-        # Check for mutable default-like patterns at module/class level
-        # This is a simplified check
-        self.generic_visit(node)
 
     def visit_Compare(self, node: ast.Compare) -> None:
-        # Check for 'is' comparison with literals
-        for i, op in enumerate(node.ops):
-            if isinstance(op, (ast.Is, ast.IsNot)):
-                comparator = node.comparators[i] if i < len(node.comparators) else None
+        # Check for 'is' comparison with literals. Most comparisons are a
+        # single ==, <, in, ... so bail out before looking at any operand
+        ops = node.ops
+        if len(ops) == 1 and type(ops[0]) not in _IS_OPS:
+            return
+        for i, op in enumerate(ops):
+            if type(op) in _IS_OPS:
+                comparator = node.comparators[i]
                 left = node.left if i == 0 else node.comparators[i - 1]
 
                 for operand in [left, comparator]:
@@ -197,17 +243,14 @@ class PatternVisitor(ast.NodeVisitor):
                         and isinstance(operand.value, (int, str, float))
                         and operand.value not in (True, False, None)
                     ):
-                        self.issues.append(
-                            (
-                                node.lineno,
-                                "patterns.is_literal",
-                                "Using 'is' with literal - use '==' instead",
-                                Severity.WARNING,
-                                "'is' compares identity, not equality; use '=='",
-                            )
+                        self._add(
+                            node.lineno,
+                            RULE_IS_LITERAL,
+                            "Using 'is' with literal - use '==' instead",
+                            Severity.WARNING,
+                            "'is' compares identity, not equality; use '=='",
                         )
                         break
-        self.generic_visit(node)
 
 
 class PatternsAnalyzer(StaticAnalyzer):
@@ -219,22 +262,16 @@ class PatternsAnalyzer(StaticAnalyzer):
     def __init__(self, config: ReviewConfig) -> None:
         super().__init__(config)
 
+    def register(
+        self, visitor: CompositeVisitor, test: TestItemInfo, result: AnalyzerResult
+    ) -> Callable[[], None]:
+        handler = PatternVisitor(test, result, self._ignored_rules)
+        handler.register(visitor)
+        return partial(self._report, handler, result)
+
     def _analyze_ast(self, test: TestItemInfo, result: AnalyzerResult) -> None:
-        visitor = PatternVisitor()
-        visitor.visit(test.node)
-
-        for line, rule, message, severity, suggestion in visitor.issues:
-            result.add_issue(
-                Issue(
-                    rule=rule,
-                    message=message,
-                    severity=severity,
-                    file_path=test.file_path,
-                    line=line,
-                    test_name=test.name,
-                    suggestion=suggestion,
-                )
-            )
+        self._walk(test, result)
 
-        # Store metadata
-        result.metadata["pattern_issues"] = len(visitor.issues)
+    def _report(self, visitor: PatternVisitor, result: AnalyzerResult) -> None:
+        """Store metadata once the visitor has added its issues."""
+        result.metadata["pattern_issues"] = visitor.issue_count
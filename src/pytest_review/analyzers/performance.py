@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import math
+from typing import TYPE_CHECKING, Final
 
 from pytest_review.analyzers.base import (
     AnalyzerResult,
@@ -14,6 +15,9 @@ from pytest_review.analyzers.base import (
 if TYPE_CHECKING:
     from pytest_review.config import ReviewConfig
 
+RULE_VERY_SLOW: Final = "performance.very_slow"
+RULE_SLOW: Final = "performance.slow"
+
 
 class PerformanceAnalyzer(DynamicAnalyzer):
     """Analyzes test execution performance."""
@@ -46,20 +50,21 @@ class PerformanceAnalyzer(DynamicAnalyzer):
         result.metadata["duration_ms"] = duration_ms
 
         if duration_ms >= self._very_slow_threshold_ms:
-            result.add_issue(
-                Issue(
-                    rule="performance.very_slow",
-                    message=f"Test is very slow: {duration_ms:.0f}ms "
-                    f"(threshold: {self._very_slow_threshold_ms:.0f}ms)",
-                    severity=Severity.WARNING,
-                    test_name=test_name,
-                    suggestion="Consider optimizing or mocking slow operations",
+            if self.is_rule_enabled(RULE_VERY_SLOW):
+                result.add_issue(
+                    Issue(
+                        rule=RULE_VERY_SLOW,
+                        message=f"Test is very slow: {duration_ms:.0f}ms "
+                        f"(threshold: {self._very_slow_threshold_ms:.0f}ms)",
+                        severity=Severity.WARNING,
+                        test_name=test_name,
+                        suggestion="Consider optimizing or mocking slow operations",
+                    )
                 )
-            )
-        elif duration_ms >= self._slow_threshold_ms:
+        elif duration_ms >= self._slow_threshold_ms and self.is_rule_enabled(RULE_SLOW):
             result.add_issue(
                 Issue(
-                    rule="performance.slow",
+                    rule=RULE_SLOW,
                     message=f"Test is slow: {duration_ms:.0f}ms "
                     f"(threshold: {self._slow_threshold_ms:.0f}ms)",
                     severity=Severity.INFO,
@@ -80,12 +85,29 @@ class PerformanceAnalyzer(DynamicAnalyzer):
         if not self._test_durations:
             return {}
 
-        durations = list(self._test_durations.values())
+        # One pass over the recorded durations, without copying them
+        slow_threshold = self._slow_threshold_ms
+        very_slow_threshold = self._very_slow_threshold_ms
+        total = 0.0
+        min_ms = math.inf
+        max_ms = -math.inf
+        slow_count = very_slow_count = 0
+        for duration in self._test_durations.values():
+            total += duration
+            if duration < min_ms:
+                min_ms = duration
+            if duration > max_ms:
+                max_ms = duration
+            if duration >= slow_threshold:
+                slow_count += 1
+            if duration >= very_slow_threshold:
+                very_slow_count += 1
+
         return {
-            "total_ms": sum(durations),
-            "avg_ms": sum(durations) / len(durations),
-            "min_ms": min(durations),
-            "max_ms": max(durations),
-            "slow_count": sum(1 for d in durations if d >= self._slow_threshold_ms),
-            "very_slow_count": sum(1 for d in durations if d >= self._very_slow_threshold_ms),
+            "total_ms": total,
+            "avg_ms": total / len(self._test_durations),
+            "min_ms": min_ms,
+            "max_ms": max_ms,
+            "slow_count": slow_count,
+            "very_slow_count": very_slow_count,
         }
@@ -14,14 +14,86 @@ Test smell concepts are based on research by:
 from __future__ import annotations
 
 import ast
-from typing import TYPE_CHECKING
-
-from pytest_review.analyzers.base import AnalyzerResult, Issue, Severity, StaticAnalyzer
+import heapq
+import sys
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Final
+
+from pytest_review.analyzers.base import (
+    AnalyzerResult,
+    Issue,
+    NodeHandler,
+    Severity,
+    StaticAnalyzer,
+)
 
 if TYPE_CHECKING:
-    from pytest_review.analyzers.base import TestItemInfo
+    from pytest_review.analyzers.base import CompositeVisitor, TestItemInfo
     from pytest_review.config import ReviewConfig
 
+RULE_MAGIC_NUMBER: Final = "smells.magic_number"
+RULE_EAGER_TEST: Final = "smells.eager_test"
+RULE_IGNORED_TEST: Final = "smells.ignored_test"
+RULE_ASSERTION_ROULETTE: Final = "smells.assertion_roulette"
+RULE_DUPLICATE_ASSERT: Final = "smells.duplicate_assert"
+
+# Decorators that mark a test as skipped
+_SKIP_DECORATORS = frozenset(
+    {
+        "skip",
+        "skipif",
+        "pytest.mark.skip",
+        "pytest.mark.skipif",
+        "unittest.skip",
+        "unittest.skipIf",
+        "unittest.skipUnless",
+    }
+)
+
+# Common assertion helpers and built-ins that don't count as tested targets
+_EAGER_EXCLUDED = frozenset(
+    {
+        "len",
+        "str",
+        "int",
+        "float",
+        "list",
+        "dict",
+        "set",
+        "tuple",
+        "isinstance",
+        "hasattr",
+        "getattr",
+        "type",
+        "id",
+        "repr",
+        "sorted",
+        "reversed",
+        "enumerate",
+        "zip",
+        "map",
+        "filter",
+        "any",
+        "all",
+        "sum",
+        "min",
+        "max",
+        "abs",
+        "round",
+        "assertTrue",
+        "assertFalse",
+        "assertEqual",
+        "assertNotEqual",
+        "assertIn",
+        "assertNotIn",
+        "assertIs",
+        "assertIsNot",
+        "assertIsNone",
+        "assertIsNotNone",
+        "assertRaises",
+    }
+)
+
 
 class SmellsAnalyzer(StaticAnalyzer):
     """Detects test smells that indicate quality issues."""
@@ -34,20 +106,31 @@ class SmellsAnalyzer(StaticAnalyzer):
         self._max_assertions_without_message = analyzer_config.options.get(
             "max_assertions_without_message", 1
         )
-        self._check_magic_numbers = analyzer_config.options.get("check_magic_numbers", True)
-        self._check_eager_test = analyzer_config.options.get("check_eager_test", True)
+        self._check_magic_numbers = analyzer_config.options.get(
+            "check_magic_numbers", True
+        ) and self.is_rule_enabled(RULE_MAGIC_NUMBER)
+        self._check_eager_test = analyzer_config.options.get(
+            "check_eager_test", True
+        ) and self.is_rule_enabled(RULE_EAGER_TEST)
+
+    def register(
+        self, visitor: CompositeVisitor, test: TestItemInfo, result: AnalyzerResult
+    ) -> Callable[[], None]:
+        """Register smell detection handlers; whole-test checks run once after the walk."""
+        handler = SmellVisitor(test, result, self)
+        handler.register(visitor)
+        return handler.finalize_checks
 
     def _analyze_ast(self, test: TestItemInfo, result: AnalyzerResult) -> None:
         """Analyze test for smells."""
-        visitor = SmellVisitor(test, result, self)
-        visitor.visit(test.node)
+        self._walk(test, result)
 
 
-class SmellVisitor(ast.NodeVisitor):
+class SmellVisitor(NodeHandler):
     """AST visitor that detects test smells."""
 
     # Magic number exceptions - these are commonly acceptable
-    ALLOWED_MAGIC_NUMBERS = {0, 1, -1, 2, 100, 1000}
+    ALLOWED_MAGIC_NUMBERS = frozenset({0, 1, -1, 2, 100, 1000})
 
     def __init__(
         self,
@@ -58,156 +141,160 @@ class SmellVisitor(ast.NodeVisitor):
         self._test = test
         self._result = result
         self._analyzer = analyzer
-        self._assertions: list[ast.Assert] = []
-        self._assertion_messages: list[str] = []
+        # Analyzer settings, read once per test instead of on every node
+        self._check_magic = analyzer._check_magic_numbers
+        self._check_eager = analyzer._check_eager_test
+        self._max_without_message = analyzer._max_assertions_without_message
+        # Every issue is for this test
+        self._issue = partial(Issue, file_path=test.file_path, test_name=test.name)
+        # Assertion statistics, gathered as assertions are visited so the
+        # whole-test checks don't loop over them again
+        self._assertion_count = 0
+        self._assertions_without_message = 0
+        self._check_duplicates = analyzer.is_rule_enabled(RULE_DUPLICATE_ASSERT)
+        self._seen_assertions: set[Any] = set()
+        self._duplicate_lines: list[int] = []
         self._call_targets: set[str] = set()
         self._has_skip_marker = False
 
     def visit_Assert(self, node: ast.Assert) -> None:
         """Track assertions for roulette and duplicate detection."""
-        self._assertions.append(node)
-
-        # Check for assertion message
+        self._assertion_count += 1
         if node.msg is None:
-            self._assertion_messages.append("")
-        else:
-            self._assertion_messages.append(ast.dump(node.msg))
+            self._assertions_without_message += 1
+
+        if self._check_duplicates:
+            # Structure key of the asserted expression, shared via the test item
+            assertion_key = self._test.assert_key(node)
+            if assertion_key in self._seen_assertions:
+                self._duplicate_lines.append(node.lineno)
+            else:
+                self._seen_assertions.add(assertion_key)
 
         # Check for magic numbers in assertions
-        if self._analyzer._check_magic_numbers:
+        if self._check_magic:
             self._check_magic_number(node)
 
-        # Track what's being tested for eager test detection
-        if self._analyzer._check_eager_test:
-            self._extract_call_target(node.test)
-
-        self.generic_visit(node)
-
     def visit_Call(self, node: ast.Call) -> None:
-        """Track function calls for eager test detection."""
-        if self._analyzer._check_eager_test:
-            self._extract_call_target(node)
-        self.generic_visit(node)
-
-    def _extract_call_target(self, node: ast.AST) -> None:
-        """Extract the function/method being called."""
-        if isinstance(node, ast.Call):
-            if isinstance(node.func, ast.Name):
-                self._call_targets.add(node.func.id)
-            elif isinstance(node.func, ast.Attribute):
-                # Get the full attribute chain (e.g., obj.method)
-                self._call_targets.add(node.func.attr)
-        elif isinstance(node, ast.Compare):
-            # Check both sides of comparison
-            self._extract_call_target(node.left)
-            for comparator in node.comparators:
-                self._extract_call_target(comparator)
-        elif isinstance(node, ast.BoolOp):
-            for value in node.values:
-                self._extract_call_target(value)
+        """Track function calls for eager test detection.
+
+        Calls inside assertions reach this handler through the shared walk too.
+        """
+        if self._check_eager:
+            # The parser interns identifiers but trees unpickled from the AST
+            # cache don't, so intern them here to make the final difference
+            # with _EAGER_EXCLUDED compare by identity
+            func = node.func
+            kind = type(func)
+            if kind is ast.Name:
+                self._call_targets.add(sys.intern(func.id))  # type: ignore[attr-defined]
+            elif kind is ast.Attribute:
+                # The method name, e.g. "method" for obj.method()
+                self._call_targets.add(sys.intern(func.attr))  # type: ignore[attr-defined]
 
     def _check_magic_number(self, node: ast.Assert) -> None:
-        """Check for magic numbers in assertion."""
-        for child in ast.walk(node.test):
-            if (
-                isinstance(child, ast.Constant)
-                and isinstance(child.value, (int, float))
-                and child.value not in self.ALLOWED_MAGIC_NUMBERS
-            ):
-                self._result.add_issue(
-                    Issue(
-                        rule="smells.magic_number",
-                        message=f"Magic number {child.value} in assertion",
-                        severity=Severity.INFO,
-                        file_path=self._test.file_path,
-                        line=child.lineno,
-                        test_name=self._test.name,
-                        suggestion="Use a named constant or variable for clarity",
-                    )
-                )
-                return  # Only report once per assertion
+        """Check for magic numbers in assertion.
+
+        Only the first magic number, in ``ast.walk`` order, is reported, so
+        the walk goes level by level and stops there.
+        """
+        allowed = self.ALLOWED_MAGIC_NUMBERS
+        level: list[ast.AST] = [node.test]
+        while level:
+            next_level: list[ast.AST] = []
+            for child in level:
+                # Exact type checks: parsed trees never hold AST or number
+                # subclasses. Booleans equal 0 and 1, which are allowed anyway
+                if type(child) is ast.Constant:
+                    # Constants have no children
+                    value = child.value
+                    if (type(value) is int or type(value) is float) and value not in allowed:
+                        self._result.add_issue(
+                            self._issue(
+                                rule=RULE_MAGIC_NUMBER,
+                                message=f"Magic number {value} in assertion",
+                                severity=Severity.INFO,
+                                line=child.lineno,
+                                suggestion="Use a named constant or variable for clarity",
+                            )
+                        )
+                        return  # Only report once per assertion
+                else:
+                    next_level.extend(ast.iter_child_nodes(child))
+            level = next_level
 
     def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
-        """Check for skip decorators and visit body."""
+        """Check for skip decorators."""
         self._check_skip_decorator(node)
-        self.generic_visit(node)
-        self._finalize_checks()
 
     def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
-        """Check for skip decorators and visit body."""
+        """Check for skip decorators."""
         self._check_skip_decorator(node)
-        self.generic_visit(node)
-        self._finalize_checks()
 
     def _check_skip_decorator(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
         """Check if test has skip decorator."""
         for decorator in node.decorator_list:
             decorator_name = self._get_decorator_name(decorator)
-            if decorator_name in (
-                "skip",
-                "skipif",
-                "pytest.mark.skip",
-                "pytest.mark.skipif",
-                "unittest.skip",
-                "unittest.skipIf",
-                "unittest.skipUnless",
-            ):
+            if decorator_name in _SKIP_DECORATORS:
                 self._has_skip_marker = True
+                if not self._analyzer.is_rule_enabled(RULE_IGNORED_TEST):
+                    continue
                 self._result.add_issue(
-                    Issue(
-                        rule="smells.ignored_test",
+                    self._issue(
+                        rule=RULE_IGNORED_TEST,
                         message=f"Test is skipped with @{decorator_name}",
                         severity=Severity.WARNING,
-                        file_path=self._test.file_path,
                         line=node.lineno,
-                        test_name=self._test.name,
                         suggestion="Ensure skipped tests are tracked and re-enabled when ready",
                     )
                 )
 
     def _get_decorator_name(self, decorator: ast.expr) -> str:
         """Get the full name of a decorator."""
+        # The name of a decorator factory is the name of what it calls
+        while isinstance(decorator, ast.Call):
+            decorator = decorator.func
         if isinstance(decorator, ast.Name):
             return decorator.id
-        elif isinstance(decorator, ast.Attribute):
-            parts: list[str] = []
-            current: ast.expr = decorator
-            while isinstance(current, ast.Attribute):
-                parts.append(current.attr)
-                current = current.value
-            if isinstance(current, ast.Name):
-                parts.append(current.id)
-            return ".".join(reversed(parts))
-        elif isinstance(decorator, ast.Call):
-            return self._get_decorator_name(decorator.func)
-        return ""
-
-    def _finalize_checks(self) -> None:
-        """Run checks that need all assertions collected."""
-        self._check_assertion_roulette()
-        self._check_duplicate_assertions()
+        if not isinstance(decorator, ast.Attribute):
+            return ""
+
+        parts: list[str] = []
+        current: ast.expr = decorator
+        while isinstance(current, ast.Attribute):
+            parts.append(current.attr)
+            current = current.value
+        if isinstance(current, ast.Name):
+            parts.append(current.id)
+        parts.reverse()
+        return ".".join(parts)
+
+    def finalize_checks(self) -> None:
+        """Run checks that need all assertions collected, once the walk is done."""
+        if self._analyzer.is_rule_enabled(RULE_ASSERTION_ROULETTE):
+            self._check_assertion_roulette()
+        if self._check_duplicates:
+            self._check_duplicate_assertions()
         self._check_eager_test()
 
     def _check_assertion_roulette(self) -> None:
         """Check for multiple assertions without messages."""
-        if len(self._assertions) <= 1:
+        if self._assertion_count <= 1:
             return
 
-        assertions_without_msg = sum(1 for msg in self._assertion_messages if not msg)
-        threshold = self._analyzer._max_assertions_without_message
+        assertions_without_msg = self._assertions_without_message
+        threshold = self._max_without_message
 
         if assertions_without_msg > threshold:
             self._result.add_issue(
-                Issue(
-                    rule="smells.assertion_roulette",
+                self._issue(
+                    rule=RULE_ASSERTION_ROULETTE,
                     message=(
                         f"Test has {assertions_without_msg} assertions without messages "
                         f"(threshold: {threshold})"
                     ),
                     severity=Severity.WARNING,
-                    file_path=self._test.file_path,
                     line=self._test.line,
-                    test_name=self._test.name,
                     suggestion=(
                         "Add descriptive messages to assertions: "
                         "assert x == y, 'expected x to equal y'"
@@ -217,92 +304,38 @@ class SmellVisitor(ast.NodeVisitor):
 
     def _check_duplicate_assertions(self) -> None:
         """Check for duplicate assertion statements."""
-        seen: dict[str, int] = {}
-        duplicates: list[tuple[int, str]] = []
-
-        for assertion in self._assertions:
-            # Create a normalized representation of the assertion
-            assertion_repr = ast.dump(assertion.test)
-            if assertion_repr in seen:
-                duplicates.append((assertion.lineno, assertion_repr))
-            else:
-                seen[assertion_repr] = assertion.lineno
-
+        duplicates = self._duplicate_lines
         if duplicates:
             self._result.add_issue(
-                Issue(
-                    rule="smells.duplicate_assert",
+                self._issue(
+                    rule=RULE_DUPLICATE_ASSERT,
                     message=f"Test has {len(duplicates)} duplicate assertion(s)",
                     severity=Severity.WARNING,
-                    file_path=self._test.file_path,
-                    line=duplicates[0][0],
-                    test_name=self._test.name,
+                    line=duplicates[0],
                     suggestion="Remove duplicates or verify they test different scenarios",
                 )
             )
 
     def _check_eager_test(self) -> None:
         """Check if test verifies multiple distinct methods/functions."""
-        if not self._analyzer._check_eager_test:
+        if not self._check_eager:
             return
 
-        # Filter out common assertion helpers and built-ins
-        excluded = {
-            "len",
-            "str",
-            "int",
-            "float",
-            "list",
-            "dict",
-            "set",
-            "tuple",
-            "isinstance",
-            "hasattr",
-            "getattr",
-            "type",
-            "id",
-            "repr",
-            "sorted",
-            "reversed",
-            "enumerate",
-            "zip",
-            "map",
-            "filter",
-            "any",
-            "all",
-            "sum",
-            "min",
-            "max",
-            "abs",
-            "round",
-            "assertTrue",
-            "assertFalse",
-            "assertEqual",
-            "assertNotEqual",
-            "assertIn",
-            "assertNotIn",
-            "assertIs",
-            "assertIsNot",
-            "assertIsNone",
-            "assertIsNotNone",
-            "assertRaises",
-        }
-
-        distinct_targets = self._call_targets - excluded
-
-        if len(distinct_targets) > 2:
+        distinct_targets = self._call_targets - _EAGER_EXCLUDED
+        count = len(distinct_targets)
+
+        if count > 2:
+            # Only the first five names are shown, no need to sort them all
             self._result.add_issue(
-                Issue(
-                    rule="smells.eager_test",
+                self._issue(
+                    rule=RULE_EAGER_TEST,
                     message=(
-                        f"Test calls {len(distinct_targets)} distinct methods: "
-                        f"{', '.join(sorted(distinct_targets)[:5])}"
-                        f"{'...' if len(distinct_targets) > 5 else ''}"
+                        f"Test calls {count} distinct methods: "
+                        f"{', '.join(heapq.nsmallest(5, distinct_targets))}"
+                        f"{'...' if count > 5 else ''}"
                     ),
                     severity=Severity.INFO,
-                    file_path=self._test.file_path,
                     line=self._test.line,
-                    test_name=self._test.name,
                     suggestion="Consider splitting into focused tests for each behavior",
                 )
             )
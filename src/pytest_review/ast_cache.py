@@ -0,0 +1,204 @@
+"""Persistent on-disk cache of parsed test module ASTs."""
+
+from __future__ import annotations
+
+import ast
+import contextlib
+import hashlib
+import json
+import os
+import pickle
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+from pytest_review import __version__
+
+# Most recently used modules whose parsed ASTs are kept on disk
+AST_CACHE_ENTRIES = 2048
+
+# Errors raised when reading a missing, unreadable or corrupt entry
+_LOAD_ERRORS = (
+    OSError,
+    EOFError,
+    pickle.UnpicklingError,
+    AttributeError,
+    ImportError,
+    IndexError,
+    ValueError,
+)
+
+
+# Files modified this recently are not recorded in the manifest: a further
+# write within the filesystem's timestamp granularity could leave mtime and
+# size unchanged
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+class AstCache:
+    """Caches parsed modules on disk so unchanged files are never re-parsed.
+
+    Entries are keyed by the SHA-256 of the source bytes, the Python version
+    (AST node layouts differ between releases) and the pytest-review version.
+    A manifest of ``path -> (mtime_ns, size, sha256)`` lets unchanged files
+    skip reading and hashing, much like ``.pyc`` invalidation. Entries
+    beyond ``max_entries`` are removed least recently used first when the
+    cache is saved, and the manifest forgets files that no longer exist.
+    """
+
+    def __init__(self, cache_dir: Path, max_entries: int = AST_CACHE_ENTRIES) -> None:
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._manifest: dict[str, Any] | None = None
+        self._manifest_dirty = False
+        # Entries read this session, and whether any were written
+        self._used: set[Path] = set()
+        self._stored = False
+
+    def _entry_path(self, digest: str) -> Path:
+        """Get the cache file for a source digest."""
+        major, minor = sys.version_info[:2]
+        return self.cache_dir / f"{digest}-py{major}{minor}-{__version__}.pkl"
+
+    @property
+    def manifest_path(self) -> Path:
+        """Location of the file stat manifest."""
+        return self.cache_dir / "manifest.json"
+
+    def _load_manifest(self) -> dict[str, Any]:
+        """Read the manifest on first use; a missing or corrupt one starts empty."""
+        if self._manifest is None:
+            try:
+                data = json.loads(self.manifest_path.read_text())
+            except (OSError, ValueError):
+                data = None
+            self._manifest = data if isinstance(data, dict) else {}
+        return self._manifest
+
+    def _digest(
+        self, path: Path, stat: os.stat_result, source: bytes | None = None
+    ) -> tuple[str, bytes | None]:
+        """Get the source digest, from the manifest when the file is unchanged.
+
+        Returns the digest and the source bytes it was computed from, if any.
+        """
+        manifest = self._load_manifest()
+        key = str(path)
+        known = manifest.get(key)
+        if (
+            isinstance(known, list)
+            and len(known) == 3
+            and known[0] == stat.st_mtime_ns
+            and known[1] == stat.st_size
+        ):
+            return str(known[2]), None
+
+        if source is None:
+            source = path.read_bytes()
+        digest = hashlib.sha256(source).hexdigest()
+        if time.time_ns() - stat.st_mtime_ns > _RACY_WINDOW_NS:
+            manifest[key] = [stat.st_mtime_ns, stat.st_size, digest]
+            self._manifest_dirty = True
+        elif key in manifest:
+            del manifest[key]
+            self._manifest_dirty = True
+        return digest, source
+
+    def load_or_parse(
+        self, path: Path, source: bytes | None = None, stat: os.stat_result | None = None
+    ) -> ast.Module:
+        """Load the AST for a file from the cache, parsing and storing it on a miss.
+
+        Callers that have already read the file, or stat'ed it, can pass the
+        source bytes and stat result so the file isn't read or stat'ed again.
+        """
+        given = source
+        digest, source = self._digest(path, stat if stat is not None else os.stat(path), given)
+        entry = self._entry_path(digest)
+
+        try:
+            with open(entry, "rb") as f:
+                tree = pickle.load(f)
+            if isinstance(tree, ast.Module):
+                self.hits += 1
+                self._used.add(entry)
+                return tree
+        except _LOAD_ERRORS:
+            # Missing, unreadable or corrupt entries are treated as misses
+            pass
+
+        self.misses += 1
+        if source is None:
+            # Known to the manifest but the entry is gone; key it by what is on disk now
+            source = given if given is not None else path.read_bytes()
+            entry = self._entry_path(hashlib.sha256(source).hexdigest())
+        tree = ast.parse(source, filename=str(path))
+        self._store(entry, tree)
+        return tree
+
+    def save(self) -> None:
+        """Write the manifest and evict old entries, ignoring filesystem errors."""
+        self.save_manifest()
+        for entry in self._used:
+            # Mark entries that were read as recently used
+            with contextlib.suppress(OSError):
+                os.utime(entry)
+        if self._stored:
+            self._evict()
+        self._used.clear()
+        self._stored = False
+
+    def save_manifest(self) -> None:
+        """Write the manifest if it changed, ignoring filesystem errors.
+
+        Files that no longer exist are dropped from it first.
+        """
+        manifest = self._manifest
+        if manifest is None:
+            return
+        missing = [key for key in manifest if not os.path.exists(key)]
+        for key in missing:
+            del manifest[key]
+        if missing:
+            self._manifest_dirty = True
+        if not self._manifest_dirty:
+            return
+        tmp = self.manifest_path.with_name(f"manifest.json.{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(self._manifest))
+            os.replace(tmp, self.manifest_path)
+            self._manifest_dirty = False
+        except OSError:
+            tmp.unlink(missing_ok=True)
+
+    def _store(self, entry: Path, tree: ast.Module) -> None:
+        """Write a cache entry atomically, ignoring filesystem errors."""
+        tmp = entry.with_name(f"{entry.name}.{os.getpid()}.tmp")
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "wb") as f:
+                pickle.dump(tree, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, entry)
+            self._stored = True
+        except OSError:
+            tmp.unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        """Remove the least recently used entries beyond ``max_entries``."""
+        try:
+            entries = [(entry.stat().st_mtime_ns, entry) for entry in self.cache_dir.glob("*.pkl")]
+        except OSError:
+            return
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort()
+        for _, entry in entries[: len(entries) - self.max_entries]:
+            entry.unlink(missing_ok=True)
+
+    def stats(self) -> dict[str, int]:
+        """Get hit/miss counters."""
+        return {"hits": self.hits, "misses": self.misses}
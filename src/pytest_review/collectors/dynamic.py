@@ -3,14 +3,17 @@
 from __future__ import annotations
 
 import time
-from dataclasses import dataclass, field
-from typing import Any
+from dataclasses import dataclass
 
+from pytest_review.analyzers.base import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class TestExecutionData:
     """Data collected during test execution."""
 
+    __test__ = False  # Prevent pytest from collecting this as a test class
+
     test_name: str
     node_id: str
     start_time: float = 0.0
@@ -18,10 +21,9 @@ class TestExecutionData:
     duration_ms: float = 0.0
     passed: bool = True
     exception: str | None = None
-    captured_globals_before: dict[str, Any] = field(default_factory=dict)
-    captured_globals_after: dict[str, Any] = field(default_factory=dict)
-    modified_globals: list[str] = field(default_factory=list)
-    fixtures_used: list[str] = field(default_factory=list)
+    # Most tests record neither, so they stay None until written
+    modified_globals: list[str] | None = None
+    fixtures_used: list[str] | None = None
 
 
 class DynamicCollector:
@@ -30,7 +32,8 @@ class DynamicCollector:
     def __init__(self) -> None:
         self._current_test: TestExecutionData | None = None
         self._completed_tests: list[TestExecutionData] = []
-        self._global_snapshots: dict[str, dict[str, Any]] = {}
+        # First completed test with each name, for get_test_by_name
+        self._by_name: dict[str, TestExecutionData] = {}
 
     def start_test(self, node_id: str, test_name: str) -> None:
         """Called when a test starts."""
@@ -53,26 +56,24 @@ class DynamicCollector:
         self._current_test.exception = exception
 
         self._completed_tests.append(self._current_test)
+        self._by_name.setdefault(self._current_test.test_name, self._current_test)
         self._current_test = None
 
     def record_fixtures(self, fixture_names: list[str]) -> None:
         """Record fixtures used by current test."""
         if self._current_test:
-            self._current_test.fixtures_used = fixture_names
+            self._current_test.fixtures_used = list(fixture_names)
 
     def get_completed_tests(self) -> list[TestExecutionData]:
         """Get all completed test execution data."""
         return self._completed_tests
 
     def get_test_by_name(self, test_name: str) -> TestExecutionData | None:
-        """Get execution data for a specific test."""
-        for test in self._completed_tests:
-            if test.test_name == test_name:
-                return test
-        return None
+        """Get execution data for a specific test, the first completed if names repeat."""
+        return self._by_name.get(test_name)
 
     def clear(self) -> None:
         """Clear all collected data."""
         self._current_test = None
         self._completed_tests = []
-        self._global_snapshots = {}
+        self._by_name = {}
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import fnmatch
+import functools
+import re
 import sys
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -13,6 +16,14 @@ else:
     import tomli as tomllib  # type: ignore[import-not-found]
 
 
+@functools.lru_cache(maxsize=32)
+def _load_pyproject(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse a pyproject.toml, once per path and file version."""
+    with open(path, "rb") as f:
+        data: dict[str, Any] = tomllib.load(f)
+    return data
+
+
 @dataclass
 class AnalyzerConfig:
     """Configuration for an individual analyzer."""
@@ -31,6 +42,19 @@ class ReviewConfig:
     analyzers: dict[str, AnalyzerConfig] = field(default_factory=dict)
     ignore_paths: list[str] = field(default_factory=list)
     ignore_rules: list[str] = field(default_factory=list)
+    # Root of the AST and result caches, relative to the project root; None
+    # (the default) or false in pyproject.toml disables them
+    cache_dir: Path | None = None
+    # ignore_paths globs compiled into one alternation
+    _ignore_paths_pattern: re.Pattern[str] | None = field(
+        init=False, repr=False, compare=False, default=None
+    )
+
+    def __post_init__(self) -> None:
+        if self.ignore_paths:
+            self._ignore_paths_pattern = re.compile(
+                "|".join(f"(?:{fnmatch.translate(glob)})" for glob in self.ignore_paths)
+            )
 
     @classmethod
     def from_pyproject(cls, path: Path | None = None) -> ReviewConfig:
@@ -38,12 +62,14 @@ class ReviewConfig:
         if path is None:
             path = Path.cwd() / "pyproject.toml"
 
-        if not path.exists():
+        try:
+            stat = path.stat()
+        except (FileNotFoundError, NotADirectoryError):
             return cls()
 
-        with open(path, "rb") as f:
-            data = tomllib.load(f)
-
+        # Parsed once per session unless the file changes; from_dict copies
+        # what it keeps, so the cached data is never modified
+        data = _load_pyproject(str(path), stat.st_mtime_ns, stat.st_size)
         tool_config = data.get("tool", {}).get("pytest-review", {})
         return cls.from_dict(tool_config)
 
@@ -55,20 +81,23 @@ class ReviewConfig:
 
         for name, analyzer_data in analyzers_data.items():
             if isinstance(analyzer_data, dict):
-                enabled = analyzer_data.pop("enabled", True)
-                analyzers[name] = AnalyzerConfig(enabled=enabled, options=analyzer_data)
+                options = {key: value for key, value in analyzer_data.items() if key != "enabled"}
+                enabled = analyzer_data.get("enabled", True)
+                analyzers[name] = AnalyzerConfig(enabled=enabled, options=options)
             else:
                 analyzers[name] = AnalyzerConfig(enabled=bool(analyzer_data))
 
         ignore_config = data.get("ignore", {})
+        cache_dir = data.get("cache_dir")
 
         return cls(
             enabled=data.get("enabled", True),
             strict=data.get("strict", False),
             min_score=data.get("min_score", 0),
             analyzers=analyzers,
-            ignore_paths=ignore_config.get("paths", []),
-            ignore_rules=ignore_config.get("rules", []),
+            ignore_paths=list(ignore_config.get("paths", [])),
+            ignore_rules=list(ignore_config.get("rules", [])),
+            cache_dir=Path(cache_dir) if cache_dir else None,
         )
 
     def get_analyzer_config(self, name: str) -> AnalyzerConfig:
@@ -80,6 +109,15 @@ class ReviewConfig:
         config = self.get_analyzer_config(name)
         return config.enabled
 
+    def is_rule_enabled(self, rule: str) -> bool:
+        """Check if a rule is enabled (not listed in ignore rules)."""
+        return rule not in self.ignore_rules
+
+    def is_path_ignored(self, path: str) -> bool:
+        """Check if a path, relative to the project root, matches an ignore_paths glob."""
+        pattern = self._ignore_paths_pattern
+        return pattern is not None and pattern.match(path) is not None
+
     def get_analyzer_option(self, analyzer: str, option: str, default: Any = None) -> Any:
         """Get a specific option for an analyzer."""
         config = self.get_analyzer_config(analyzer)
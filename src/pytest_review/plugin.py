@@ -3,12 +3,18 @@
 from __future__ import annotations
 
 import ast
+import os
+import re
 import time
+from collections import deque
+from dataclasses import dataclass
+from importlib.util import decode_source
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pytest
 
+from pytest_review.aggregate import ResultsAggregate, aggregate
 from pytest_review.analyzers import (
     AssertionsAnalyzer,
     ComplexityAnalyzer,
@@ -17,18 +23,22 @@ from pytest_review.analyzers import (
     SmellsAnalyzer,
 )
 from pytest_review.analyzers.base import (
+    FUNCTION_TYPES,
     AnalyzerResult,
     DynamicAnalyzer,
     StaticAnalyzer,
     TestItemInfo,
+    analyze_files,
 )
 from pytest_review.analyzers.isolation import IsolationStaticAnalyzer
 from pytest_review.analyzers.performance import PerformanceAnalyzer
+from pytest_review.ast_cache import AstCache
 from pytest_review.config import ReviewConfig
 from pytest_review.reporters.html import HtmlReporter
 from pytest_review.reporters.json import JsonReporter
 from pytest_review.reporters.terminal import TerminalReporter
-from pytest_review.scoring import ScoringEngine
+from pytest_review.result_cache import ResultCache
+from pytest_review.scoring import ScoreBreakdown, ScoringEngine
 
 if TYPE_CHECKING:
     from _pytest.config import Config
@@ -36,6 +46,74 @@ if TYPE_CHECKING:
     from _pytest.python import Function
     from _pytest.terminal import TerminalReporter as PytestTerminalReporter
 
+# Statements whose bodies can define test functions
+_DEFINITION_SCOPES = (ast.stmt, ast.excepthandler)
+
+# Source lines as the parser splits them: on \r\n, \r or \n only, keeping the ends
+_LINE_PATTERN = re.compile(r"[^\r\n]*(?:\r\n?|\n)|[^\r\n]+\Z")
+
+
+@dataclass
+class _ParsedFile:
+    """A parsed test module shared by every test collected from it."""
+
+    mtime_ns: int
+    size: int
+    tree: ast.Module
+    source: str
+    functions: dict[str, ast.FunctionDef | ast.AsyncFunctionDef]
+    # Functions defined directly in a class body, by (class name, function name)
+    methods: dict[tuple[str, str], ast.FunctionDef | ast.AsyncFunctionDef]
+    # Source lines, split on first use
+    lines: list[str] | None = None
+
+    def segment(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> str:
+        """Get the source of a node, like ``ast.get_source_segment``.
+
+        ``ast.get_source_segment`` splits the whole module into lines on every
+        call; here they are split once per module.
+        """
+        if self.lines is None:
+            self.lines = _LINE_PATTERN.findall(self.source)
+        lines = self.lines
+        start, end = node.lineno - 1, node.end_lineno
+        if end is None or node.end_col_offset is None:
+            return ""
+        end -= 1
+        # Column offsets count UTF-8 bytes
+        if start == end:
+            return lines[start].encode()[node.col_offset : node.end_col_offset].decode()
+        first = lines[start].encode()[node.col_offset :].decode()
+        last = lines[end].encode()[: node.end_col_offset].decode()
+        return "".join([first, *lines[start + 1 : end], last])
+
+
+def _index_functions(
+    tree: ast.Module,
+) -> tuple[
+    dict[str, ast.FunctionDef | ast.AsyncFunctionDef],
+    dict[tuple[str, str], ast.FunctionDef | ast.AsyncFunctionDef],
+]:
+    """Index a module's functions by name and its methods by (class name, name).
+
+    Statements are scanned level by level, so the shallowest function with a
+    name wins. Function bodies and expressions are never entered: pytest only
+    collects functions defined at module or class level.
+    """
+    functions: dict[str, ast.FunctionDef | ast.AsyncFunctionDef] = {}
+    methods: dict[tuple[str, str], ast.FunctionDef | ast.AsyncFunctionDef] = {}
+    queue: deque[ast.AST] = deque([tree])
+    while queue:
+        node = queue.popleft()
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, FUNCTION_TYPES):
+                functions.setdefault(child.name, child)
+                if isinstance(node, ast.ClassDef):
+                    methods.setdefault((node.name, child.name), child)
+            elif isinstance(child, _DEFINITION_SCOPES):
+                queue.append(child)
+    return functions, methods
+
 
 class ReviewPlugin:
     """Main plugin class that coordinates analyzers and reporting."""
@@ -46,9 +124,29 @@ class ReviewPlugin:
         self._static_analyzers: list[StaticAnalyzer] = []
         self._dynamic_analyzers: list[DynamicAnalyzer] = []
         self._results: list[AnalyzerResult] = []
+        # Set once run_analysis has collected every result
+        self._has_errors: bool | None = None
+        self._scoring_engine = ScoringEngine()
+        self._score_breakdown: ScoreBreakdown | None = None
+        self._aggregate: ResultsAggregate | None = None
         self._test_infos: list[TestItemInfo] = []
         self._enabled = self._should_enable(config)
+        # Reporting options, read once
+        self.output_format: str = config.getoption("review_format", default="terminal")
+        self.output_file: str | None = config.getoption("review_output", default=None)
+        self.strict: bool = config.getoption("review_strict", default=False)
+        self.min_score: int = config.getoption("review_min_score", default=0)
+        self.show_cache_stats: bool = config.getoption("review_cache_stats", default=False)
         self._test_start_times: dict[str, float] = {}
+        cache_dir = self.review_config.cache_dir
+        # Caches are only kept when cache_dir is set, relative to the project root
+        self._cache_dir = config.rootpath / cache_dir if cache_dir is not None else None
+        self._ast_cache: AstCache | None = None
+        if self._cache_dir is not None:
+            self._ast_cache = AstCache(self._cache_dir / "ast")
+        self._result_cache: ResultCache | None = None
+        self._parsed_files: dict[Path, _ParsedFile] = {}
+        self._ignored_files: dict[Path, bool] = {}
         # For backwards compatibility
         self._analyzers = self._static_analyzers
 
@@ -99,6 +197,17 @@ class ReviewPlugin:
                 continue
             self.register_analyzer(dynamic_analyzer)
 
+    def is_file_ignored(self, file_path: Path) -> bool:
+        """Check if a test file matches the ignore_paths setting, once per file."""
+        ignored = self._ignored_files.get(file_path)
+        if ignored is None:
+            try:
+                relative = file_path.relative_to(self.pytest_config.rootpath).as_posix()
+            except ValueError:
+                relative = file_path.as_posix()
+            ignored = self._ignored_files[file_path] = self.review_config.is_path_ignored(relative)
+        return ignored
+
     def collect_test_info(self, item: Function) -> TestItemInfo | None:
         """Extract test information from a pytest item."""
         try:
@@ -106,39 +215,98 @@ class ReviewPlugin:
             if file_path is None:
                 return None
 
-            source = file_path.read_text()
-            tree = ast.parse(source)
+            parsed = self._parse_file(file_path)
 
             # Find the test function in the AST
             test_name = item.name
             class_name = item.cls.__name__ if item.cls else None
 
-            for node in ast.walk(tree):
-                if (
-                    isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
-                    and node.name == test_name
-                ):
-                    # Extract just this function's source
-                    func_source = ast.get_source_segment(source, node) or ""
-                    return TestItemInfo(
-                        name=test_name,
-                        file_path=file_path,
-                        line=node.lineno,
-                        node=node,
-                        source=func_source,
-                        class_name=class_name,
-                    )
+            node = None
+            if class_name is not None:
+                node = parsed.methods.get((class_name, test_name))
+            if node is None:
+                # Module-level tests, and tests inherited from another class
+                node = parsed.functions.get(test_name)
+            if node is not None:
+                # Extract just this function's source
+                func_source = parsed.segment(node)
+                return TestItemInfo(
+                    name=test_name,
+                    file_path=file_path,
+                    line=node.lineno,
+                    node=node,
+                    source=func_source,
+                    class_name=class_name,
+                    module=parsed.tree,
+                )
         except (OSError, SyntaxError):
             pass
         return None
 
+    def _parse_file(self, file_path: Path) -> _ParsedFile:
+        """Parse a test module once per session, re-parsing only if it changed on disk."""
+        stat = os.stat(file_path)
+        parsed = self._parsed_files.get(file_path)
+        if parsed is not None and (parsed.mtime_ns, parsed.size) == (
+            stat.st_mtime_ns,
+            stat.st_size,
+        ):
+            return parsed
+
+        # Read the file once for both the AST cache and the test sources
+        source_bytes = file_path.read_bytes()
+        source = decode_source(source_bytes)
+        if self._ast_cache is not None:
+            tree = self._ast_cache.load_or_parse(file_path, source_bytes, stat)
+        else:
+            tree = ast.parse(source_bytes, filename=str(file_path))
+        functions, methods = _index_functions(tree)
+        parsed = _ParsedFile(stat.st_mtime_ns, stat.st_size, tree, source, functions, methods)
+        self._parsed_files[file_path] = parsed
+        return parsed
+
     def run_static_analysis(self) -> None:
         """Run all registered static analyzers on collected tests."""
-        for analyzer in self._static_analyzers:
-            for test_info in self._test_infos:
-                result = analyzer.analyze(test_info)
+        # Each test is walked once for all analyzers, and not at all if its
+        # module is unchanged since a previous run; results are still
+        # reported grouped by analyzer
+        cache = None
+        if self._cache_dir is not None:
+            cache = self._result_cache = ResultCache(
+                self._static_analyzers, self._cache_dir / "results"
+            )
+        test_results: list[list[AnalyzerResult] | None] = []
+        # Indices of the tests still to analyze, by module
+        pending: dict[Path, list[int]] = {}
+        for index, test_info in enumerate(self._test_infos):
+            parsed = self._parsed_files.get(test_info.file_path)
+            cached = None
+            if cache is not None and parsed is not None:
+                cached = cache.get(test_info, parsed.source)
+            test_results.append(cached)
+            if cached is None:
+                pending.setdefault(test_info.file_path, []).append(index)
+
+        groups = [[self._test_infos[index] for index in indices] for indices in pending.values()]
+        analyzed = analyze_files(self._static_analyzers, groups)
+        for indices, group_results in zip(pending.values(), analyzed):
+            for index, results in zip(indices, group_results):
+                test_results[index] = results
+                if cache is None:
+                    continue
+                test_info = self._test_infos[index]
+                parsed = self._parsed_files.get(test_info.file_path)
+                if parsed is not None:
+                    cache.put(test_info, parsed.source, results)
+
+        by_analyzer: list[list[AnalyzerResult]] = [[] for _ in self._static_analyzers]
+        for results_of_test in test_results:
+            for analyzer_results, result in zip(by_analyzer, results_of_test or ()):
                 if result.issues:
-                    self._results.append(result)
+                    analyzer_results.append(result)
+
+        for analyzer_results in by_analyzer:
+            self._results.extend(analyzer_results)
 
     def run_analysis(self) -> None:
         """Run all registered analyzers on collected tests."""
@@ -151,6 +319,10 @@ class ReviewPlugin:
                 if result.issues:
                     self._results.append(result)
 
+        self._has_errors = any(r.has_errors for r in self._results)
+        self._score_breakdown = None
+        self._aggregate = None
+
     def on_test_start(self, node_id: str, test_name: str) -> None:
         """Called when a test starts executing."""
         self._test_start_times[node_id] = time.perf_counter()
@@ -170,21 +342,34 @@ class ReviewPlugin:
 
     def has_errors(self) -> bool:
         """Check if any analyzer found errors."""
-        return any(r.has_errors for r in self._results)
+        if self._has_errors is None:
+            return any(r.has_errors for r in self._results)
+        return self._has_errors
 
     def calculate_score(self) -> float:
         """Calculate overall quality score."""
         if not self._test_infos:
             return 100.0
 
-        scoring_engine = ScoringEngine()
-        return scoring_engine.get_simple_score(self._results, len(self._test_infos))
+        return self._breakdown().total_score
 
     def get_score_breakdown(self) -> dict[str, object]:
         """Get detailed score breakdown."""
-        scoring_engine = ScoringEngine()
-        breakdown = scoring_engine.calculate_score(self._results, len(self._test_infos))
-        return breakdown.to_dict()
+        return self._breakdown().to_dict()
+
+    def get_aggregate(self) -> ResultsAggregate:
+        """Get the issue counts of all results, computed once after analysis has run."""
+        if self._aggregate is None:
+            self._aggregate = aggregate(self._results)
+        return self._aggregate
+
+    def _breakdown(self) -> ScoreBreakdown:
+        """Score the results, once after analysis has run."""
+        if self._score_breakdown is None:
+            self._score_breakdown = self._scoring_engine.calculate_score(
+                self._results, len(self._test_infos), self.get_aggregate()
+            )
+        return self._score_breakdown
 
 
 # Global plugin instance
@@ -238,6 +423,13 @@ def pytest_addoption(parser: Parser) -> None:
         dest="review_only",
         help="Comma-separated list of analyzers to run",
     )
+    group.addoption(
+        "--review-cache-stats",
+        action="store_true",
+        default=False,
+        dest="review_cache_stats",
+        help="Show AST and result cache hit/miss counts",
+    )
 
 
 def pytest_configure(config: Config) -> None:
@@ -251,11 +443,14 @@ def pytest_configure(config: Config) -> None:
     _plugin = ReviewPlugin(config)
 
     # Register plugin if enabled via CLI
-    if config.getoption("review", default=False):
+    if _plugin._enabled:
         _plugin.register_default_analyzers()
         config.pluginmanager.register(_plugin, "review_plugin")
 
 
+# After -k/-m deselection and any reordering by other plugins, so only the
+# tests that will run are reviewed and their modules parsed
+@pytest.hookimpl(trylast=True)  # type: ignore[untyped-decorator]
 def pytest_collection_modifyitems(
     session: pytest.Session, config: Config, items: list[pytest.Item]
 ) -> None:
@@ -267,8 +462,8 @@ def pytest_collection_modifyitems(
 
     for item in items:
         if isinstance(item, pytest.Function):
-            # Skip tests marked with review_skip
-            if item.get_closest_marker("review_skip"):
+            # Skip tests marked with review_skip or in ignored paths
+            if item.get_closest_marker("review_skip") or _plugin.is_file_ignored(item.path):
                 continue
 
             test_info = _plugin.collect_test_info(item)
@@ -315,6 +510,10 @@ def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
 
     # Run all analyzers
     _plugin.run_analysis()
+    if _plugin._ast_cache is not None:
+        _plugin._ast_cache.save()
+    if _plugin._result_cache is not None:
+        _plugin._result_cache.save()
 
 
 def pytest_terminal_summary(
@@ -331,13 +530,13 @@ def pytest_terminal_summary(
     score = _plugin.calculate_score()
 
     # Get output format and file
-    output_format = config.getoption("review_format", default="terminal")
-    output_file = config.getoption("review_output", default=None)
+    output_format = _plugin.output_format
+    output_file = _plugin.output_file
 
     # Handle different output formats
     if output_format == "json":
         json_reporter = JsonReporter()
-        json_reporter.generate_report(results, total_tests, score)
+        json_reporter.generate_report(results, total_tests, score, _plugin.get_aggregate())
 
         if output_file:
             json_reporter.write_to_file(output_file)
@@ -350,36 +549,40 @@ def pytest_terminal_summary(
             terminalreporter._tw.line("\n" + json_reporter.get_json())
 
     elif output_format == "html":
-        html_reporter = HtmlReporter()
-        html_reporter.generate_report(results, total_tests, score)
-
-        if output_file:
-            html_reporter.write_to_file(output_file)
-            terminalreporter._tw.line(
-                f"\npytest-review: HTML report written to {output_file}",
-                green=True,
-            )
-        else:
-            # Default filename for HTML
-            default_path = Path("pytest-review-report.html")
-            html_reporter.write_to_file(default_path)
-            terminalreporter._tw.line(
-                f"\npytest-review: HTML report written to {default_path}",
-                green=True,
-            )
+        # Default filename for HTML
+        html_path = Path(output_file) if output_file else Path("pytest-review-report.html")
+        HtmlReporter().generate_to_file(html_path, results, total_tests, score)
+        terminalreporter._tw.line(
+            f"\npytest-review: HTML report written to {output_file or html_path}",
+            green=True,
+        )
 
     else:
         # Terminal output (default)
         reporter = TerminalReporter(terminalreporter)
         reporter.write_header()
         reporter.write_results(results)
-        reporter.write_summary(results, total_tests)
+        reporter.write_summary(results, total_tests, _plugin.get_aggregate())
         reporter.write_score(score)
         reporter.write_footer()
 
+    if _plugin.show_cache_stats:
+        if _plugin._ast_cache is None:
+            terminalreporter._tw.line("\npytest-review: caches disabled (cache_dir is not set)")
+        else:
+            stats = _plugin._ast_cache.stats()
+            terminalreporter._tw.line(
+                f"\npytest-review: AST cache {stats['hits']} hits, {stats['misses']} misses"
+            )
+        if _plugin._result_cache is not None:
+            stats = _plugin._result_cache.stats()
+            terminalreporter._tw.line(
+                f"pytest-review: result cache {stats['hits']} hits, {stats['misses']} misses"
+            )
+
     # Handle strict mode and min score
-    strict = config.getoption("review_strict", default=False)
-    min_score = config.getoption("review_min_score", default=0)
+    strict = _plugin.strict
+    min_score = _plugin.min_score
 
     if strict and _plugin.has_errors():
         terminalreporter._tw.line(
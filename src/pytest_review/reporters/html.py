@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+import itertools
+from collections import Counter
+from collections.abc import Iterator
 from datetime import datetime, timezone
+from operator import attrgetter
 from pathlib import Path
+from string import Formatter
+from typing import Any
 
-from pytest_review.analyzers.base import AnalyzerResult, Issue, Severity
+from pytest_review.analyzers.base import SEVERITY_RANK, AnalyzerResult, Issue, Severity
+from pytest_review.scoring import score_to_grade
 
 HTML_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
@@ -314,6 +321,33 @@ HTML_TEMPLATE = """<!DOCTYPE html>
 </html>
 """
 
+# HTML_TEMPLATE split once into (literal text, field name, format spec) so
+# reports don't re-parse its many escaped braces
+_TEMPLATE_PARTS = [
+    (literal, field, spec or "") for literal, field, spec, _ in Formatter().parse(HTML_TEMPLATE)
+]
+
+
+def _iter_template(fields: dict[str, Any]) -> Iterator[str]:
+    """Yield HTML_TEMPLATE in chunks, filled in from fields.
+
+    A field given as an iterator is inserted fragment by fragment, so large
+    sections can be streamed instead of joined first.
+    """
+    for literal, field, spec in _TEMPLATE_PARTS:
+        yield literal
+        if field is not None:
+            value = fields[field]
+            if isinstance(value, Iterator):
+                yield from value
+            else:
+                yield format(value, spec)
+
+
+def _render_template(**fields: Any) -> str:
+    """Fill in HTML_TEMPLATE, like ``HTML_TEMPLATE.format(**fields)``."""
+    return "".join(_iter_template(fields))
+
 
 class HtmlReporter:
     """Generates HTML reports from analysis results."""
@@ -324,6 +358,9 @@ class HtmlReporter:
         Severity.INFO: "i",
     }
 
+    # CSS class of each severity's badge
+    _SEVERITY_CLASSES = {severity: f"severity-{severity.value}" for severity in Severity}
+
     def __init__(self) -> None:
         self._html: str = ""
 
@@ -334,30 +371,57 @@ class HtmlReporter:
         score: float,
     ) -> str:
         """Generate an HTML report from analysis results."""
+        self._html = "".join(_iter_template(self._report_fields(results, total_tests, score)))
+        return self._html
+
+    def generate_to_file(
+        self,
+        path: Path | str,
+        results: list[AnalyzerResult],
+        total_tests: int,
+        score: float,
+    ) -> None:
+        """Generate an HTML report straight into a file.
+
+        The report is written as it is rendered, so it is never held in
+        memory as a whole; ``get_html`` is not available afterwards.
+        """
+        fields = self._report_fields(results, total_tests, score)
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w") as f:
+            f.writelines(_iter_template(fields))
+
+    def _report_fields(
+        self,
+        results: list[AnalyzerResult],
+        total_tests: int,
+        score: float,
+    ) -> dict[str, Any]:
+        """Compute the template fields, with the issue list rendered lazily."""
         # Collect all issues
         all_issues: list[Issue] = []
         for result in results:
             all_issues.extend(result.issues)
 
         # Sort by severity (errors first)
-        all_issues.sort(key=lambda i: i.severity, reverse=True)
+        all_issues.sort(key=lambda i: SEVERITY_RANK[i.severity], reverse=True)
 
         # Count by severity
-        error_count = sum(1 for i in all_issues if i.severity == Severity.ERROR)
-        warning_count = sum(1 for i in all_issues if i.severity == Severity.WARNING)
-        info_count = sum(1 for i in all_issues if i.severity == Severity.INFO)
+        severity_counts = Counter(map(attrgetter("severity"), all_issues))
+        error_count = severity_counts[Severity.ERROR]
+        warning_count = severity_counts[Severity.WARNING]
+        info_count = severity_counts[Severity.INFO]
 
-        # Count by rule
-        rule_counts: dict[str, int] = {}
-        for issue in all_issues:
-            rule_counts[issue.rule] = rule_counts.get(issue.rule, 0) + 1
+        # Count by rule, in order of first occurrence
+        rule_counts = Counter(map(attrgetter("rule"), all_issues))
 
-        # Generate issues HTML
+        # Generate issues HTML, one fragment per issue as the report is written
+        issues_html: str | Iterator[str]
         if all_issues:
-            issues_html = '<ul class="issue-list">'
-            for issue in all_issues:
-                issues_html += self._render_issue(issue)
-            issues_html += "</ul>"
+            issues_html = itertools.chain(
+                ('<ul class="issue-list">',), map(self._render_issue, all_issues), ("</ul>",)
+            )
         else:
             issues_html = """
             <div class="empty-state">
@@ -368,38 +432,38 @@ class HtmlReporter:
 
         # Generate rules HTML
         if rule_counts:
-            rules_html = ""
-            for rule, count in sorted(rule_counts.items(), key=lambda x: -x[1]):
-                rules_html += f"""
+            rules_html = "".join(
+                f"""
                 <div class="rule-item">
                     <span class="rule-name">{self._escape(rule)}</span>
                     <span class="rule-count">{count}</span>
                 </div>
                 """
+                for rule, count in rule_counts.most_common()
+            )
         else:
             rules_html = '<p style="color: var(--color-muted);">No issues to categorize.</p>'
 
-        grade = self._score_to_grade(score)
-
-        self._html = HTML_TEMPLATE.format(
-            timestamp=datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC"),
-            score=score,
-            grade=grade,
-            grade_lower=grade.lower(),
-            tests_analyzed=total_tests,
-            total_issues=len(all_issues),
-            error_count=error_count,
-            warning_count=warning_count,
-            info_count=info_count,
-            issues_html=issues_html,
-            rules_html=rules_html,
-        )
-
-        return self._html
+        grade = score_to_grade(score)
+
+        return {
+            "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC"),
+            "score": score,
+            "grade": grade,
+            "grade_lower": grade.lower(),
+            "tests_analyzed": total_tests,
+            "total_issues": len(all_issues),
+            "error_count": error_count,
+            "warning_count": warning_count,
+            "info_count": info_count,
+            "issues_html": issues_html,
+            "rules_html": rules_html,
+        }
 
     def _render_issue(self, issue: Issue) -> str:
         """Render a single issue as HTML."""
-        severity_class = f"severity-{issue.severity.value}"
+        escape = self._escape
+        severity_class = self._SEVERITY_CLASSES[issue.severity]
         symbol = self.SEVERITY_SYMBOLS.get(issue.severity, "?")
 
         location = ""
@@ -407,21 +471,20 @@ class HtmlReporter:
             location = str(issue.file_path)
             if issue.line:
                 location += f":{issue.line}"
+        if issue.test_name:
+            location += f" [{issue.test_name}]"
 
         suggestion_html = ""
         if issue.suggestion:
-            escaped = self._escape(issue.suggestion)
-            suggestion_html = f'<div class="issue-suggestion">{escaped}</div>'
-
-        test_name = f" [{issue.test_name}]" if issue.test_name else ""
+            suggestion_html = f'<div class="issue-suggestion">{escape(issue.suggestion)}</div>'
 
         return f"""
         <li class="issue-item">
             <div class="issue-severity {severity_class}">{symbol}</div>
             <div class="issue-content">
-                <div class="issue-message">{self._escape(issue.message)}</div>
-                <div class="issue-location">{self._escape(location)}{self._escape(test_name)}</div>
-                <div class="issue-rule">{self._escape(issue.rule)}</div>
+                <div class="issue-message">{escape(issue.message)}</div>
+                <div class="issue-location">{escape(location)}</div>
+                <div class="issue-rule">{escape(issue.rule)}</div>
                 {suggestion_html}
             </div>
         </li>
@@ -438,19 +501,6 @@ class HtmlReporter:
             .replace("'", "&#39;")
         )
 
-    @staticmethod
-    def _score_to_grade(score: float) -> str:
-        """Convert numeric score to letter grade."""
-        if score >= 90:
-            return "A"
-        if score >= 80:
-            return "B"
-        if score >= 70:
-            return "C"
-        if score >= 60:
-            return "D"
-        return "F"
-
     def write_to_file(self, path: Path | str) -> None:
         """Write the report to a file."""
         if not self._html:
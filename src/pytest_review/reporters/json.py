@@ -3,12 +3,22 @@
 from __future__ import annotations
 
 import json
-from dataclasses import asdict, dataclass, field
+import os
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from pytest_review.analyzers.base import AnalyzerResult, Issue, Severity
+from pytest_review.aggregate import ResultsAggregate, aggregate
+from pytest_review.analyzers.base import AnalyzerResult, Issue
+from pytest_review.scoring import score_to_grade
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    _HAVE_ORJSON = False
+else:
+    _HAVE_ORJSON = True
 
 
 @dataclass
@@ -27,13 +37,44 @@ class ReviewReport:
     by_rule: dict[str, int] = field(default_factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary."""
-        return asdict(self)
+        """Convert to dictionary.
+
+        The fields already hold plain data, so they are returned as they are
+        rather than deep-copied by ``dataclasses.asdict``.
+        """
+        return {
+            "version": self.version,
+            "generated_at": self.generated_at,
+            "summary": self.summary,
+            "score": self.score,
+            "grade": self.grade,
+            "tests_analyzed": self.tests_analyzed,
+            "issues": self.issues,
+            "by_analyzer": self.by_analyzer,
+            "by_severity": self.by_severity,
+            "by_rule": self.by_rule,
+        }
 
     def to_json(self, indent: int = 2) -> str:
         """Convert to JSON string."""
+        if indent == 2 and _HAVE_ORJSON:
+            return self.to_json_bytes().decode()
         return json.dumps(self.to_dict(), indent=indent, default=str)
 
+    def to_json_bytes(self) -> bytes:
+        """Convert to JSON indented by two spaces, encoded as UTF-8.
+
+        Uses orjson when it is installed, which encodes straight to bytes
+        without building a string first.
+        """
+        if _HAVE_ORJSON:
+            return orjson.dumps(
+                self.to_dict(),
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            )
+        return json.dumps(self.to_dict(), indent=2, default=str).encode()
+
 
 class JsonReporter:
     """Generates JSON reports from analysis results."""
@@ -46,57 +87,57 @@ class JsonReporter:
         results: list[AnalyzerResult],
         total_tests: int,
         score: float,
+        aggregated: ResultsAggregate | None = None,
     ) -> ReviewReport:
-        """Generate a complete report from analysis results."""
+        """Generate a complete report from analysis results.
+
+        ``aggregated`` can pass in the issue counts of ``results`` if the
+        caller already has them.
+        """
         report = ReviewReport(
             generated_at=datetime.now(timezone.utc).isoformat(),
             tests_analyzed=total_tests,
             score=score,
-            grade=self._score_to_grade(score),
+            grade=score_to_grade(score),
         )
 
-        # Collect all issues
-        all_issues: list[Issue] = []
-        for result in results:
-            all_issues.extend(result.issues)
-
-        # Convert issues to dicts
-        report.issues = [self._issue_to_dict(issue) for issue in all_issues]
-
-        # Count by severity
-        report.by_severity = {
-            "error": sum(1 for i in all_issues if i.severity == Severity.ERROR),
-            "warning": sum(1 for i in all_issues if i.severity == Severity.WARNING),
-            "info": sum(1 for i in all_issues if i.severity == Severity.INFO),
-        }
-
-        # Count by rule
-        rule_counts: dict[str, int] = {}
-        for issue in all_issues:
-            rule_counts[issue.rule] = rule_counts.get(issue.rule, 0) + 1
-        report.by_rule = rule_counts
+        if aggregated is None:
+            aggregated = aggregate(results)
 
-        # Group by analyzer
+        # Each issue is converted once, and the same dict is listed both in
+        # the report and under its analyzer
+        issues: list[dict[str, Any]] = []
         analyzer_data: dict[str, dict[str, Any]] = {}
+        issue_to_dict = self._issue_to_dict
         for result in results:
             name = result.analyzer_name
-            if name not in analyzer_data:
-                analyzer_data[name] = {
+            data = analyzer_data.get(name)
+            if data is None:
+                data = analyzer_data[name] = {
                     "issue_count": 0,
                     "issues": [],
                     "metadata": {},
                 }
-            analyzer_data[name]["issue_count"] += result.issue_count
-            analyzer_data[name]["issues"].extend([self._issue_to_dict(i) for i in result.issues])
+            data["issue_count"] += result.issue_count
+            analyzer_issues = data["issues"]
+            for issue in result.issues:
+                issue_dict = issue_to_dict(issue)
+                issues.append(issue_dict)
+                analyzer_issues.append(issue_dict)
             # Merge metadata
+            metadata = data["metadata"]
             for key, value in result.metadata.items():
-                if key not in analyzer_data[name]["metadata"]:
-                    analyzer_data[name]["metadata"][key] = value
+                if key not in metadata:
+                    metadata[key] = value
+
+        report.issues = issues
+        report.by_severity = aggregated.by_severity
+        report.by_rule = dict(aggregated.by_rule)
         report.by_analyzer = analyzer_data
 
         # Summary
         report.summary = {
-            "total_issues": len(all_issues),
+            "total_issues": len(issues),
             "errors": report.by_severity["error"],
             "warnings": report.by_severity["warning"],
             "info": report.by_severity["info"],
@@ -109,7 +150,8 @@ class JsonReporter:
         self._report = report
         return report
 
-    def _issue_to_dict(self, issue: Issue) -> dict[str, Any]:
+    @staticmethod
+    def _issue_to_dict(issue: Issue) -> dict[str, Any]:
         """Convert an Issue to a dictionary."""
         return {
             "rule": issue.rule,
@@ -121,27 +163,22 @@ class JsonReporter:
             "suggestion": issue.suggestion,
         }
 
-    @staticmethod
-    def _score_to_grade(score: float) -> str:
-        """Convert numeric score to letter grade."""
-        if score >= 90:
-            return "A"
-        if score >= 80:
-            return "B"
-        if score >= 70:
-            return "C"
-        if score >= 60:
-            return "D"
-        return "F"
-
     def write_to_file(self, path: Path | str) -> None:
-        """Write the report to a file."""
+        """Write the report to a file, replacing it atomically."""
         if self._report is None:
             raise ValueError("No report generated. Call generate_report first.")
 
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(self._report.to_json())
+        # Write to a temporary file and move it into place, so that readers
+        # and concurrent writers (e.g. xdist workers) never see a partial report
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            tmp.write_bytes(self._report.to_json_bytes())
+            os.replace(tmp, path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
 
     def get_json(self) -> str:
         """Get the report as a JSON string."""
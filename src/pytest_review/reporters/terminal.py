@@ -4,6 +4,10 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from pytest_review.aggregate import ResultsAggregate, aggregate
+from pytest_review.analyzers.base import SEVERITY_RANK
+from pytest_review.scoring import score_to_grade
+
 if TYPE_CHECKING:
     from _pytest.terminal import TerminalReporter as PytestTerminalReporter
 
@@ -72,7 +76,7 @@ class TerminalReporter:
         # Sort by severity (errors first) then by file/line
         all_issues.sort(
             key=lambda i: (
-                i.severity,
+                SEVERITY_RANK[i.severity],
                 str(i.file_path) if i.file_path else "",
                 i.line or 0,
             ),
@@ -82,11 +86,22 @@ class TerminalReporter:
         for issue in all_issues:
             self.write_issue(issue)
 
-    def write_summary(self, results: list[AnalyzerResult], total_tests: int) -> None:
-        """Write summary statistics."""
-        error_count = sum(1 for r in results for i in r.issues if i.severity.value == "error")
-        warning_count = sum(1 for r in results for i in r.issues if i.severity.value == "warning")
-        info_count = sum(1 for r in results for i in r.issues if i.severity.value == "info")
+    def write_summary(
+        self,
+        results: list[AnalyzerResult],
+        total_tests: int,
+        aggregated: ResultsAggregate | None = None,
+    ) -> None:
+        """Write summary statistics.
+
+        ``aggregated`` can pass in the issue counts of ``results`` if the
+        caller already has them.
+        """
+        if aggregated is None:
+            aggregated = aggregate(results)
+        error_count = aggregated.error_count
+        warning_count = aggregated.warning_count
+        info_count = aggregated.info_count
 
         self._tw.sep("-", "Summary")
         self._tw.line(f"  Tests analyzed: {total_tests}")
@@ -108,7 +123,7 @@ class TerminalReporter:
 
     def write_score(self, score: float) -> None:
         """Write the overall quality score."""
-        grade = self._score_to_grade(score)
+        grade = score_to_grade(score)
 
         self._tw.line()
         self._tw.write("  Overall Score: ", bold=True)
@@ -116,19 +131,6 @@ class TerminalReporter:
         color = "green" if score >= 80 else "yellow" if score >= 60 else "red"
         self._tw.line(f"{score:.1f}/100 ({grade})", **{color: True, "bold": True})
 
-    @staticmethod
-    def _score_to_grade(score: float) -> str:
-        """Convert numeric score to letter grade."""
-        if score >= 90:
-            return "A"
-        if score >= 80:
-            return "B"
-        if score >= 70:
-            return "C"
-        if score >= 60:
-            return "D"
-        return "F"
-
     def write_footer(self) -> None:
         """Write the closing separator."""
         self._tw.sep("=")
@@ -0,0 +1,190 @@
+"""Persistent on-disk cache of static analysis results."""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import hashlib
+import os
+import pickle
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+import pytest_review
+from pytest_review import __version__
+from pytest_review.analyzers.base import (
+    AnalyzerResult,
+    StaticAnalyzer,
+    TestItemInfo,
+    analyze_test,
+)
+
+# Most recently used modules whose results are kept on disk
+RESULT_CACHE_ENTRIES = 2048
+
+
+@functools.lru_cache(maxsize=8)
+def _code_digest(files: frozenset[Path]) -> str:
+    """Digest the path, mtime and size of each source file, once per process."""
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sorted(files):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        digest.update(f"{path}\0{stat.st_mtime_ns}\0{stat.st_size}\0".encode())
+    return digest.hexdigest()
+
+
+def _code_version(analyzers: Sequence[StaticAnalyzer]) -> str:
+    """Fingerprint the code that analysis results depend on.
+
+    Covers every pytest-review module and the modules defining the given
+    analyzers, so editing an analyzer (e.g. in an editable install)
+    invalidates cached results without a version bump.
+    """
+    files = set(Path(pytest_review.__file__).parent.rglob("*.py"))
+    for analyzer in analyzers:
+        module = sys.modules.get(type(analyzer).__module__)
+        filename = getattr(module, "__file__", None)
+        if filename:
+            files.add(Path(filename))
+    return _code_digest(frozenset(files))
+
+
+class ResultCache:
+    """Caches static analysis results on disk so unchanged modules are never analyzed again.
+
+    An entry holds the results of every analyzed test in one module. Entries
+    are keyed by a BLAKE2 digest of the module source and path, the analyzers
+    and their settings, the Python and pytest-review versions and the
+    analyzer code (see ``_code_version``). Entries
+    beyond ``max_entries`` are removed least recently used first when the
+    cache is saved.
+    """
+
+    def __init__(
+        self,
+        analyzers: Sequence[StaticAnalyzer],
+        cache_dir: Path,
+        max_entries: int = RESULT_CACHE_ENTRIES,
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._analyzers = list(analyzers)
+        major, minor = sys.version_info[:2]
+        self._settings = repr(
+            (
+                tuple(analyzer.cache_key for analyzer in analyzers),
+                major,
+                minor,
+                __version__,
+                _code_version(analyzers),
+            )
+        ).encode()
+        # Entry name for each module, with the source it was computed from
+        self._names: dict[Path, tuple[str, str]] = {}
+        self._entries: dict[str, dict[tuple[Any, ...], list[AnalyzerResult]]] = {}
+        self._dirty: set[str] = set()
+
+    def _entry_name(self, path: Path, source: str) -> str:
+        """Get the entry name for a module, hashing its source once per session."""
+        known = self._names.get(path)
+        if known is not None and known[1] is source:
+            return known[0]
+
+        digest = hashlib.blake2b(self._settings, digest_size=16)
+        digest.update(str(path).encode())
+        digest.update(b"\0")
+        digest.update(source.encode())
+        name = digest.hexdigest()
+        self._names[path] = (name, source)
+        return name
+
+    def _entry_path(self, name: str) -> Path:
+        return self.cache_dir / f"{name}.pkl"
+
+    def _load(self, name: str) -> dict[tuple[Any, ...], list[AnalyzerResult]]:
+        """Load an entry on first use; a missing or corrupt one starts empty."""
+        entry = self._entries.get(name)
+        if entry is None:
+            try:
+                with open(self._entry_path(name), "rb") as f:
+                    entry = pickle.load(f)
+            except Exception:
+                # Missing, unreadable or corrupt entries are treated as empty
+                entry = None
+            if not isinstance(entry, dict):
+                entry = {}
+            self._entries[name] = entry
+        return entry
+
+    def get(self, test: TestItemInfo, module_source: str) -> list[AnalyzerResult] | None:
+        """Get the cached results for a test, or None on a miss.
+
+        ``module_source`` is the source of the whole module the test came from.
+        """
+        entry = self._load(self._entry_name(test.file_path, module_source))
+        results = entry.get((test.name, test.class_name, test.line))
+        if results is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return results
+
+    def put(self, test: TestItemInfo, module_source: str, results: list[AnalyzerResult]) -> None:
+        """Store the results for a test, to be written by ``save``."""
+        name = self._entry_name(test.file_path, module_source)
+        self._load(name)[(test.name, test.class_name, test.line)] = results
+        self._dirty.add(name)
+
+    def analyze(self, test: TestItemInfo, module_source: str) -> list[AnalyzerResult]:
+        """Get the results for a test, analyzing and storing them on a miss."""
+        results = self.get(test, module_source)
+        if results is None:
+            results = analyze_test(self._analyzers, test)
+            self.put(test, module_source, results)
+        return results
+
+    def save(self) -> None:
+        """Write changed entries and evict old ones, ignoring filesystem errors."""
+        for name in self._dirty:
+            self._store(self._entry_path(name), self._entries[name])
+        for name in self._entries.keys() - self._dirty:
+            # Mark entries that were read as recently used
+            with contextlib.suppress(OSError):
+                os.utime(self._entry_path(name))
+        if self._dirty:
+            self._evict()
+        self._dirty.clear()
+
+    def _store(self, entry: Path, results: dict[tuple[Any, ...], list[AnalyzerResult]]) -> None:
+        """Write a cache entry atomically, ignoring filesystem errors."""
+        tmp = entry.with_name(f"{entry.name}.{os.getpid()}.tmp")
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "wb") as f:
+                pickle.dump(results, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, entry)
+        except (OSError, pickle.PicklingError):
+            tmp.unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        """Remove the least recently used entries beyond ``max_entries``."""
+        try:
+            entries = [(entry.stat().st_mtime_ns, entry) for entry in self.cache_dir.glob("*.pkl")]
+        except OSError:
+            return
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort()
+        for _, entry in entries[: len(entries) - self.max_entries]:
+            entry.unlink(missing_ok=True)
+
+    def stats(self) -> dict[str, int]:
+        """Get hit/miss counters."""
+        return {"hits": self.hits, "misses": self.misses}
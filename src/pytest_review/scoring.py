@@ -2,11 +2,22 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from typing import Any
 
+from pytest_review.aggregate import ResultsAggregate, aggregate
 from pytest_review.analyzers.base import AnalyzerResult, Severity
 
+# Lowest score for each letter grade above F, in ascending order
+GRADE_THRESHOLDS = (60.0, 70.0, 80.0, 90.0)
+_GRADES = "FDCBA"
+
+
+def score_to_grade(score: float) -> str:
+    """Convert numeric score to letter grade."""
+    return _GRADES[bisect_right(GRADE_THRESHOLDS, score)]
+
 
 @dataclass
 class CategoryScore:
@@ -19,6 +30,16 @@ class CategoryScore:
     issue_count: int = 0
     details: dict[str, Any] = field(default_factory=dict)
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary, without the details."""
+        return {
+            "name": self.name,
+            "weight": self.weight,
+            "raw_score": self.raw_score,
+            "weighted_score": self.weighted_score,
+            "issue_count": self.issue_count,
+        }
+
 
 @dataclass
 class ScoreBreakdown:
@@ -44,16 +65,7 @@ class ScoreBreakdown:
             "error_count": self.error_count,
             "warning_count": self.warning_count,
             "info_count": self.info_count,
-            "categories": [
-                {
-                    "name": c.name,
-                    "weight": c.weight,
-                    "raw_score": c.raw_score,
-                    "weighted_score": c.weighted_score,
-                    "issue_count": c.issue_count,
-                }
-                for c in self.categories
-            ],
+            "categories": [c.to_dict() for c in self.categories],
             "penalties": [{"reason": p[0], "amount": p[1]} for p in self.penalties],
         }
 
@@ -103,8 +115,13 @@ class ScoringEngine:
         self,
         results: list[AnalyzerResult],
         total_tests: int,
+        aggregated: ResultsAggregate | None = None,
     ) -> ScoreBreakdown:
-        """Calculate the overall quality score."""
+        """Calculate the overall quality score.
+
+        ``aggregated`` can pass in the issue counts of ``results`` if the
+        caller already has them.
+        """
         self._results = results
         self._total_tests = total_tests
 
@@ -115,31 +132,26 @@ class ScoringEngine:
             return breakdown
 
         # Count issues by severity
-        for result in results:
-            for issue in result.issues:
-                breakdown.total_issues += 1
-                if issue.severity == Severity.ERROR:
-                    breakdown.error_count += 1
-                elif issue.severity == Severity.WARNING:
-                    breakdown.warning_count += 1
-                else:
-                    breakdown.info_count += 1
+        if aggregated is None:
+            aggregated = aggregate(results)
+        breakdown.total_issues = aggregated.total_issues
+        breakdown.error_count = aggregated.error_count
+        breakdown.warning_count = aggregated.warning_count
+        breakdown.info_count = aggregated.info_count
 
         # Calculate category scores
-        category_issues = self._group_by_category()
+        category_counts = self._accumulate_categories(aggregated)
         for category_name, weight in self.CATEGORY_WEIGHTS.items():
-            issues = category_issues.get(category_name, [])
             category_score = self._calculate_category_score(
-                category_name, weight, issues, total_tests
+                category_name, weight, category_counts[category_name], total_tests
             )
             breakdown.categories.append(category_score)
 
-        # Apply critical penalties
-        for result in results:
-            for issue in result.issues:
-                if issue.rule in self.CRITICAL_PENALTIES:
-                    penalty = self.CRITICAL_PENALTIES[issue.rule]
-                    breakdown.penalties.append((issue.rule, penalty))
+        # Apply critical penalties, one per issue
+        for rule, count in aggregated.by_rule.items():
+            penalty = self.CRITICAL_PENALTIES.get(rule)
+            if penalty is not None:
+                breakdown.penalties.extend([(rule, penalty)] * count)
 
         # Calculate total score
         weighted_sum = sum(c.weighted_score for c in breakdown.categories)
@@ -150,17 +162,18 @@ class ScoringEngine:
 
         return breakdown
 
-    def _group_by_category(self) -> dict[str, list[tuple[AnalyzerResult, Any]]]:
-        """Group results by category."""
-        categories: dict[str, list[tuple[AnalyzerResult, Any]]] = {
-            name: [] for name in self.CATEGORY_WEIGHTS
-        }
+    def _accumulate_categories(
+        self, aggregated: ResultsAggregate
+    ) -> dict[str, dict[Severity, int]]:
+        """Count issues per severity for each category."""
+        categories = {name: dict.fromkeys(Severity, 0) for name in self.CATEGORY_WEIGHTS}
 
-        for result in self._results:
-            category = self.ANALYZER_CATEGORIES.get(result.analyzer_name)
+        for analyzer_name, counts in aggregated.by_analyzer.items():
+            category = self.ANALYZER_CATEGORIES.get(analyzer_name)
             if category:
-                for issue in result.issues:
-                    categories[category].append((result, issue))
+                totals = categories[category]
+                for severity, count in counts.items():
+                    totals[severity] += count
 
         return categories
 
@@ -168,21 +181,21 @@ class ScoringEngine:
         self,
         category_name: str,
         weight: float,
-        issues: list[tuple[AnalyzerResult, Any]],
+        counts: dict[Severity, int],
         total_tests: int,
     ) -> CategoryScore:
-        """Calculate score for a single category."""
+        """Calculate score for a single category from its issue counts."""
         category = CategoryScore(name=category_name, weight=weight)
-        category.issue_count = len(issues)
+        category.issue_count = sum(counts.values())
 
-        if not issues:
+        if not category.issue_count:
             category.raw_score = 100.0
         else:
             # Calculate penalty based on issues
-            total_penalty = 0.0
-            for _, issue in issues:
-                penalty = self.SEVERITY_PENALTIES.get(issue.severity, 0)
-                total_penalty += penalty
+            total_penalty = sum(
+                count * self.SEVERITY_PENALTIES.get(severity, 0)
+                for severity, count in counts.items()
+            )
 
             # Normalize penalty by number of tests
             normalized_penalty = total_penalty / total_tests if total_tests > 0 else 0
@@ -194,21 +207,14 @@ class ScoringEngine:
     @staticmethod
     def _score_to_grade(score: float) -> str:
         """Convert numeric score to letter grade."""
-        if score >= 90:
-            return "A"
-        if score >= 80:
-            return "B"
-        if score >= 70:
-            return "C"
-        if score >= 60:
-            return "D"
-        return "F"
+        return score_to_grade(score)
 
     def get_simple_score(
         self,
         results: list[AnalyzerResult],
         total_tests: int,
+        aggregated: ResultsAggregate | None = None,
     ) -> float:
         """Get a simple numeric score (for backwards compatibility)."""
-        breakdown = self.calculate_score(results, total_tests)
+        breakdown = self.calculate_score(results, total_tests, aggregated)
         return breakdown.total_score
@@ -0,0 +1,60 @@
+"""Tests for the shared issue counts."""
+
+from __future__ import annotations
+
+from pytest_review.aggregate import ResultsAggregate, aggregate
+from pytest_review.analyzers.base import AnalyzerResult, Issue, Severity
+from pytest_review.scoring import ScoringEngine
+
+
+class TestAggregate:
+    def test_counts_by_severity_rule_and_analyzer(self) -> None:
+        results = [
+            AnalyzerResult(
+                analyzer_name="assertions",
+                issues=[
+                    Issue("assertions.missing", "msg", Severity.ERROR),
+                    Issue("assertions.trivial", "msg", Severity.WARNING),
+                ],
+            ),
+            AnalyzerResult(
+                analyzer_name="naming",
+                issues=[Issue("naming.too_short", "msg", Severity.INFO)],
+            ),
+            AnalyzerResult(
+                analyzer_name="assertions",
+                issues=[Issue("assertions.missing", "msg", Severity.ERROR)],
+            ),
+        ]
+
+        counts = aggregate(results)
+
+        assert counts.by_severity == {"error": 2, "warning": 1, "info": 1}
+        assert counts.total_issues == 4
+        assert list(counts.by_rule.items()) == [
+            ("assertions.missing", 2),
+            ("assertions.trivial", 1),
+            ("naming.too_short", 1),
+        ]
+        assert counts.by_analyzer["assertions"][Severity.ERROR] == 2
+        assert counts.by_analyzer["naming"][Severity.INFO] == 1
+
+    def test_empty_results(self) -> None:
+        assert aggregate([]) == ResultsAggregate()
+
+    def test_scoring_with_shared_counts_matches(self) -> None:
+        results = [
+            AnalyzerResult(
+                analyzer_name="assertions",
+                issues=[
+                    Issue("assertions.trivial", "msg", Severity.ERROR),
+                    Issue("assertions.missing", "msg", Severity.ERROR),
+                ],
+            )
+        ]
+        engine = ScoringEngine()
+
+        shared = engine.calculate_score(results, total_tests=2, aggregated=aggregate(results))
+        computed = engine.calculate_score(results, total_tests=2)
+
+        assert shared == computed
@@ -3,14 +3,34 @@
 from __future__ import annotations
 
 import ast
+import os
+import sys
+from dataclasses import replace
 from pathlib import Path
+from typing import Any, Callable
 
+import pytest
+
+from pytest_review.analyzers import (
+    AssertionsAnalyzer,
+    ComplexityAnalyzer,
+    IsolationStaticAnalyzer,
+    NamingAnalyzer,
+    PatternsAnalyzer,
+    SmellsAnalyzer,
+)
 from pytest_review.analyzers.base import (
     AnalyzerResult,
+    CompositeVisitor,
     Issue,
+    NodeHandler,
     Severity,
     StaticAnalyzer,
     TestItemInfo,
+    analyze_files,
+    analyze_test,
+    clear_result_cache,
+    structure_key,
 )
 from pytest_review.config import ReviewConfig
 
@@ -26,6 +46,16 @@ class TestSeverity:
         assert Severity.WARNING < Severity.ERROR
         assert not Severity.ERROR < Severity.INFO
 
+    def test_sorting(self) -> None:
+        severities = [Severity.ERROR, Severity.INFO, Severity.WARNING, Severity.INFO]
+        assert sorted(severities) == [
+            Severity.INFO,
+            Severity.INFO,
+            Severity.WARNING,
+            Severity.ERROR,
+        ]
+        assert max(severities) is Severity.ERROR
+
 
 class TestIssue:
     def test_basic_issue(self) -> None:
@@ -81,10 +111,16 @@ class TestIssue:
 
 
 class TestAnalyzerResult:
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10")
+    def test_uses_slots(self) -> None:
+        result = AnalyzerResult(analyzer_name="test")
+        assert not hasattr(result, "__dict__")
+        assert not hasattr(Issue("r1", "msg", Severity.INFO), "__dict__")
+
     def test_default_values(self) -> None:
         result = AnalyzerResult(analyzer_name="test")
         assert result.analyzer_name == "test"
-        assert result.issues == []
+        assert result.issues == ()
         assert result.score == 100.0
         assert result.metadata == {}
 
@@ -108,6 +144,36 @@ class TestAnalyzerResult:
         result.add_issue(Issue("r2", "msg", Severity.WARNING))
         assert result.has_warnings is True
 
+    def test_add_issue_does_not_share_storage(self) -> None:
+        first = AnalyzerResult(analyzer_name="first")
+        second = AnalyzerResult(analyzer_name="second")
+
+        first.add_issue(Issue("r1", "msg", Severity.INFO))
+
+        assert first.issues == [Issue("r1", "msg", Severity.INFO)]
+        assert second.issues == ()
+
+    def test_counts_issues_passed_at_construction(self) -> None:
+        result = AnalyzerResult(
+            analyzer_name="test",
+            issues=[Issue("r1", "msg", Severity.ERROR)],
+        )
+        assert result.has_errors is True
+        assert result.has_warnings is False
+
+    def test_counts_follow_issues_changed_directly(self) -> None:
+        result = AnalyzerResult(analyzer_name="test")
+        result.add_issue(Issue("r1", "msg", Severity.INFO))
+        assert isinstance(result.issues, list)
+        result.issues.append(Issue("r2", "msg", Severity.ERROR))
+        assert result.issue_count == 2
+        assert result.has_errors is True
+
+        result.issues = [Issue("r3", "msg", Severity.WARNING)]
+        assert result.issue_count == 1
+        assert result.has_errors is False
+        assert result.has_warnings is True
+
     def test_issue_count(self) -> None:
         result = AnalyzerResult(analyzer_name="test")
         assert result.issue_count == 0
@@ -153,6 +219,32 @@ class TestTestItemInfo:
 
         assert info.full_name == "TestClass::test_example"
 
+    def test_assert_key_is_structural_and_cached(self) -> None:
+        source = "def test_example():\n    assert x == 1\n    assert x == 1\n    assert x == 2\n"
+        func_node = ast.parse(source).body[0]
+        assert isinstance(func_node, ast.FunctionDef)
+        info = TestItemInfo(
+            name="test_example",
+            file_path=Path("test_file.py"),
+            line=1,
+            node=func_node,
+            source=source,
+        )
+        first, second, third = (node for node in func_node.body if isinstance(node, ast.Assert))
+
+        assert info.assert_key(first) == info.assert_key(second)
+        assert info.assert_key(first) != info.assert_key(third)
+        assert len(info.assert_keys) == 3
+
+    def test_structure_key_matches_dump_equality(self) -> None:
+        sources = ["x == 1", "x == 1", "x == 1.0", "x == True", "y == 1", "x == '1'", "x == b'1'"]
+        trees = [ast.parse(source, mode="eval") for source in sources]
+
+        for left in trees:
+            for right in trees:
+                same_dump = ast.dump(left) == ast.dump(right)
+                assert (structure_key(left) == structure_key(right)) is same_dump
+
 
 class DummyAnalyzer(StaticAnalyzer):
     """A simple analyzer for testing."""
@@ -174,6 +266,40 @@ class DummyAnalyzer(StaticAnalyzer):
             )
 
 
+class WorkerFailingAnalyzer(StaticAnalyzer):
+    """An analyzer with a bug that only shows in worker processes."""
+
+    name = "worker_failing"
+    description = "Raises while analyzing in a worker process"
+
+    def __init__(self, config: ReviewConfig) -> None:
+        super().__init__(config)
+        self._parent_pid = os.getpid()
+
+    def _analyze_ast(self, test: TestItemInfo, result: AnalyzerResult) -> None:
+        if os.getpid() != self._parent_pid:
+            raise TypeError("analyzer bug")
+
+
+def make_tests(count: int) -> list[TestItemInfo]:
+    """Create simple test items, one per function."""
+    tests = []
+    for i in range(count):
+        source = f"def test_{i}():\n    assert {i}\n"
+        func_node = ast.parse(source).body[0]
+        assert isinstance(func_node, ast.FunctionDef)
+        tests.append(
+            TestItemInfo(
+                name=f"test_{i}",
+                file_path=Path(f"test_{i}.py"),
+                line=1,
+                node=func_node,
+                source=source,
+            )
+        )
+    return tests
+
+
 class TestStaticAnalyzer:
     def test_analyze_returns_result(self) -> None:
         config = ReviewConfig()
@@ -251,3 +377,228 @@ class TestStaticAnalyzer:
         assert len(results) == 3
         total_issues = sum(r.issue_count for r in results)
         assert total_issues == 2  # two tests with "bad" in name
+
+    def test_analyze_all_parallel_matches_serial(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(os, "cpu_count", lambda: 2)
+        analyzer = NamingAnalyzer(ReviewConfig())
+        analyzer.parallel_threshold = 2
+
+        tests = []
+        for i in range(8):
+            name = f"test_{i}" if i % 2 else f"test_checks_value_{i}"
+            source = f"def {name}():\n    assert {i}\n"
+            func_node = ast.parse(source).body[0]
+            assert isinstance(func_node, ast.FunctionDef)
+            tests.append(
+                TestItemInfo(
+                    name=name, file_path=Path("test.py"), line=1, node=func_node, source=source
+                )
+            )
+
+        parallel = analyzer.analyze_all(tests)
+        serial = [analyzer.analyze(test) for test in tests]
+        assert [r.issues for r in parallel] == [r.issues for r in serial]
+        assert [r.metadata for r in parallel] == [r.metadata for r in serial]
+
+    def test_analyze_all_pool_propagates_analyzer_errors(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(os, "cpu_count", lambda: 2)
+        analyzer = WorkerFailingAnalyzer(ReviewConfig())
+        analyzer.parallel_threshold = 2
+
+        with pytest.raises(TypeError, match="analyzer bug"):
+            analyzer.analyze_all(make_tests(4))
+
+    def test_analyze_all_unpicklable_analyzer_runs_serially(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(os, "cpu_count", lambda: 2)
+        analyzer = DummyAnalyzer(ReviewConfig())
+        analyzer.parallel_threshold = 2
+        analyzer.hook = lambda: None  # type: ignore[attr-defined]
+
+        results = analyzer.analyze_all(make_tests(4))
+
+        assert [result.analyzer_name for result in results] == ["dummy"] * 4
+
+
+class RecordingHandler(NodeHandler):
+    """Records the order in which nodes are entered and left."""
+
+    def __init__(self) -> None:
+        self.events: list[str] = []
+
+    def visit_If(self, node: ast.If) -> None:
+        self.events.append(f"enter If:{node.lineno}")
+
+    def leave_If(self, node: ast.If) -> None:
+        self.events.append(f"leave If:{node.lineno}")
+
+    def visit_Assert(self, node: ast.Assert) -> None:
+        self.events.append(f"Assert:{node.lineno}")
+
+
+class TestCompositeVisitor:
+    def test_leave_handlers_run_after_children(self) -> None:
+        source = "def test_nested():\n    if a:\n        if b:\n            assert c\n"
+        handler = RecordingHandler()
+        handler.visit(ast.parse(source))
+
+        assert handler.events == [
+            "enter If:2",
+            "enter If:3",
+            "Assert:4",
+            "leave If:3",
+            "leave If:2",
+        ]
+
+    def test_dispatches_to_every_registered_handler(self) -> None:
+        visitor = CompositeVisitor()
+        first = RecordingHandler()
+        second = RecordingHandler()
+        first.register(visitor)
+        second.register(visitor)
+
+        visitor.visit(ast.parse("assert x"))
+
+        assert first.events == ["Assert:1"]
+        assert second.events == ["Assert:1"]
+
+    def test_leaf_pruning_keeps_handled_nodes(self) -> None:
+        visitor = CompositeVisitor()
+        seen: list[str] = []
+        visitor.register(ast.Name, lambda node: seen.append(node.id))
+        visitor.register(ast.Store, lambda node: seen.append("store"))
+        visitor.register(ast.Add, lambda node: seen.append("add"))
+
+        visitor.visit(ast.parse("x = y + 1"))
+
+        assert seen == ["x", "store", "y", "add"]
+
+    def test_pruning_keeps_annotations_and_globals(self) -> None:
+        visitor = CompositeVisitor()
+        seen: list[str] = []
+        visitor.register(ast.Name, lambda node: seen.append(node.id))
+        visitor.register(ast.Global, lambda node: seen.extend(node.names))
+
+        visitor.visit(ast.parse("def f(a, b: int):\n    global g\n"))
+
+        assert seen == ["int", "g"]
+
+    def test_initial_handler_table(self) -> None:
+        seen: list[str] = []
+        table: dict[type[ast.AST], list[Callable[[Any], None]]] = {
+            ast.Name: [lambda node: seen.append(node.id)]
+        }
+        visitor = CompositeVisitor(table)
+        visitor.register(ast.Name, lambda node: seen.append("second"))
+
+        visitor.visit(ast.parse("x = y"))
+
+        assert seen == ["x", "second", "y", "second"]
+        assert len(table[ast.Name]) == 1
+
+    def test_handler_methods_resolved_per_class(self) -> None:
+        assert set(RecordingHandler._handler_methods) == {
+            (ast.If, "visit_If", False),
+            (ast.If, "leave_If", True),
+            (ast.Assert, "visit_Assert", False),
+        }
+
+
+class TestAnalyzeTest:
+    def test_matches_individual_analyzers(self) -> None:
+        config = ReviewConfig.from_dict(
+            {"analyzers": {"naming": {"require_docstring": True}, "complexity": {"max_depth": 1}}}
+        )
+        analyzers: list[StaticAnalyzer] = [
+            AssertionsAnalyzer(config),
+            NamingAnalyzer(config),
+            ComplexityAnalyzer(config),
+            PatternsAnalyzer(config),
+            IsolationStaticAnalyzer(config),
+            SmellsAnalyzer(config),
+            DummyAnalyzer(config),
+        ]
+        source = Path(__file__).parent.parent.joinpath("examples", "bad_tests.py").read_text()
+        tree = ast.parse(source)
+
+        for node in ast.walk(tree):
+            if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                continue
+            test_info = TestItemInfo(
+                name=node.name,
+                file_path=Path("bad_tests.py"),
+                line=node.lineno,
+                node=node,
+                source=source,
+            )
+            fused = analyze_test(analyzers, test_info)
+            separate = [analyzer.analyze(test_info) for analyzer in analyzers]
+            assert fused == separate
+
+    def test_analyze_files_parallel_matches_serial(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(os, "cpu_count", lambda: 2)
+        analyzers: list[StaticAnalyzer] = [
+            NamingAnalyzer(ReviewConfig()),
+            SmellsAnalyzer(ReviewConfig()),
+        ]
+        groups = []
+        for file_index in range(4):
+            group = []
+            for i in range(3):
+                name = f"test_{i}" if i % 2 else f"test_checks_value_{file_index}_{i}"
+                source = f"def {name}():\n    assert x == {i + 40}\n"
+                node = ast.parse(source).body[0]
+                assert isinstance(node, ast.FunctionDef)
+                group.append(
+                    TestItemInfo(
+                        name=name,
+                        file_path=Path(f"test_{file_index}.py"),
+                        line=1,
+                        node=node,
+                        source=source,
+                    )
+                )
+            groups.append(group)
+
+        parallel = analyze_files(analyzers, groups, parallel_threshold=2)
+        serial = [[analyze_test(analyzers, test) for test in group] for group in groups]
+
+        assert parallel == serial
+
+    def test_unchanged_test_is_not_walked_again(self) -> None:
+        clear_result_cache()
+        calls: list[str] = []
+
+        class CountingAnalyzer(DummyAnalyzer):
+            def _analyze_ast(self, test: TestItemInfo, result: AnalyzerResult) -> None:
+                calls.append(test.name)
+                super()._analyze_ast(test, result)
+
+        analyzers: list[StaticAnalyzer] = [CountingAnalyzer(ReviewConfig())]
+        source = "def test_bad_thing():\n    assert x\n"
+        func_node = ast.parse(source).body[0]
+        assert isinstance(func_node, ast.FunctionDef)
+        test_info = TestItemInfo(
+            name="test_bad_thing",
+            file_path=Path("test_file.py"),
+            line=1,
+            node=func_node,
+            source=source,
+        )
+
+        first = analyze_test(analyzers, test_info)
+        first[0].add_issue(Issue("extra", "msg", Severity.INFO))
+        second = analyze_test(analyzers, test_info)
+
+        assert calls == ["test_bad_thing"]
+        assert [issue.rule for issue in second[0].issues] == ["dummy.bad_name"]
+
+        moved = replace(test_info, line=test_info.line + 1)
+        analyze_test(analyzers, moved)
+        analyze_test([CountingAnalyzer(ReviewConfig(ignore_rules=["x"]))], test_info)
+
+        assert len(calls) == 3
+        clear_result_cache()
@@ -87,6 +87,50 @@ def test_tautology():
         assert len(trivial_issues) == 1
         assert "comparing value to itself" in trivial_issues[0].message
 
+    def test_detects_tautology_on_calls(self) -> None:
+        source = """
+def test_tautology_call():
+    assert compute(obj.value, 1) == compute(obj.value, 1)
+"""
+        config = ReviewConfig()
+        analyzer = AssertionsAnalyzer(config)
+        test_info = make_test_info(source.strip(), "test_tautology_call")
+
+        result = analyzer.analyze(test_info)
+
+        trivial_issues = [i for i in result.issues if i.rule == "assertions.trivial"]
+        assert len(trivial_issues) == 1
+
+    def test_similar_operands_are_not_tautology(self) -> None:
+        source = """
+def test_not_tautology():
+    assert obj.first == obj.second
+    assert compute(1) == compute(1.0)
+    assert items[0] == items[1]
+"""
+        config = ReviewConfig()
+        analyzer = AssertionsAnalyzer(config)
+        test_info = make_test_info(source.strip(), "test_not_tautology")
+
+        result = analyzer.analyze(test_info)
+
+        trivial_issues = [i for i in result.issues if i.rule == "assertions.trivial"]
+        assert trivial_issues == []
+
+    def test_ignored_rule_is_not_reported(self) -> None:
+        source = """
+def test_trivial():
+    assert True
+"""
+        config = ReviewConfig(ignore_rules=["assertions.trivial"])
+        analyzer = AssertionsAnalyzer(config)
+        test_info = make_test_info(source.strip(), "test_trivial")
+
+        result = analyzer.analyze(test_info)
+
+        assert all(i.rule != "assertions.trivial" for i in result.issues)
+        assert result.metadata["trivial_count"] == 1
+
     def test_accepts_valid_assertion(self) -> None:
         source = """
 def test_valid():
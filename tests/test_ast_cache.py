@@ -0,0 +1,187 @@
+"""Tests for the on-disk AST cache."""
+
+from __future__ import annotations
+
+import ast
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from pytest_review.ast_cache import AstCache
+
+
+def write_module(path: Path, source: str) -> Path:
+    """Write a test module and return its path."""
+    path.write_text(source)
+    return path
+
+
+class TestAstCache:
+    def test_miss_then_hit(self, tmp_path: Path) -> None:
+        module = write_module(tmp_path / "test_mod.py", "def test_one():\n    assert 1\n")
+        cache = AstCache(tmp_path / "cache")
+
+        first = cache.load_or_parse(module)
+        second = cache.load_or_parse(module)
+
+        assert cache.stats() == {"hits": 1, "misses": 1}
+        assert ast.dump(first) == ast.dump(second)
+
+    def test_changed_source_is_a_miss(self, tmp_path: Path) -> None:
+        module = write_module(tmp_path / "test_mod.py", "def test_one():\n    assert 1\n")
+        cache = AstCache(tmp_path / "cache")
+        cache.load_or_parse(module)
+
+        write_module(module, "def test_two():\n    assert 2\n")
+        tree = cache.load_or_parse(module)
+
+        assert cache.misses == 2
+        func = tree.body[0]
+        assert isinstance(func, ast.FunctionDef)
+        assert func.name == "test_two"
+
+    def test_corrupt_entry_is_reparsed(self, tmp_path: Path) -> None:
+        module = write_module(tmp_path / "test_mod.py", "def test_one():\n    assert 1\n")
+        cache = AstCache(tmp_path / "cache")
+        cache.load_or_parse(module)
+
+        for entry in (tmp_path / "cache").iterdir():
+            entry.write_bytes(b"not a pickle")
+
+        tree = cache.load_or_parse(module)
+        assert isinstance(tree, ast.Module)
+        assert cache.misses == 2
+
+    def test_preserves_positions(self, tmp_path: Path) -> None:
+        source = "x = 1\n\ndef test_one():\n    assert x\n"
+        module = write_module(tmp_path / "test_mod.py", source)
+        cache = AstCache(tmp_path / "cache")
+        cache.load_or_parse(module)
+
+        func = cache.load_or_parse(module).body[1]
+        assert ast.get_source_segment(source, func) == "def test_one():\n    assert x"
+
+    def test_uses_given_source(self, tmp_path: Path) -> None:
+        module = write_module(tmp_path / "test_mod.py", "def test_one():\n    assert 1\n")
+        cache = AstCache(tmp_path / "cache")
+
+        # Source the caller already read is parsed instead of the file
+        tree = cache.load_or_parse(module, b"def test_two():\n    assert 2\n")
+
+        func = tree.body[0]
+        assert isinstance(func, ast.FunctionDef)
+        assert func.name == "test_two"
+
+    def test_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        cache_dir = tmp_path / "cache"
+        modules = [
+            write_module(
+                tmp_path / f"test_{index}.py", f"def test_{index}():\n    assert {index}\n"
+            )
+            for index in range(3)
+        ]
+        for module in modules:
+            cache = AstCache(cache_dir, max_entries=2)
+            cache.load_or_parse(module)
+            cache.save()
+            # Entries written within one timestamp tick would tie
+            for age, entry in enumerate(sorted(cache_dir.glob("*.pkl"), key=os.path.getmtime)):
+                os.utime(entry, ns=(age * 10**9, age * 10**9))
+
+        assert len(list(cache_dir.glob("*.pkl"))) == 2
+        cache = AstCache(cache_dir)
+        cache.load_or_parse(modules[0])
+        assert cache.misses == 1
+
+    def test_syntax_error_propagates(self, tmp_path: Path) -> None:
+        module = write_module(tmp_path / "test_mod.py", "def test_one(:\n")
+        cache = AstCache(tmp_path / "cache")
+
+        with pytest.raises(SyntaxError):
+            cache.load_or_parse(module)
+
+
+class TestAstCacheManifest:
+    def test_unchanged_stat_skips_hashing(self, tmp_path: Path) -> None:
+        module = write_module(tmp_path / "test_mod.py", "def test_one():\n    assert 1\n")
+        os.utime(module, ns=(1_000_000_000, 1_000_000_000))
+        cache = AstCache(tmp_path / "cache")
+        cache.load_or_parse(module)
+        cache.save_manifest()
+
+        # Same size and mtime: the manifest digest is trusted without reading
+        write_module(module, "def test_two():\n    assert 2\n")
+        os.utime(module, ns=(1_000_000_000, 1_000_000_000))
+        tree = AstCache(tmp_path / "cache").load_or_parse(module)
+
+        func = tree.body[0]
+        assert isinstance(func, ast.FunctionDef)
+        assert func.name == "test_one"
+
+    def test_recently_modified_files_are_not_recorded(self, tmp_path: Path) -> None:
+        module = write_module(tmp_path / "test_mod.py", "def test_one():\n    assert 1\n")
+        cache = AstCache(tmp_path / "cache")
+        cache.load_or_parse(module)
+        cache.save_manifest()
+
+        assert not cache.manifest_path.exists()
+
+    def test_forgets_deleted_files(self, tmp_path: Path) -> None:
+        kept = write_module(tmp_path / "test_kept.py", "def test_one():\n    assert 1\n")
+        gone = write_module(tmp_path / "test_gone.py", "def test_two():\n    assert 2\n")
+        cache = AstCache(tmp_path / "cache")
+        for module in (kept, gone):
+            os.utime(module, ns=(1_000_000_000, 1_000_000_000))
+            cache.load_or_parse(module)
+        cache.save()
+
+        gone.unlink()
+        cache = AstCache(tmp_path / "cache")
+        cache.load_or_parse(kept)
+        cache.save()
+
+        assert list(json.loads(cache.manifest_path.read_text())) == [str(kept)]
+
+    def test_corrupt_manifest_is_ignored(self, tmp_path: Path) -> None:
+        module = write_module(tmp_path / "test_mod.py", "def test_one():\n    assert 1\n")
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir()
+        (cache_dir / "manifest.json").write_text("{not json")
+
+        tree = AstCache(cache_dir).load_or_parse(module)
+        assert isinstance(tree, ast.Module)
+
+
+class TestAstCacheIntegration:
+    """Integration tests using pytester."""
+
+    @pytest.fixture(autouse=True)
+    def enable_cache(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyprojecttoml("""
+            [tool.pytest-review]
+            cache_dir = ".review-cache"
+        """)
+
+    def test_cache_stats_option(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile("""
+            def test_value_is_cached_between_runs():
+                assert 1 + 1 == 2
+        """)
+        result = pytester.runpytest("--review", "--review-cache-stats")
+        assert "AST cache 0 hits, 1 misses" in result.stdout.str()
+
+        result = pytester.runpytest("--review", "--review-cache-stats")
+        assert "AST cache 1 hits, 0 misses" in result.stdout.str()
+
+    def test_module_parsed_once_per_session(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile("""
+            def test_first_value_is_positive():
+                assert 1 > 0
+
+            def test_second_value_is_negative():
+                assert -1 < 0
+        """)
+        result = pytester.runpytest("--review", "--review-cache-stats")
+        assert "AST cache 0 hits, 1 misses" in result.stdout.str()
@@ -5,8 +5,12 @@ from __future__ import annotations
 import ast
 from pathlib import Path
 
-from pytest_review.analyzers.base import TestItemInfo
-from pytest_review.analyzers.complexity import ComplexityAnalyzer
+from pytest_review.analyzers.base import TestItemInfo, analyze_test, clear_result_cache
+from pytest_review.analyzers.complexity import (
+    ComplexityAnalyzer,
+    ComplexityVisitor,
+    _fast_metrics,
+)
 from pytest_review.config import ReviewConfig
 
 
@@ -166,3 +170,93 @@ def test_with_statement():
         # with -> if -> for = depth 3
         depth_issues = [i for i in result.issues if i.rule == "complexity.deep_nesting"]
         assert len(depth_issues) == 1
+
+    def test_reports_exact_counts_over_all_limits(self) -> None:
+        source = """
+def test_saturated():
+    for a in items:
+        for b in a:
+            if b:
+                x = 1
+    y = 2
+    z = 3
+"""
+        test_info = make_test_info(source.strip(), "test_saturated")
+        config = ReviewConfig.from_dict(
+            {
+                "analyzers": {
+                    "complexity": {"max_statements": 1, "max_depth": 1, "max_complexity": 1}
+                }
+            }
+        )
+        analyzer = ComplexityAnalyzer(config)
+        result = analyzer.analyze(test_info)
+        rules = {issue.rule for issue in result.issues}
+        assert rules == {
+            "complexity.too_many_statements",
+            "complexity.deep_nesting",
+            "complexity.high_cyclomatic",
+        }
+
+        # The shared walk reports the exact counts, like the standalone path
+        clear_result_cache()
+        [shared] = analyze_test([analyzer], test_info)
+        assert shared == result
+        assert shared.metadata["statement_count"] == 6
+
+
+EXTRA_SHAPES = """
+def test_extra_shapes():
+    try:
+        values = [x for x in range(10) if x if x > 1]
+    except ValueError:
+        pass
+    if a and b or c:
+        y = 1 if a else 2
+    elif b:
+        total = sum(v for v in values)
+    else:
+        while True:
+            break
+"""
+
+
+def example_functions() -> tuple[str, list[ast.FunctionDef | ast.AsyncFunctionDef]]:
+    """Get the source and function nodes of the example tests plus extra shapes."""
+    source = Path(__file__).parent.parent.joinpath("examples", "bad_tests.py").read_text()
+    source += EXTRA_SHAPES
+    functions = [
+        node
+        for node in ast.walk(ast.parse(source))
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+    ]
+    return source, functions
+
+
+class TestFastMetrics:
+    def test_fast_metrics_match_visitor(self) -> None:
+        _, functions = example_functions()
+        for node in functions:
+            visitor = ComplexityVisitor()
+            visitor.visit(node)
+            expected = (visitor.statement_count, visitor.max_depth, visitor.cyclomatic_complexity)
+            assert _fast_metrics(node) == expected, node.name
+
+    def test_fast_metrics_match_visitor_on_package_sources(self) -> None:
+        # Real modules exercise loops, try/except, comprehensions and nesting
+        root = Path(__file__).parent.parent
+        paths = sorted([*root.joinpath("src").rglob("*.py"), *root.joinpath("tests").glob("*.py")])
+        checked = 0
+        for path in paths:
+            for node in ast.walk(ast.parse(path.read_text(), filename=str(path))):
+                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    visitor = ComplexityVisitor()
+                    visitor.visit(node)
+                    expected = (
+                        visitor.statement_count,
+                        visitor.max_depth,
+                        visitor.cyclomatic_complexity,
+                    )
+                    assert _fast_metrics(node) == expected, f"{path.name}:{node.name}"
+                    checked += 1
+        assert checked > 200
@@ -28,6 +28,7 @@ class TestReviewConfig:
         assert config.analyzers == {}
         assert config.ignore_paths == []
         assert config.ignore_rules == []
+        assert config.cache_dir is None
 
     def test_from_dict(self, sample_pyproject_config: dict) -> None:
         config = ReviewConfig.from_dict(sample_pyproject_config)
@@ -41,6 +42,19 @@ class TestReviewConfig:
         assert config.ignore_paths == ["tests/legacy/*"]
         assert config.ignore_rules == ["naming.docstring"]
 
+    def test_cache_dir_from_dict(self) -> None:
+        config = ReviewConfig.from_dict({"cache_dir": ".review-cache"})
+        assert config.cache_dir == Path(".review-cache")
+        assert ReviewConfig.from_dict({"cache_dir": False}).cache_dir is None
+
+    def test_is_path_ignored(self) -> None:
+        config = ReviewConfig.from_dict({"ignore": {"paths": ["tests/legacy/*", "*_slow.py"]}})
+
+        assert config.is_path_ignored("tests/legacy/test_old.py")
+        assert config.is_path_ignored("tests/unit/test_io_slow.py")
+        assert not config.is_path_ignored("tests/unit/test_io.py")
+        assert not ReviewConfig().is_path_ignored("tests/legacy/test_old.py")
+
     def test_get_analyzer_config_existing(self, sample_pyproject_config: dict) -> None:
         config = ReviewConfig.from_dict(sample_pyproject_config)
         analyzer_config = config.get_analyzer_config("assertions")
@@ -62,6 +76,12 @@ class TestReviewConfig:
         assert config.is_analyzer_enabled("complexity") is False
         assert config.is_analyzer_enabled("nonexistent") is True  # default
 
+    def test_is_rule_enabled(self, sample_pyproject_config: dict) -> None:
+        config = ReviewConfig.from_dict(sample_pyproject_config)
+
+        assert config.is_rule_enabled("naming.docstring") is False
+        assert config.is_rule_enabled("naming.too_short") is True
+
     def test_get_analyzer_option(self, sample_pyproject_config: dict) -> None:
         config = ReviewConfig.from_dict(sample_pyproject_config)
 
@@ -90,3 +110,28 @@ assertions = { enabled = true, min_assertions = 2 }
         assert config.strict is True
         assert config.min_score == 80
         assert config.get_analyzer_option("assertions", "min_assertions") == 2
+
+    def test_from_pyproject_reuses_parse_until_changed(self, tmp_path: Path) -> None:
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text("""
+[tool.pytest-review.analyzers]
+naming = { enabled = false, min_length = 12 }
+""")
+        first = ReviewConfig.from_pyproject(pyproject)
+        second = ReviewConfig.from_pyproject(pyproject)
+
+        # Loading again must not see data modified by the first load
+        assert second.analyzers == first.analyzers
+        assert second.is_analyzer_enabled("naming") is False
+        assert second.get_analyzer_config("naming").options == {"min_length": 12}
+
+        pyproject.write_text("""
+[tool.pytest-review.analyzers]
+naming = { enabled = true, min_length = 8 }
+""")
+        changed = ReviewConfig.from_pyproject(pyproject)
+        assert changed.get_analyzer_option("naming", "min_length") == 8
+
+    def test_from_dict_leaves_input_unchanged(self, sample_pyproject_config: dict) -> None:
+        ReviewConfig.from_dict(sample_pyproject_config)
+        assert sample_pyproject_config["analyzers"]["complexity"] == {"enabled": False}
@@ -0,0 +1,67 @@
+"""Tests for the dynamic data collector."""
+
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from pytest_review.collectors.dynamic import DynamicCollector, TestExecutionData
+
+
+def run_tests(collector: DynamicCollector, *names: str) -> None:
+    """Record a passing run of each named test."""
+    for index, name in enumerate(names):
+        collector.start_test(f"test_mod.py::{name}[{index}]", name)
+        collector.end_test(passed=True)
+
+
+class TestDynamicCollector:
+    def test_get_test_by_name(self) -> None:
+        collector = DynamicCollector()
+        run_tests(collector, "test_first", "test_second")
+
+        data = collector.get_test_by_name("test_second")
+
+        assert data is not None
+        assert data.node_id == "test_mod.py::test_second[1]"
+        assert collector.get_test_by_name("test_missing") is None
+
+    def test_get_test_by_name_returns_first_of_duplicates(self) -> None:
+        collector = DynamicCollector()
+        run_tests(collector, "test_param", "test_param")
+
+        data = collector.get_test_by_name("test_param")
+
+        assert data is not None
+        assert data.node_id == "test_mod.py::test_param[0]"
+
+    def test_record_fixtures(self) -> None:
+        collector = DynamicCollector()
+        collector.start_test("test_mod.py::test_one", "test_one")
+        collector.end_test(passed=True)
+        collector.start_test("test_mod.py::test_two", "test_two")
+        collector.record_fixtures(["tmp_path"])
+        collector.end_test(passed=True)
+
+        first, second = collector.get_completed_tests()
+
+        assert first.fixtures_used is None
+        assert first.modified_globals is None
+        assert second.fixtures_used == ["tmp_path"]
+
+    def test_clear_forgets_tests(self) -> None:
+        collector = DynamicCollector()
+        run_tests(collector, "test_first")
+
+        collector.clear()
+
+        assert collector.get_completed_tests() == []
+        assert collector.get_test_by_name("test_first") is None
+
+
+class TestTestExecutionData:
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10")
+    def test_has_no_instance_dict(self) -> None:
+        data = TestExecutionData(test_name="test_one", node_id="test_mod.py::test_one")
+        assert not hasattr(data, "__dict__")
@@ -3,12 +3,20 @@
 from __future__ import annotations
 
 import ast
+import sys
+import types
+from collections import defaultdict
 from pathlib import Path
+from typing import Callable
 
 import pytest
 
 from pytest_review.analyzers.base import Severity, TestItemInfo
-from pytest_review.analyzers.isolation import IsolationStaticAnalyzer
+from pytest_review.analyzers.isolation import (
+    GlobalModificationVisitor,
+    IsolationDynamicAnalyzer,
+    IsolationStaticAnalyzer,
+)
 from pytest_review.config import ReviewConfig
 
 
@@ -77,6 +85,22 @@ def test_modifies_config():
         assert len(class_issues) == 1
         assert "Config.DEBUG" in class_issues[0].message
 
+    def test_subscript_on_known_module(self) -> None:
+        source = """
+def test_patches_registry():
+    Settings.registry["key"] = 1
+    Other.registry["key"] = 1
+    helpers.registry["key"] = 1
+"""
+        func_node = ast.parse(source.strip()).body[0]
+        visitor = GlobalModificationVisitor(frozenset({"Settings"}))
+        visitor.visit(func_node)
+
+        assert [name for _, name in visitor.class_attr_modifications] == [
+            "Settings.registry[...]",
+            "helpers.registry[...]",
+        ]
+
     def test_clean_test_passes(self) -> None:
         source = """
 def test_clean_isolation():
@@ -129,6 +153,156 @@ def test_instance_attr():
         assert len(class_issues) == 0
 
 
+class TestIsolationDynamicAnalyzer:
+    @pytest.fixture
+    def state_module(self, monkeypatch: pytest.MonkeyPatch) -> types.ModuleType:
+        module = types.ModuleType("review_state_module")
+        module.counter = 0  # type: ignore[attr-defined]
+        module.items = [1, 2]  # type: ignore[attr-defined]
+        module.nested = [[1], [2]]  # type: ignore[attr-defined]
+        module.options = {"a": [1]}  # type: ignore[attr-defined]
+        module.tags = {"x"}  # type: ignore[attr-defined]
+        monkeypatch.setitem(sys.modules, module.__name__, module)
+        return module
+
+    def run_test(self, module: types.ModuleType, body: Callable[[], None]) -> list[str]:
+        analyzer = IsolationDynamicAnalyzer(ReviewConfig())
+        analyzer.configure_monitoring([module.__name__])
+        analyzer.on_test_start("test_state")
+        body()
+        analyzer.on_test_end("test_state", passed=True, duration=0.0)
+        results = analyzer.get_results()
+        return [issue.message for result in results for issue in result.issues]
+
+    def test_unchanged_state_is_clean(self, state_module: types.ModuleType) -> None:
+        assert self.run_test(state_module, lambda: None) == []
+
+    def test_snapshot_skips_attribute_lookup(self, state_module: types.ModuleType) -> None:
+        lookups: list[str] = []
+
+        def module_getattr(name: str) -> object:
+            lookups.append(name)
+            raise AttributeError(name)
+
+        state_module.__getattr__ = module_getattr  # type: ignore[attr-defined]
+
+        assert self.run_test(state_module, lambda: None) == []
+        assert lookups == []
+
+    def test_detects_in_place_mutations(self, state_module: types.ModuleType) -> None:
+        def mutate() -> None:
+            state_module.items.append(3)
+            state_module.nested.append([3])
+            state_module.options["b"] = [2]
+            state_module.tags.add("y")
+
+        messages = self.run_test(state_module, mutate)
+
+        assert messages == [
+            f"Test modified shared state: review_state_module.{name} (modified)"
+            for name in ("items", "nested", "options", "tags")
+        ]
+
+    def test_detects_mutations_with_colliding_hashes(self, state_module: types.ModuleType) -> None:
+        # hash(-1) == hash(-2), so only the copies tell these states apart
+        state_module.limits = [-1]  # type: ignore[attr-defined]
+        state_module.conf = {"level": -1}  # type: ignore[attr-defined]
+        state_module.levels = {-1}  # type: ignore[attr-defined]
+
+        def mutate() -> None:
+            state_module.limits[0] = -2
+            state_module.conf["level"] = -2
+            state_module.levels.symmetric_difference_update({-1, -2})
+
+        messages = self.run_test(state_module, mutate)
+
+        assert messages == [
+            f"Test modified shared state: review_state_module.{name} (modified)"
+            for name in ("limits", "conf", "levels")
+        ]
+
+    def test_tracks_subclasses_of_tracked_types(self, state_module: types.ModuleType) -> None:
+        state_module.registry = defaultdict(list)  # type: ignore[attr-defined]
+        state_module.handler = print  # type: ignore[attr-defined]
+
+        messages = self.run_test(state_module, lambda: state_module.registry["key"].append(1))
+
+        assert messages == ["Test modified shared state: review_state_module.registry (modified)"]
+
+    def test_ignored_rule_builds_no_results(self, state_module: types.ModuleType) -> None:
+        config = ReviewConfig.from_dict({"ignore": {"rules": ["isolation.runtime_modification"]}})
+        analyzer = IsolationDynamicAnalyzer(config)
+        analyzer.configure_monitoring([state_module.__name__])
+        analyzer.on_test_start("test_state")
+        state_module.counter = 1  # type: ignore[attr-defined]
+        analyzer.on_test_end("test_state", passed=True, duration=0.0)
+
+        assert analyzer.get_results() == []
+
+    def test_compare_snapshots(self) -> None:
+        analyzer = IsolationDynamicAnalyzer(ReviewConfig())
+        before = {"a": 1, "b": 2, "c": 3, "d": 4}
+
+        assert analyzer._compare_snapshots(before, dict(before)) == []
+        assert analyzer._compare_snapshots(before, {"a": 1, "b": 5, "e": 6}) == [
+            "b (modified)",
+            "e (added)",
+            "c (deleted)",
+            "d (deleted)",
+        ]
+
+    def test_detects_added_and_deleted_attributes(self, state_module: types.ModuleType) -> None:
+        def mutate() -> None:
+            state_module.counter = 1
+            state_module.extra = "new"
+            del state_module.tags
+
+        messages = self.run_test(state_module, mutate)
+
+        assert sorted(messages) == [
+            "Test modified shared state: review_state_module.counter (modified)",
+            "Test modified shared state: review_state_module.extra (added)",
+            "Test modified shared state: review_state_module.tags (deleted)",
+        ]
+
+    def test_baseline_is_reused_across_tests(self, state_module: types.ModuleType) -> None:
+        analyzer = IsolationDynamicAnalyzer(ReviewConfig())
+        analyzer.configure_monitoring([state_module.__name__])
+        steps: list[tuple[str, Callable[[], None]]] = [
+            ("test_rebinds", lambda: setattr(state_module, "counter", 1)),
+            ("test_clean", lambda: None),
+            ("test_adds", lambda: setattr(state_module, "queue", [])),
+            ("test_mutates_new", lambda: state_module.queue.append(1)),
+        ]
+        for name, body in steps:
+            analyzer.on_test_start(name)
+            body()
+            analyzer.on_test_end(name, passed=True, duration=0.0)
+
+        assert {
+            r.issues[0].test_name: r.metadata["modifications"] for r in analyzer.get_results()
+        } == {
+            "test_rebinds": ["review_state_module.counter (modified)"],
+            "test_adds": ["review_state_module.queue (added)"],
+            "test_mutates_new": ["review_state_module.queue (modified)"],
+        }
+
+    def test_values_without_bool_equality(self, state_module: types.ModuleType) -> None:
+        class Array:
+            def __eq__(self, other: object) -> bool:
+                raise ValueError("ambiguous")
+
+        state_module.array = Array()  # type: ignore[attr-defined]
+
+        def rebind() -> None:
+            state_module.array = Array()  # type: ignore[attr-defined]
+            state_module.counter = 2  # type: ignore[attr-defined]
+
+        messages = self.run_test(state_module, rebind)
+
+        assert messages == ["Test modified shared state: review_state_module.counter (modified)"]
+
+
 class TestIsolationAnalyzerIntegration:
     """Integration tests using pytester."""
 
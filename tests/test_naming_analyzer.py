@@ -58,6 +58,24 @@ class TestNamingAnalyzer:
         non_descriptive = [i for i in result.issues if i.rule == "naming.non_descriptive"]
         assert len(non_descriptive) == 1
 
+    def test_non_descriptive_pattern_case_handling(self) -> None:
+        analyzer = NamingAnalyzer(ReviewConfig())
+        flagged = {
+            name
+            for name in ("test_a", "test_A", "TEST_FOO", "Test_Example", "test_foobar", "test_12")
+            if any(
+                issue.rule == "naming.non_descriptive"
+                for issue in analyzer.analyze(make_test_info("def f(): pass", name)).issues
+            )
+        }
+
+        assert flagged == {"test_a", "TEST_FOO", "Test_Example", "test_12"}
+
+    def test_finds_unclear_abbreviations(self) -> None:
+        unclear = NamingAnalyzer._find_unclear_abbreviations("test_db_x_is_up_qz_a_42_api")
+
+        assert unclear == ["x", "qz"]
+
     def test_detects_short_name(self) -> None:
         source = "def test_add(): pass"
         config = ReviewConfig.from_dict(
@@ -5,7 +5,7 @@ from __future__ import annotations
 import ast
 from pathlib import Path
 
-from pytest_review.analyzers.base import Severity, TestItemInfo
+from pytest_review.analyzers.base import AnalyzerResult, CompositeVisitor, Severity, TestItemInfo
 from pytest_review.analyzers.patterns import PatternsAnalyzer
 from pytest_review.config import ReviewConfig
 
@@ -124,6 +124,18 @@ def test_is_literal():
         is_literal_issues = [i for i in result.issues if i.rule == "patterns.is_literal"]
         assert len(is_literal_issues) == 1
 
+    def test_detects_is_literal_in_chained_comparison(self) -> None:
+        source = """
+def test_chained():
+    assert 0 < x is "a"
+    assert 0 < x < 10
+"""
+        analyzer = PatternsAnalyzer(ReviewConfig())
+        result = analyzer.analyze(make_test_info(source.strip(), "test_chained"))
+
+        is_issues = [i for i in result.issues if i.rule == "patterns.is_literal"]
+        assert [i.line for i in is_issues] == [2]
+
     def test_allows_is_with_none(self) -> None:
         source = """
 def test_is_none():
@@ -210,6 +222,45 @@ def test_clean():
         critical_issues = [i for i in result.issues if i.rule in critical_rules]
         assert len(critical_issues) == 0
 
+    def test_detects_hardcoded_paths(self) -> None:
+        source = r"""
+def test_paths():
+    load("/HOME/user/data.txt")
+    load("/opt/tmp/cache")
+    load("C:\\Users\\data")
+    load("/api/v1/users")
+    load("/usr/lib")
+"""
+        analyzer = PatternsAnalyzer(ReviewConfig())
+        result = analyzer.analyze(make_test_info(source.strip(), "test_paths"))
+
+        messages = [i.message for i in result.issues if i.rule == "patterns.hardcoded_path"]
+        assert messages == [
+            "Hardcoded absolute path: '/HOME/user/data.txt'",
+            "Hardcoded absolute path: '/opt/tmp/cache'",
+            "Hardcoded Windows path detected",
+        ]
+
+    def test_ignored_rules_are_not_recorded(self) -> None:
+        source = """
+def test_ignored():
+    print("/home/user/data.txt")
+    x = y is "a"
+"""
+        config = ReviewConfig.from_dict(
+            {"ignore": {"rules": ["patterns.hardcoded_path", "patterns.print_statement"]}}
+        )
+        analyzer = PatternsAnalyzer(config)
+        visitor = CompositeVisitor()
+        analyzer.register(visitor, make_test_info(source.strip()), AnalyzerResult("patterns"))
+
+        assert ast.Constant not in visitor.handlers
+        assert ast.Call in visitor.handlers
+
+        result = analyzer.analyze(make_test_info(source.strip(), "test_ignored"))
+        assert [i.rule for i in result.issues] == ["patterns.is_literal"]
+        assert result.metadata["pattern_issues"] == 1
+
     def test_stores_metadata(self) -> None:
         source = """
 def test_metadata():
@@ -106,6 +106,26 @@ class TestPerformanceAnalyzer:
         assert stats["avg_ms"] == pytest.approx(200, rel=0.1)
         assert stats["total_ms"] == pytest.approx(600, rel=0.1)
 
+    def test_statistics_slow_counts(self) -> None:
+        config = ReviewConfig.from_dict(
+            {
+                "analyzers": {
+                    "performance": {"slow_threshold_ms": 100, "very_slow_threshold_ms": 200}
+                }
+            }
+        )
+        analyzer = PerformanceAnalyzer(config)
+        for name, duration in (("test_1", 0.05), ("test_2", 0.15), ("test_3", 0.25)):
+            analyzer.on_test_end(name, passed=True, duration=duration)
+
+        stats = analyzer.get_statistics()
+        assert stats["slow_count"] == 2
+        assert stats["very_slow_count"] == 1
+        assert analyzer.get_statistics() == stats
+
+    def test_statistics_empty(self) -> None:
+        assert PerformanceAnalyzer(ReviewConfig()).get_statistics() == {}
+
 
 class TestPerformanceAnalyzerIntegration:
     """Integration tests using pytester."""
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import ast
+
 import pytest
 
+from pytest_review.plugin import _index_functions, _ParsedFile
+
 
 class TestPluginOptions:
     """Test command line option parsing."""
@@ -61,6 +65,63 @@ class TestPluginOptions:
         # Only one test should be analyzed
         assert "Tests analyzed: 1" in result.stdout.str()
 
+    def test_deselected_tests_are_not_reviewed(self, pytester: pytest.Pytester) -> None:
+        """Tests deselected with -k are neither analyzed nor parsed."""
+        pytester.makepyprojecttoml("""
+            [tool.pytest-review]
+            cache_dir = ".review-cache"
+        """)
+        pytester.makepyfile(
+            test_selected="def test_selected_value_is_positive():\n    assert 1 > 0\n",
+            test_other="def test_other_value_is_negative():\n    assert -1 < 0\n",
+        )
+        result = pytester.runpytest("--review", "--review-cache-stats", "-k", "selected")
+        result.assert_outcomes(passed=1)
+        assert "Tests analyzed: 1" in result.stdout.str()
+        assert "AST cache 0 hits, 1 misses" in result.stdout.str()
+
+    def test_ignore_paths_setting(self, pytester: pytest.Pytester) -> None:
+        """Tests in files matching ignore.paths are excluded."""
+        pytester.makepyprojecttoml("""
+            [tool.pytest-review.ignore]
+            paths = ["legacy/*"]
+        """)
+        pytester.mkpydir("legacy")
+        pytester.path.joinpath("legacy", "test_old.py").write_text(
+            "def test_old_behaviour():\n    assert True\n"
+        )
+        pytester.makepyfile(test_new="def test_new_behaviour():\n    assert True\n")
+        result = pytester.runpytest("--review")
+        result.assert_outcomes(passed=2)
+        assert "Tests analyzed: 1" in result.stdout.str()
+
+    def test_same_method_name_in_two_classes(self, pytester: pytest.Pytester) -> None:
+        """Each class's method is analyzed, not the first one with that name."""
+        pytester.makepyfile("""
+            class TestFirst:
+                def test_value_is_positive(self):
+                    assert 1 > 0
+
+            class TestSecond:
+                def test_value_is_positive(self):
+                    assert True
+        """)
+        result = pytester.runpytest("--review")
+        output = result.stdout.str()
+        assert "assertions.trivial" in output or "Trivial assertion" in output
+
+    def test_nested_class_method_is_analyzed(self, pytester: pytest.Pytester) -> None:
+        """Methods of nested test classes are found without walking function bodies."""
+        pytester.makepyfile("""
+            class TestOuter:
+                class TestInner:
+                    def test_value_is_positive(self):
+                        assert True
+        """)
+        result = pytester.runpytest("--review")
+        output = result.stdout.str()
+        assert "assertions.trivial" in output or "Trivial assertion" in output
+
 
 class TestPluginOutput:
     """Test plugin output formatting."""
@@ -100,3 +161,18 @@ class TestPluginOutput:
         assert "Quality: NEEDS IMPROVEMENT" in result.stdout.str()
         output = result.stdout.str()
         assert "assertions.trivial" in output or "Trivial assertion" in output
+
+
+class TestParsedFile:
+    def test_segment_matches_get_source_segment(self) -> None:
+        source = (
+            "def test_unicode():\n    assert 'é' == 'é'\n\f\n"
+            "class TestGroup:\n    def test_one_line(self): assert 'ü'\n"
+            "    async def test_last(self):\n        pass"
+        )
+        tree = ast.parse(source)
+        functions, methods = _index_functions(tree)
+        parsed = _ParsedFile(0, 0, tree, source, functions, methods)
+
+        for node in [*functions.values(), *methods.values()]:
+            assert parsed.segment(node) == ast.get_source_segment(source, node)
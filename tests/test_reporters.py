@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import json
+from dataclasses import asdict
 from pathlib import Path
 
 import pytest
 
 from pytest_review.analyzers.base import AnalyzerResult, Issue, Severity
-from pytest_review.reporters.html import HtmlReporter
+from pytest_review.reporters import json as json_reporter
+from pytest_review.reporters.html import HTML_TEMPLATE, HtmlReporter, _render_template
 from pytest_review.reporters.json import JsonReporter
 
 
@@ -38,6 +40,36 @@ class TestJsonReporter:
         assert parsed["grade"] == "B"
         assert parsed["tests_analyzed"] == 5
 
+    def test_to_dict_matches_asdict(self) -> None:
+        reporter = JsonReporter()
+        results = [
+            AnalyzerResult(
+                analyzer_name="assertions",
+                issues=[Issue("r1", "msg1", Severity.ERROR, Path("test_a.py"), 3, "test_a")],
+                metadata={"assertion_count": 0},
+            )
+        ]
+
+        report = reporter.generate_report(results, total_tests=1, score=90.0)
+
+        assert report.to_dict() == asdict(report)
+
+    def test_json_bytes_match_stdlib_encoding(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        reporter = JsonReporter()
+        results = [
+            AnalyzerResult(
+                analyzer_name="naming",
+                issues=[Issue("r1", "Ünïcode msg", Severity.INFO, Path("test_a.py"), 3, "test_a")],
+            )
+        ]
+        report = reporter.generate_report(results, total_tests=1, score=97.5)
+
+        encoded = report.to_json_bytes()
+        monkeypatch.setattr(json_reporter, "_HAVE_ORJSON", False)
+
+        assert json.loads(encoded) == json.loads(report.to_json_bytes())
+        assert json.loads(report.to_json()) == json.loads(encoded)
+
     def test_counts_issues_by_severity(self) -> None:
         reporter = JsonReporter()
         results = [
@@ -109,6 +141,31 @@ class TestJsonReporter:
         content = json.loads(output_file.read_text())
         assert content["score"] == 100.0
 
+    def test_write_to_file_replaces_atomically(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        reporter = JsonReporter()
+        reporter.generate_report([], total_tests=0, score=100.0)
+        output_file = tmp_path / "report.json"
+        output_file.write_text("previous")
+
+        def fail_replace(src: object, dst: object) -> None:
+            raise OSError("replace failed")
+
+        monkeypatch.setattr(json_reporter.os, "replace", fail_replace)
+        with pytest.raises(OSError):
+            reporter.write_to_file(output_file)
+        monkeypatch.undo()
+
+        # A failed write leaves the previous report and no temporary file
+        assert output_file.read_text() == "previous"
+        assert list(tmp_path.iterdir()) == [output_file]
+
+        reporter.write_to_file(output_file)
+
+        assert json.loads(output_file.read_text())["score"] == 100.0
+        assert list(tmp_path.iterdir()) == [output_file]
+
     def test_summary_includes_passed_status(self) -> None:
         reporter = JsonReporter()
 
@@ -203,6 +260,29 @@ class TestHtmlReporter:
         content = output_file.read_text()
         assert "<!DOCTYPE html>" in content
 
+    def test_generate_to_file_matches_report(self, tmp_path: Path) -> None:
+        result = AnalyzerResult(analyzer_name="test")
+        result.add_issue(
+            Issue(
+                rule="test.rule",
+                message="Test <message>",
+                severity=Severity.WARNING,
+                file_path=Path("test.py"),
+                line=3,
+                suggestion="Fix it",
+            )
+        )
+        reporter = HtmlReporter()
+        output_file = tmp_path / "reports" / "report.html"
+
+        reporter.generate_to_file(output_file, [result], total_tests=1, score=80.0)
+        html = reporter.generate_report([result], total_tests=1, score=80.0)
+
+        def without_timestamp(text: str) -> str:
+            return "\n".join(line for line in text.splitlines() if "Generated:" not in line)
+
+        assert without_timestamp(output_file.read_text()) == without_timestamp(html)
+
     def test_grade_colors(self) -> None:
         reporter = HtmlReporter()
 
@@ -211,6 +291,23 @@ class TestHtmlReporter:
             html = reporter.generate_report([], total_tests=1, score=score)
             assert f"score-{grade}" in html
 
+    def test_template_rendering_matches_format(self) -> None:
+        fields = {
+            "timestamp": "2024-01-01 00:00:00 UTC",
+            "score": 87.25,
+            "grade": "B",
+            "grade_lower": "b",
+            "tests_analyzed": 3,
+            "total_issues": 2,
+            "error_count": 1,
+            "warning_count": 1,
+            "info_count": 0,
+            "issues_html": "<ul></ul>",
+            "rules_html": "",
+        }
+
+        assert _render_template(**fields) == HTML_TEMPLATE.format(**fields)
+
 
 class TestReporterIntegration:
     """Integration tests using pytester."""
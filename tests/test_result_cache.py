@@ -0,0 +1,155 @@
+"""Tests for the on-disk result cache."""
+
+from __future__ import annotations
+
+import ast
+import os
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from pytest_review.analyzers import NamingAnalyzer, SmellsAnalyzer
+from pytest_review.analyzers.base import TestItemInfo
+from pytest_review.config import ReviewConfig
+from pytest_review.result_cache import ResultCache
+
+SOURCE = """
+def test_x():
+    assert x == 1
+    assert x == 1
+"""
+
+
+def make_test_info(source: str, path: Path = Path("/test_mod.py")) -> TestItemInfo:
+    """Create a TestItemInfo for the first function in a module."""
+    node = ast.parse(source).body[0]
+    assert isinstance(node, ast.FunctionDef)
+    return TestItemInfo(
+        name=node.name,
+        file_path=path,
+        line=node.lineno,
+        node=node,
+        source=ast.get_source_segment(source, node) or "",
+    )
+
+
+def analyzers(config: ReviewConfig | None = None) -> list[NamingAnalyzer | SmellsAnalyzer]:
+    config = config or ReviewConfig()
+    return [NamingAnalyzer(config), SmellsAnalyzer(config)]
+
+
+def rules(results: list) -> list[str]:
+    return [issue.rule for result in results for issue in result.issues]
+
+
+class TestResultCache:
+    def test_miss_then_hit(self, tmp_path: Path) -> None:
+        cache = ResultCache(analyzers(), tmp_path)
+        first = cache.analyze(make_test_info(SOURCE), SOURCE)
+        cache.save()
+
+        cache = ResultCache(analyzers(), tmp_path)
+        second = cache.analyze(make_test_info(SOURCE), SOURCE)
+
+        assert cache.stats() == {"hits": 1, "misses": 0}
+        assert rules(second) == rules(first)
+        assert "smells.duplicate_assert" in rules(second)
+
+    def test_changed_source_is_a_miss(self, tmp_path: Path) -> None:
+        cache = ResultCache(analyzers(), tmp_path)
+        cache.analyze(make_test_info(SOURCE), SOURCE)
+        cache.save()
+
+        changed = SOURCE.replace("assert x == 1\n", "assert x == 2\n", 1)
+        cache = ResultCache(analyzers(), tmp_path)
+        results = cache.analyze(make_test_info(changed), changed)
+
+        assert cache.misses == 1
+        assert "smells.duplicate_assert" not in rules(results)
+
+    def test_changed_settings_are_a_miss(self, tmp_path: Path) -> None:
+        cache = ResultCache(analyzers(), tmp_path)
+        cache.analyze(make_test_info(SOURCE), SOURCE)
+        cache.save()
+
+        config = ReviewConfig.from_dict({"ignore": {"rules": ["smells.duplicate_assert"]}})
+        cache = ResultCache(analyzers(config), tmp_path)
+        results = cache.analyze(make_test_info(SOURCE), SOURCE)
+
+        assert cache.misses == 1
+        assert "smells.duplicate_assert" not in rules(results)
+
+    def test_corrupt_entry_is_reanalyzed(self, tmp_path: Path) -> None:
+        cache = ResultCache(analyzers(), tmp_path)
+        cache.analyze(make_test_info(SOURCE), SOURCE)
+        cache.save()
+
+        for entry in tmp_path.iterdir():
+            entry.write_bytes(b"not a pickle")
+
+        cache = ResultCache(analyzers(), tmp_path)
+        results = cache.analyze(make_test_info(SOURCE), SOURCE)
+        assert cache.misses == 1
+        assert "smells.duplicate_assert" in rules(results)
+
+    def test_analyzer_code_is_part_of_key(self, tmp_path: Path) -> None:
+        cache = ResultCache(analyzers(), tmp_path)
+        cache.analyze(make_test_info(SOURCE), SOURCE)
+        cache.save()
+
+        with mock.patch("pytest_review.result_cache._code_version", return_value="edited"):
+            cache = ResultCache(analyzers(), tmp_path)
+        cache.analyze(make_test_info(SOURCE), SOURCE)
+        assert cache.misses == 1
+
+    def test_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        for index in range(3):
+            cache = ResultCache(analyzers(), tmp_path, max_entries=2)
+            cache.analyze(make_test_info(SOURCE, Path(f"/test_{index}.py")), SOURCE)
+            cache.save()
+            # Entries written within one timestamp tick would tie
+            for age, entry in enumerate(sorted(tmp_path.iterdir(), key=os.path.getmtime)):
+                os.utime(entry, ns=(age * 10**9, age * 10**9))
+
+        assert len(list(tmp_path.glob("*.pkl"))) == 2
+        cache = ResultCache(analyzers(), tmp_path)
+        cache.analyze(make_test_info(SOURCE, Path("/test_0.py")), SOURCE)
+        assert cache.misses == 1
+
+
+class TestResultCacheIntegration:
+    """Integration tests using pytester."""
+
+    def test_cache_stats_option(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyprojecttoml("""
+            [tool.pytest-review]
+            cache_dir = ".review-cache"
+        """)
+        pytester.makepyfile("""
+            def test_value_is_cached_between_runs():
+                assert 1 + 1 == 2
+        """)
+        result = pytester.runpytest("--review", "--review-cache-stats")
+        assert "result cache 0 hits, 1 misses" in result.stdout.str()
+
+        result = pytester.runpytest("--review", "--review-cache-stats")
+        assert "result cache 1 hits, 0 misses" in result.stdout.str()
+
+    def test_disabled_by_default(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyfile("def test_value_is_not_cached():\n    assert 1 + 1 == 2\n")
+        result = pytester.runpytest("--review", "--review-cache-stats")
+        assert "caches disabled" in result.stdout.str()
+        assert "result cache" not in result.stdout.str()
+        assert not list(pytester.path.rglob("*.pkl"))
+
+    def test_cache_dir_is_relative_to_rootdir(self, pytester: pytest.Pytester) -> None:
+        pytester.makepyprojecttoml("""
+            [tool.pytest-review]
+            cache_dir = ".review-cache"
+        """)
+        project = pytester.mkdir("project")
+        project.joinpath("test_mod.py").write_text("def test_value_is_cached():\n    assert True\n")
+        pytester.runpytest("--review", "--rootdir", str(project), str(project))
+        assert list(project.joinpath(".review-cache", "results").glob("*.pkl"))
+        assert not pytester.path.joinpath(".review-cache", "results").exists()
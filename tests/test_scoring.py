@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from pytest_review.analyzers.base import AnalyzerResult, Issue, Severity
-from pytest_review.scoring import CategoryScore, ScoreBreakdown, ScoringEngine
+from pytest_review.scoring import CategoryScore, ScoreBreakdown, ScoringEngine, score_to_grade
 
 
 class TestScoreBreakdown:
@@ -160,6 +160,12 @@ class TestScoringEngine:
         assert engine._score_to_grade(59) == "F"
         assert engine._score_to_grade(0) == "F"
 
+    def test_score_to_grade_fractional_scores(self) -> None:
+        assert score_to_grade(89.99) == "B"
+        assert score_to_grade(90.0) == "A"
+        assert score_to_grade(59.5) == "F"
+        assert score_to_grade(-1.0) == "F"
+
     def test_score_never_goes_below_zero(self) -> None:
         engine = ScoringEngine()
 
@@ -103,6 +103,20 @@ def test_example():
         rules = [issue.rule for issue in result.issues]
         assert "smells.duplicate_assert" not in rules
 
+    def test_no_duplicate_for_colliding_hashes(self) -> None:
+        """Assertions whose keys hash alike are still told apart."""
+        source = f"""
+def test_example():
+    assert f() == 0, "a"
+    assert f() == {2**61 - 1}, "b"
+"""
+        analyzer = SmellsAnalyzer(ReviewConfig())
+        test_info = make_test_info(source)
+        result = analyzer.analyze(test_info)
+
+        rules = [issue.rule for issue in result.issues]
+        assert "smells.duplicate_assert" not in rules
+
     def test_detects_magic_numbers(self) -> None:
         """Magic numbers in assertions are a smell."""
         source = """
@@ -116,6 +130,19 @@ def test_example():
         rules = [issue.rule for issue in result.issues]
         assert "smells.magic_number" in rules
 
+    def test_reports_shallowest_magic_number_once(self) -> None:
+        """Only the first magic number, in breadth-first order, is reported."""
+        source = """
+def test_example():
+    assert compute(37, [f"{x + 9}"]) == 42
+"""
+        analyzer = SmellsAnalyzer(ReviewConfig())
+        test_info = make_test_info(source)
+        result = analyzer.analyze(test_info)
+
+        messages = [issue.message for issue in result.issues if issue.rule == "smells.magic_number"]
+        assert messages == ["Magic number 42 in assertion"]
+
     def test_allows_common_numbers(self) -> None:
         """Common numbers like 0, 1, 2 are allowed."""
         source = """
@@ -131,6 +158,20 @@ def test_example():
         rules = [issue.rule for issue in result.issues]
         assert "smells.magic_number" not in rules
 
+    def test_ignores_booleans_and_strings(self) -> None:
+        """Only int and float constants can be magic numbers."""
+        source = """
+def test_example():
+    assert flag is True
+    assert name == "forty-two"
+"""
+        analyzer = SmellsAnalyzer(ReviewConfig())
+        test_info = make_test_info(source)
+        result = analyzer.analyze(test_info)
+
+        rules = [issue.rule for issue in result.issues]
+        assert "smells.magic_number" not in rules
+
     def test_detects_skip_decorator(self) -> None:
         """Skipped tests are flagged."""
         source = """
@@ -181,6 +222,44 @@ def test_example():
         rules = [issue.rule for issue in result.issues]
         assert "smells.eager_test" in rules
 
+    def test_eager_counts_calls_inside_assertions(self) -> None:
+        """Calls made in assertions count as tested targets."""
+        source = """
+def test_example():
+    assert foo() == 1 and obj.bar() == 2
+    assert baz(qux()) == 3
+"""
+        analyzer = SmellsAnalyzer(ReviewConfig())
+        test_info = make_test_info(source)
+        result = analyzer.analyze(test_info)
+
+        eager = [issue for issue in result.issues if issue.rule == "smells.eager_test"]
+        assert [issue.message for issue in eager] == [
+            "Test calls 4 distinct methods: bar, baz, foo, qux"
+        ]
+
+    def test_eager_message_lists_first_five_targets(self) -> None:
+        """Only the first five targets, alphabetically, are named."""
+        source = """
+def test_example():
+    zeta()
+    eta()
+    alpha()
+    theta()
+    gamma()
+    beta()
+    delta()
+    assert epsilon()
+"""
+        analyzer = SmellsAnalyzer(ReviewConfig())
+        test_info = make_test_info(source)
+        result = analyzer.analyze(test_info)
+
+        eager = [issue for issue in result.issues if issue.rule == "smells.eager_test"]
+        assert [issue.message for issue in eager] == [
+            "Test calls 8 distinct methods: alpha, beta, delta, epsilon, eta..."
+        ]
+
     def test_no_eager_for_single_method(self) -> None:
         """Tests focusing on one method are fine."""
         source = """
@@ -197,6 +276,24 @@ def test_example():
         rules = [issue.rule for issue in result.issues]
         assert "smells.eager_test" not in rules
 
+    def test_nested_helper_reports_once(self) -> None:
+        """Whole-test checks run once, not once per nested function."""
+        source = """
+def test_example():
+    def helper():
+        assert x == 1
+
+    assert x == 1
+    assert y
+"""
+        analyzer = SmellsAnalyzer(ReviewConfig())
+        test_info = make_test_info(source)
+        result = analyzer.analyze(test_info)
+
+        rules = [issue.rule for issue in result.issues]
+        assert rules.count("smells.assertion_roulette") == 1
+        assert rules.count("smells.duplicate_assert") == 1
+
     def test_stores_metadata(self) -> None:
         """Analyzer stores metadata in result."""
         source = """